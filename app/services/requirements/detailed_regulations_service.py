@@ -15,6 +15,7 @@ from datetime import datetime
 from pathlib import Path
 
 from .tavily_search import TavilySearchService
+from .url_utils import is_official_url
 
 
 class DetailedRegulationsService:
@@ -391,8 +392,8 @@ class DetailedRegulationsService:
             content = result.get("content", "")
             score = result.get("score", 0)
             
-            # 공식 사이트 vs 기타 사이트 구분
-            is_official = any(domain in url for domain in [".gov", ".fda.gov", ".usda.gov", ".epa.gov", ".fcc.gov", ".cbp.gov", ".cpsc.gov"])
+            # 공식 사이트 vs 기타 사이트 구분 (호스트명 기준)
+            is_official = is_official_url(url)
             
             processed_result = {
                 "title": title,
@@ -69,6 +69,9 @@ class EnvManager:
             'DEFAULT_TIMEOUT': int(os.getenv('DEFAULT_TIMEOUT', '30')),
             'MAX_RETRIES': int(os.getenv('MAX_RETRIES', '3')),
             'CACHE_TTL': int(os.getenv('CACHE_TTL', '3600')),
+            'SEARCH_CONCURRENCY': int(os.getenv('SEARCH_CONCURRENCY', '8')),
+            # 로컬 데이터 파일(참고 링크 저장소 등) 위치 - 기본값은 ai-engine/data (실행 위치와 무관)
+            'DATA_DIR': os.getenv('DATA_DIR', str(Path(__file__).resolve().parents[3] / "data")),
             'DEBUG_MODE': os.getenv('DEBUG_MODE', 'false').lower() == 'true',
             'LOG_LEVEL': os.getenv('LOG_LEVEL', 'INFO'),
             'BACKEND_API_URL': os.getenv('BACKEND_API_URL', 'http://localhost:8081'),
@@ -1,6 +1,110 @@
 import os
+import time
 import asyncio
-from typing import List, Dict
+import httpx
+import requests
+from collections import deque
+from typing import List, Dict, Mapping, Optional
+
+# Tavily 제한 응답 (429: rate limit, 432: 플랜 사용량 초과)
+THROTTLE_STATUS_CODES = (429, 432)
+
+
+def is_throttle_error(exc: BaseException) -> bool:
+    """429/432 응답 예외 여부 (httpx 및 Tavily SDK가 쓰는 requests 예외)"""
+    if isinstance(exc, (httpx.HTTPStatusError, requests.HTTPError)) and exc.response is not None:
+        return exc.response.status_code in THROTTLE_STATUS_CODES
+    return False
+
+
+class AdaptiveRateLimiter:
+    """Tavily 요청 제한기: 분당 요청 수(슬라이딩 윈도우) + AIMD 동시 요청 수 조절
+
+    - 성공 시 동시 요청 상한을 alpha만큼 증가, 429/432/타임아웃 시 beta배로 감소
+    - Retry-After / x-ratelimit-remaining 헤더가 오면 해당 시간 동안 새 요청 보류
+    """
+
+    def __init__(self, rpm: int = 100, max_concurrency: int = 8, alpha: float = 0.5, beta: float = 0.5):
+        self.rpm = rpm
+        self.max_concurrency = max_concurrency
+        self.alpha = alpha
+        self.beta = beta
+        self.concurrency = float(max_concurrency)
+        self._in_flight = 0
+        self._sent: deque = deque()
+        self._paused_until = 0.0
+        self._cond: Optional[asyncio.Condition] = None
+        self._cond_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _condition(self) -> asyncio.Condition:
+        """현재 이벤트 루프용 Condition 반환 (모듈 전역 인스턴스라 루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._cond is None or self._cond_loop is not loop:
+            self._cond = asyncio.Condition()
+            self._cond_loop = loop
+        return self._cond
+
+    async def __aenter__(self):
+        cond = self._condition()
+        async with cond:
+            while True:
+                now = time.monotonic()
+                # 최근 60초 밖의 요청 기록 제거
+                while self._sent and now - self._sent[0] >= 60.0:
+                    self._sent.popleft()
+                if self._in_flight < int(self.concurrency) and now >= self._paused_until:
+                    if len(self._sent) < self.rpm:
+                        break
+                    wait = 60.0 - (now - self._sent[0])
+                else:
+                    wait = max(self._paused_until - now, 0.0) or None
+                try:
+                    # 슬롯 반환(notify) 또는 대기 시간 경과 시 재확인
+                    await asyncio.wait_for(cond.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+            self._in_flight += 1
+            self._sent.append(now)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        cond = self._condition()
+        async with cond:
+            self._in_flight -= 1
+            if exc is None:
+                self.concurrency = min(self.max_concurrency, self.concurrency + self.alpha)
+            elif self._is_throttled(exc):
+                self.concurrency = max(1.0, self.concurrency * self.beta)
+                response = getattr(exc, "response", None)
+                self._pause_from_headers(response.headers if response is not None else None)
+            cond.notify_all()
+        return False
+
+    @staticmethod
+    def _is_throttled(exc: BaseException) -> bool:
+        if isinstance(exc, (httpx.TimeoutException, requests.Timeout)):
+            return True
+        return is_throttle_error(exc)
+
+    def _pause_from_headers(self, headers: Optional[Mapping[str, str]]) -> None:
+        if not headers:
+            return
+        retry_after = headers.get("retry-after")
+        if retry_after is None and headers.get("x-ratelimit-remaining") == "0":
+            retry_after = headers.get("x-ratelimit-reset", "1")
+        try:
+            delay = float(retry_after) if retry_after is not None else 0.0
+        except ValueError:
+            return
+        if delay > 0:
+            self._paused_until = max(self._paused_until, time.monotonic() + min(delay, 60.0))
+
+
+# API 키 단위 제한이므로 모든 TavilySearchService 인스턴스가 공유
+rate_limiter = AdaptiveRateLimiter(
+    rpm=int(os.getenv("TAVILY_RPM", "100")),
+    max_concurrency=int(os.getenv("SEARCH_CONCURRENCY", "8")),
+)
 
 # Tavily 패키지 import 시도 (tavily 우선)
 try:
@@ -62,7 +166,8 @@ class TavilySearchService:
                 return None
         return self.client
 
-    async def search(self, query: str, max_results: int = 5) -> List[Dict]:
+    async def search(self, query: str, max_results: int = 5, raise_errors: bool = False) -> List[Dict]:
+        """Tavily 검색 (raise_errors=True면 최종 실패 시 빈 결과 대신 예외 전파)"""
         if not self.is_enabled():
             print(f"  🔄 TavilySearch 비활성화, 빈 결과 반환")
             return []
@@ -86,24 +191,30 @@ class TavilySearchService:
                     # tavily-python 방식
                     print(f"  🔧 tavily_python 방식 사용")
                     if hasattr(client, 'search'):
-                        response = client.search(
-                            query=query,
-                            max_results=max_results,
-                            include_answer=False,
-                            search_depth="advanced"
-                        )
+                        async with rate_limiter:
+                            response = await asyncio.to_thread(
+                                client.search,
+                                query=query,
+                                max_results=max_results,
+                                include_answer=False,
+                                search_depth="advanced"
+                            )
                         results = response.get("results", [])
                     else:
-                        results = client.run(query)
+                        async with rate_limiter:
+                            results = await asyncio.to_thread(client.run, query)
                 elif TAVILY_TYPE == "tavily":
                     # tavily 방식
                     print(f"  🔧 tavily 방식 사용")
-                    response = client.search(
-                        query=query,
-                        max_results=max_results,
-                        include_answer=False,
-                        search_depth="advanced"
-                    )
+                    # 동기 SDK 호출은 스레드로 넘겨 이벤트 루프 블로킹 방지
+                    async with rate_limiter:
+                        response = await asyncio.to_thread(
+                            client.search,
+                            query=query,
+                            max_results=max_results,
+                            include_answer=False,
+                            search_depth="advanced"
+                        )
                     results = response.get("results", [])
                 else:
                     print(f"  ❌ 알 수 없는 Tavily 타입: {TAVILY_TYPE}")
@@ -126,16 +237,20 @@ class TavilySearchService:
                 
             except Exception as e:
                 retry_count += 1
-                if "432" in str(e) or "429" in str(e):
+                if is_throttle_error(e):
                     print(f"  ⚠️ Tavily API 제한 ({e}), {retry_count}번째 재시도...")
                     if retry_count <= max_retries:
                         await asyncio.sleep(2 ** retry_count)  # 지수 백오프
                         continue
                     else:
                         print(f"  ❌ Tavily 검색 최종 실패: {e}")
+                        if raise_errors:
+                            raise
                         return []
                 else:
                     print(f"  ❌ Tavily 검색 실패: {e}")
+                    if raise_errors:
+                        raise
                     return []
 
 
@@ -0,0 +1,23 @@
+"""
+URL 판별 유틸리티
+- 호스트명 추출 (잘못된 URL은 빈 문자열)
+- 공식 사이트(.gov 호스트) 판별
+"""
+
+from urllib.parse import urlsplit
+
+# 공식 사이트 판별용 호스트 접미사 (fda.gov 등 기관 도메인은 모두 .gov 하위)
+OFFICIAL_HOST_SUFFIXES = (".gov",)
+
+
+def url_host(url: str) -> str:
+    """URL 호스트명 추출 (잘못된 URL은 빈 문자열)"""
+    try:
+        return urlsplit(url).hostname or ""
+    except ValueError:
+        return ""
+
+
+def is_official_url(url: str) -> bool:
+    """공식 사이트 여부 (경로/쿼리의 '.gov' 오탐 방지를 위해 호스트명 접미사로 판별)"""
+    return url_host(url).endswith(OFFICIAL_HOST_SUFFIXES)
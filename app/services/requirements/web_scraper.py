@@ -9,8 +9,10 @@ from datetime import datetime
 class WebScraper:
     """실제 웹 스크래핑을 수행하는 서비스"""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.timeout = 120.0  # 2분으로 증가  # 타임아웃 증가
+        # 외부에서 주입된 공유 클라이언트 (커넥션 풀 재사용, 없으면 요청마다 생성)
+        self.client = client
         
         # HS코드별 키워드 매핑 (확장)
         self.hs_keywords = {
@@ -45,6 +47,13 @@ class WebScraper:
             'Upgrade-Insecure-Requests': '1',
         }
     
+    async def _fetch(self, url: str, follow_redirects: bool = False) -> httpx.Response:
+        """공유 클라이언트가 있으면 재사용하고, 없으면 1회용 클라이언트로 GET 요청"""
+        if self.client is not None:
+            return await self.client.get(url, headers=self.headers, timeout=self.timeout, follow_redirects=follow_redirects)
+        async with httpx.AsyncClient(timeout=self.timeout, headers=self.headers, follow_redirects=follow_redirects) as client:
+            return await client.get(url)
+    
     async def scrape_fda_requirements(self, hs_code: str, url_override: Optional[str] = None) -> Dict:
         """FDA 웹사이트에서 실제 요구사항 스크래핑"""
         print(f"🔍 FDA 스크래핑 시작 - HS코드: {hs_code}")
@@ -65,67 +74,66 @@ class WebScraper:
         for i, url in enumerate(urls_to_try, 1):
             print(f"  📡 FDA URL 시도 {i}/{len(urls_to_try)}: {url}")
             try:
-                async with httpx.AsyncClient(timeout=self.timeout, headers=self.headers, follow_redirects=True) as client:
-                    response = await client.get(url)
+                response = await self._fetch(url, follow_redirects=True)
+                
+                print(f"  📊 FDA 응답 상태: {response.status_code}")
+                print(f"  📊 FDA 최종 URL: {response.url}")
+                print(f"  📊 FDA 콘텐츠 길이: {len(response.text)}")
+                
+                if response.status_code == 200:
+                    soup = BeautifulSoup(response.text, 'html.parser')
+                    title = soup.find('title')
+                    print(f"  📄 FDA 페이지 제목: {title.text if title else 'No title'}")
                     
-                    print(f"  📊 FDA 응답 상태: {response.status_code}")
-                    print(f"  📊 FDA 최종 URL: {response.url}")
-                    print(f"  📊 FDA 콘텐츠 길이: {len(response.text)}")
+                    # FDA 요구사항 정보 추출 (HS코드 기반)
+                    requirements = self._extract_fda_requirements(soup, hs_code, keywords)
+                    print(f"  ✅ FDA 스크래핑 성공: 인증 {len(requirements.get('certifications', []))}개, 서류 {len(requirements.get('documents', []))}개")
                     
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        title = soup.find('title')
-                        print(f"  📄 FDA 페이지 제목: {title.text if title else 'No title'}")
-                        
-                        # FDA 요구사항 정보 추출 (HS코드 기반)
-                        requirements = self._extract_fda_requirements(soup, hs_code, keywords)
-                        print(f"  ✅ FDA 스크래핑 성공: 인증 {len(requirements.get('certifications', []))}개, 서류 {len(requirements.get('documents', []))}개")
-                        
-                        # 원문 콘텐츠 추출
-                        page_content = soup.get_text()[:2000]  # 처음 2000자만
-                        main_content = soup.find('main') or soup.find('article') or soup.find('div', class_='content')
-                        if main_content:
-                            main_text = main_content.get_text()[:1500]  # 메인 콘텐츠 1500자
-                        else:
-                            main_text = page_content[:1500]
-                        
-                        return {
-                            "agency": "FDA",
-                            "certifications": requirements.get("certifications", []),
-                            "documents": requirements.get("documents", []),
-                            "sources": [
-                                {
-                                    "title": title.text if title else "FDA Food Import Guide",
-                                    "url": str(response.url),
-                                    "type": "공식 가이드",
-                                    "relevance": "high",
-                                    "raw_content": {
-                                        "page_title": title.text if title else "No title",
-                                        "main_content": main_text,
-                                        "full_content_preview": page_content,
-                                        "content_length": len(response.text),
-                                        "scraped_at": datetime.now().isoformat()
-                                    }
-                                }
-                            ],
-                            "hs_code_matched": True,
-                            "hs_code_used": hs_code,
-                            "keywords_used": keywords,
-                            "raw_page_data": {
+                    # 원문 콘텐츠 추출
+                    page_content = soup.get_text()[:2000]  # 처음 2000자만
+                    main_content = soup.find('main') or soup.find('article') or soup.find('div', class_='content')
+                    if main_content:
+                        main_text = main_content.get_text()[:1500]  # 메인 콘텐츠 1500자
+                    else:
+                        main_text = page_content[:1500]
+                    
+                    return {
+                        "agency": "FDA",
+                        "certifications": requirements.get("certifications", []),
+                        "documents": requirements.get("documents", []),
+                        "sources": [
+                            {
+                                "title": title.text if title else "FDA Food Import Guide",
                                 "url": str(response.url),
-                                "status_code": response.status_code,
-                                "content_length": len(response.text),
-                                "title": title.text if title else "No title",
-                                "main_content": main_text
+                                "type": "공식 가이드",
+                                "relevance": "high",
+                                "raw_content": {
+                                    "page_title": title.text if title else "No title",
+                                    "main_content": main_text,
+                                    "full_content_preview": page_content,
+                                    "content_length": len(response.text),
+                                    "scraped_at": datetime.now().isoformat()
+                                }
                             }
+                        ],
+                        "hs_code_matched": True,
+                        "hs_code_used": hs_code,
+                        "keywords_used": keywords,
+                        "raw_page_data": {
+                            "url": str(response.url),
+                            "status_code": response.status_code,
+                            "content_length": len(response.text),
+                            "title": title.text if title else "No title",
+                            "main_content": main_text
                         }
+                    }
+                else:
+                    print(f"  ❌ FDA 응답 실패: {response.status_code}")
+                    if i < len(urls_to_try):
+                        print(f"  🔄 다음 URL로 재시도...")
+                        continue
                     else:
-                        print(f"  ❌ FDA 응답 실패: {response.status_code}")
-                        if i < len(urls_to_try):
-                            print(f"  🔄 다음 URL로 재시도...")
-                            continue
-                        else:
-                            raise Exception(f"HTTP {response.status_code}")
+                        raise Exception(f"HTTP {response.status_code}")
             except Exception as e:
                 print(f"  ❌ FDA URL {i} 실패: {e}")
                 if i < len(urls_to_try):
@@ -156,42 +164,41 @@ class WebScraper:
         for i, url in enumerate(urls_to_try, 1):
             print(f"  📡 FCC URL 시도 {i}/{len(urls_to_try)}: {url}")
             try:
-                async with httpx.AsyncClient(timeout=self.timeout, headers=self.headers, follow_redirects=True) as client:
-                    response = await client.get(url)
+                response = await self._fetch(url, follow_redirects=True)
+                
+                print(f"  📊 FCC 응답 상태: {response.status_code}")
+                print(f"  📊 FCC 최종 URL: {response.url}")
+                print(f"  📊 FCC 콘텐츠 길이: {len(response.text)}")
+                
+                if response.status_code == 200:
+                    soup = BeautifulSoup(response.text, 'html.parser')
+                    title = soup.find('title')
+                    print(f"  📄 FCC 페이지 제목: {title.text if title else 'No title'}")
                     
-                    print(f"  📊 FCC 응답 상태: {response.status_code}")
-                    print(f"  📊 FCC 최종 URL: {response.url}")
-                    print(f"  📊 FCC 콘텐츠 길이: {len(response.text)}")
+                    # FCC 요구사항 정보 추출
+                    requirements = self._extract_fcc_requirements(soup, hs_code)
+                    print(f"  ✅ FCC 스크래핑 성공: 인증 {len(requirements.get('certifications', []))}개, 서류 {len(requirements.get('documents', []))}개")
                     
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        title = soup.find('title')
-                        print(f"  📄 FCC 페이지 제목: {title.text if title else 'No title'}")
-                        
-                        # FCC 요구사항 정보 추출
-                        requirements = self._extract_fcc_requirements(soup, hs_code)
-                        print(f"  ✅ FCC 스크래핑 성공: 인증 {len(requirements.get('certifications', []))}개, 서류 {len(requirements.get('documents', []))}개")
-                        
-                        return {
-                            "agency": "FCC",
-                            "certifications": requirements.get("certifications", []),
-                            "documents": requirements.get("documents", []),
-                            "sources": [
-                                {
-                                    "title": title.text if title else "FCC Device Authorization Guide",
-                                    "url": str(response.url),
-                                    "type": "공식 가이드",
-                                    "relevance": "high"
-                                }
-                            ]
-                        }
+                    return {
+                        "agency": "FCC",
+                        "certifications": requirements.get("certifications", []),
+                        "documents": requirements.get("documents", []),
+                        "sources": [
+                            {
+                                "title": title.text if title else "FCC Device Authorization Guide",
+                                "url": str(response.url),
+                                "type": "공식 가이드",
+                                "relevance": "high"
+                            }
+                        ]
+                    }
+                else:
+                    print(f"  ❌ FCC 응답 실패: {response.status_code}")
+                    if i < len(urls_to_try):
+                        print(f"  🔄 다음 URL로 재시도...")
+                        continue
                     else:
-                        print(f"  ❌ FCC 응답 실패: {response.status_code}")
-                        if i < len(urls_to_try):
-                            print(f"  🔄 다음 URL로 재시도...")
-                            continue
-                        else:
-                            raise Exception(f"HTTP {response.status_code}")
+                        raise Exception(f"HTTP {response.status_code}")
             except Exception as e:
                 print(f"  ❌ FCC URL {i} 실패: {e}")
                 if i < len(urls_to_try):
@@ -222,42 +229,41 @@ class WebScraper:
         for i, url in enumerate(urls_to_try, 1):
             print(f"  📡 CBP URL 시도 {i}/{len(urls_to_try)}: {url}")
             try:
-                async with httpx.AsyncClient(timeout=self.timeout, headers=self.headers, follow_redirects=True) as client:
-                    response = await client.get(url)
+                response = await self._fetch(url, follow_redirects=True)
+                
+                print(f"  📊 CBP 응답 상태: {response.status_code}")
+                print(f"  📊 CBP 최종 URL: {response.url}")
+                print(f"  📊 CBP 콘텐츠 길이: {len(response.text)}")
+                
+                if response.status_code == 200:
+                    soup = BeautifulSoup(response.text, 'html.parser')
+                    title = soup.find('title')
+                    print(f"  📄 CBP 페이지 제목: {title.text if title else 'No title'}")
                     
-                    print(f"  📊 CBP 응답 상태: {response.status_code}")
-                    print(f"  📊 CBP 최종 URL: {response.url}")
-                    print(f"  📊 CBP 콘텐츠 길이: {len(response.text)}")
+                    # CBP 요구사항 정보 추출
+                    requirements = self._extract_cbp_requirements(soup, hs_code)
+                    print(f"  ✅ CBP 스크래핑 성공: 인증 {len(requirements.get('certifications', []))}개, 서류 {len(requirements.get('documents', []))}개")
                     
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        title = soup.find('title')
-                        print(f"  📄 CBP 페이지 제목: {title.text if title else 'No title'}")
-                        
-                        # CBP 요구사항 정보 추출
-                        requirements = self._extract_cbp_requirements(soup, hs_code)
-                        print(f"  ✅ CBP 스크래핑 성공: 인증 {len(requirements.get('certifications', []))}개, 서류 {len(requirements.get('documents', []))}개")
-                        
-                        return {
-                            "agency": "CBP",
-                            "certifications": requirements.get("certifications", []),
-                            "documents": requirements.get("documents", []),
-                            "sources": [
-                                {
-                                    "title": title.text if title else "CBP Entry Summary Guide",
-                                    "url": str(response.url),
-                                    "type": "공식 가이드",
-                                    "relevance": "high"
-                                }
-                            ]
-                        }
+                    return {
+                        "agency": "CBP",
+                        "certifications": requirements.get("certifications", []),
+                        "documents": requirements.get("documents", []),
+                        "sources": [
+                            {
+                                "title": title.text if title else "CBP Entry Summary Guide",
+                                "url": str(response.url),
+                                "type": "공식 가이드",
+                                "relevance": "high"
+                            }
+                        ]
+                    }
+                else:
+                    print(f"  ❌ CBP 응답 실패: {response.status_code}")
+                    if i < len(urls_to_try):
+                        print(f"  🔄 다음 URL로 재시도...")
+                        continue
                     else:
-                        print(f"  ❌ CBP 응답 실패: {response.status_code}")
-                        if i < len(urls_to_try):
-                            print(f"  🔄 다음 URL로 재시도...")
-                            continue
-                        else:
-                            raise Exception(f"HTTP {response.status_code}")
+                        raise Exception(f"HTTP {response.status_code}")
             except Exception as e:
                 print(f"  ❌ CBP URL {i} 실패: {e}")
                 if i < len(urls_to_try):
@@ -471,26 +477,25 @@ class WebScraper:
         
         for i, url in enumerate(urls_to_try, 1):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout, headers=self.headers) as client:
-                    response = await client.get(url)
+                response = await self._fetch(url)
+                
+                if response.status_code == 200:
+                    soup = BeautifulSoup(response.text, 'html.parser')
                     
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        # USDA 요구사항 추출
-                        requirements = self._extract_usda_requirements(soup, hs_code)
-                        
-                        return {
-                            "agency": "USDA",
-                            "certifications": requirements.get("certifications", []),
-                            "documents": requirements.get("documents", []),
-                            "sources": [{
-                                "title": "USDA Trade Information",
-                                "url": str(response.url),
-                                "type": "공식 가이드",
-                                "relevance": "high"
-                            }]
-                        }
+                    # USDA 요구사항 추출
+                    requirements = self._extract_usda_requirements(soup, hs_code)
+                    
+                    return {
+                        "agency": "USDA",
+                        "certifications": requirements.get("certifications", []),
+                        "documents": requirements.get("documents", []),
+                        "sources": [{
+                            "title": "USDA Trade Information",
+                            "url": str(response.url),
+                            "type": "공식 가이드",
+                            "relevance": "high"
+                        }]
+                    }
             except Exception as e:
                 print(f"  ❌ USDA URL {i} 실패: {e}")
                 continue
@@ -506,25 +511,24 @@ class WebScraper:
         
         for i, url in enumerate(urls_to_try, 1):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout, headers=self.headers) as client:
-                    response = await client.get(url)
+                response = await self._fetch(url)
+                
+                if response.status_code == 200:
+                    soup = BeautifulSoup(response.text, 'html.parser')
                     
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        requirements = self._extract_epa_requirements(soup, hs_code)
-                        
-                        return {
-                            "agency": "EPA",
-                            "certifications": requirements.get("certifications", []),
-                            "documents": requirements.get("documents", []),
-                            "sources": [{
-                                "title": "EPA Import Export Guide",
-                                "url": str(response.url),
-                                "type": "공식 가이드",
-                                "relevance": "high"
-                            }]
-                        }
+                    requirements = self._extract_epa_requirements(soup, hs_code)
+                    
+                    return {
+                        "agency": "EPA",
+                        "certifications": requirements.get("certifications", []),
+                        "documents": requirements.get("documents", []),
+                        "sources": [{
+                            "title": "EPA Import Export Guide",
+                            "url": str(response.url),
+                            "type": "공식 가이드",
+                            "relevance": "high"
+                        }]
+                    }
             except Exception as e:
                 print(f"  ❌ EPA URL {i} 실패: {e}")
                 continue
@@ -539,25 +543,24 @@ class WebScraper:
         
         for i, url in enumerate(urls_to_try, 1):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout, headers=self.headers) as client:
-                    response = await client.get(url)
+                response = await self._fetch(url)
+                
+                if response.status_code == 200:
+                    soup = BeautifulSoup(response.text, 'html.parser')
                     
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        requirements = self._extract_cpsc_requirements(soup, hs_code)
-                        
-                        return {
-                            "agency": "CPSC",
-                            "certifications": requirements.get("certifications", []),
-                            "documents": requirements.get("documents", []),
-                            "sources": [{
-                                "title": "CPSC Business Manufacturing",
-                                "url": str(response.url),
-                                "type": "공식 가이드",
-                                "relevance": "high"
-                            }]
-                        }
+                    requirements = self._extract_cpsc_requirements(soup, hs_code)
+                    
+                    return {
+                        "agency": "CPSC",
+                        "certifications": requirements.get("certifications", []),
+                        "documents": requirements.get("documents", []),
+                        "sources": [{
+                            "title": "CPSC Business Manufacturing",
+                            "url": str(response.url),
+                            "type": "공식 가이드",
+                            "relevance": "high"
+                        }]
+                    }
             except Exception as e:
                 print(f"  ❌ CPSC URL {i} 실패: {e}")
                 continue
@@ -573,25 +576,24 @@ class WebScraper:
         
         for i, url in enumerate(urls_to_try, 1):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout, headers=self.headers) as client:
-                    response = await client.get(url)
+                response = await self._fetch(url)
+                
+                if response.status_code == 200:
+                    soup = BeautifulSoup(response.text, 'html.parser')
                     
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        requirements = self._extract_kcs_requirements(soup, hs_code)
-                        
-                        return {
-                            "agency": "KCS",
-                            "certifications": requirements.get("certifications", []),
-                            "documents": requirements.get("documents", []),
-                            "sources": [{
-                                "title": "한국 관세청 수입요건",
-                                "url": str(response.url),
-                                "type": "공식 가이드",
-                                "relevance": "high"
-                            }]
-                        }
+                    requirements = self._extract_kcs_requirements(soup, hs_code)
+                    
+                    return {
+                        "agency": "KCS",
+                        "certifications": requirements.get("certifications", []),
+                        "documents": requirements.get("documents", []),
+                        "sources": [{
+                            "title": "한국 관세청 수입요건",
+                            "url": str(response.url),
+                            "type": "공식 가이드",
+                            "relevance": "high"
+                        }]
+                    }
             except Exception as e:
                 print(f"  ❌ KCS URL {i} 실패: {e}")
                 continue
@@ -606,25 +608,24 @@ class WebScraper:
         
         for i, url in enumerate(urls_to_try, 1):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout, headers=self.headers) as client:
-                    response = await client.get(url)
+                response = await self._fetch(url)
+                
+                if response.status_code == 200:
+                    soup = BeautifulSoup(response.text, 'html.parser')
                     
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        requirements = self._extract_mfds_requirements(soup, hs_code)
-                        
-                        return {
-                            "agency": "MFDS",
-                            "certifications": requirements.get("certifications", []),
-                            "documents": requirements.get("documents", []),
-                            "sources": [{
-                                "title": "식품의약품안전처 수입요건",
-                                "url": str(response.url),
-                                "type": "공식 가이드",
-                                "relevance": "high"
-                            }]
-                        }
+                    requirements = self._extract_mfds_requirements(soup, hs_code)
+                    
+                    return {
+                        "agency": "MFDS",
+                        "certifications": requirements.get("certifications", []),
+                        "documents": requirements.get("documents", []),
+                        "sources": [{
+                            "title": "식품의약품안전처 수입요건",
+                            "url": str(response.url),
+                            "type": "공식 가이드",
+                            "relevance": "high"
+                        }]
+                    }
             except Exception as e:
                 print(f"  ❌ MFDS URL {i} 실패: {e}")
                 continue
@@ -639,25 +640,24 @@ class WebScraper:
         
         for i, url in enumerate(urls_to_try, 1):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout, headers=self.headers) as client:
-                    response = await client.get(url)
+                response = await self._fetch(url)
+                
+                if response.status_code == 200:
+                    soup = BeautifulSoup(response.text, 'html.parser')
                     
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        requirements = self._extract_motie_requirements(soup, hs_code)
-                        
-                        return {
-                            "agency": "MOTIE",
-                            "certifications": requirements.get("certifications", []),
-                            "documents": requirements.get("documents", []),
-                            "sources": [{
-                                "title": "산업통상자원부 수입요건",
-                                "url": str(response.url),
-                                "type": "공식 가이드",
-                                "relevance": "high"
-                            }]
-                        }
+                    requirements = self._extract_motie_requirements(soup, hs_code)
+                    
+                    return {
+                        "agency": "MOTIE",
+                        "certifications": requirements.get("certifications", []),
+                        "documents": requirements.get("documents", []),
+                        "sources": [{
+                            "title": "산업통상자원부 수입요건",
+                            "url": str(response.url),
+                            "type": "공식 가이드",
+                            "relevance": "high"
+                        }]
+                    }
             except Exception as e:
                 print(f"  ❌ MOTIE URL {i} 실패: {e}")
                 continue
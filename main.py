@@ -37,6 +37,23 @@ if api_key:
 else:
     print(f"❌ TAVILY_API_KEY를 찾을 수 없습니다")
 
+# 로깅 설정 (라이브러리 모듈은 logging.getLogger(__name__)만 사용, 핸들러는 여기서 1회 구성)
+# 출력은 QueueListener 스레드에서 처리 (이벤트 루프가 로그 쓰기로 블로킹되지 않도록)
+import atexit
+import logging
+import logging.handlers
+import queue
+
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+)
+
 from app.routers.product_router import router as product_router
 from app.routers.chat_router import router as chat_router
 from app.routers.requirements_router import router as requirements_router
@@ -91,6 +108,10 @@ async def lifespan(app: FastAPI):
         await monitor_task
     except asyncio.CancelledError:
         print("✅ 모니터링 태스크 종료됨")
+    
+    # 요구사항 분석 도구의 HTTP 커넥션 풀 정리
+    from workflows.unified_workflow import unified_workflow
+    await unified_workflow.aclose()
 
 app = FastAPI(
     title="LawGenie AI Engine",
@@ -0,0 +1,259 @@
+"""웹 검색 서킷 브레이커 상태 전이 테스트"""
+
+import asyncio
+
+import requests
+
+import workflows.tools as tools_module
+from workflows.tools import RequirementsTools, SearchProvider, TavilyProvider, _CircuitBreaker
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _breaker(monkeypatch, threshold=3, cooldown=10.0):
+    clock = _Clock()
+    monkeypatch.setattr(tools_module.time, "monotonic", clock)
+    return _CircuitBreaker(threshold=threshold, cooldown=cooldown), clock
+
+
+def test_opens_after_threshold_failures(monkeypatch):
+    breaker, _ = _breaker(monkeypatch)
+    assert [breaker.record_failure() for _ in range(3)] == [False, False, True]
+    assert not breaker.allow()
+
+
+def test_success_resets_failure_count(monkeypatch):
+    breaker, _ = _breaker(monkeypatch)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    assert not breaker.record_failure()
+    assert breaker.allow()
+
+
+def test_half_open_admits_exactly_one_trial(monkeypatch):
+    breaker, clock = _breaker(monkeypatch)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 10.0
+    assert breaker.admit() == (True, True)
+    # 시험 호출 결과가 나오기 전에는 나머지 호출 차단
+    assert breaker.admit() == (False, False)
+    assert not breaker.allow()
+
+
+def test_non_probe_failure_does_not_end_trial(monkeypatch):
+    breaker, clock = _breaker(monkeypatch)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 10.0
+    assert breaker.admit() == (True, True)
+    # 차단 전에 시작된 일반 호출의 늦은 실패는 시험 호출 상태를 바꾸지 않음
+    assert not breaker.record_failure()
+    assert breaker.probing
+    assert not breaker.allow()
+
+
+def test_failed_trial_reopens_for_full_cooldown(monkeypatch):
+    breaker, clock = _breaker(monkeypatch)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 10.0
+    assert breaker.admit() == (True, True)
+    assert breaker.record_failure(probe=True)
+    clock.now += 9.0
+    assert not breaker.allow()
+    clock.now += 1.0
+    assert breaker.allow()
+
+
+def test_successful_trial_closes(monkeypatch):
+    breaker, clock = _breaker(monkeypatch)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 10.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.allow() and breaker.allow()
+    assert not breaker.probing
+
+
+class _FailingClient:
+    def __init__(self):
+        self.calls = 0
+
+    def search(self, **kwargs):
+        self.calls += 1
+        response = requests.Response()
+        response.status_code = 500
+        raise requests.HTTPError("500 Server Error", response=response)
+
+
+def test_tavily_provider_errors_reach_breaker(monkeypatch):
+    provider = TavilyProvider()
+    client = _FailingClient()
+    provider.service.api_key = "test-key"
+    provider.service.client = client
+    monkeypatch.setattr("app.services.requirements.tavily_search.TAVILY_AVAILABLE", True)
+    monkeypatch.setattr("app.services.requirements.tavily_search.TAVILY_TYPE", "tavily")
+
+    tools = RequirementsTools(search_provider=provider)
+
+    async def run():
+        try:
+            outcomes = [await tools._run_web_query("FDA_8digit", "q%d" % i, 0.9) for i in range(6)]
+        finally:
+            await tools.aclose()
+        return outcomes
+
+    outcomes = asyncio.run(run())
+    # 5회 연속 실패 후 차단 → 6번째는 프로바이더를 호출하지 않음
+    assert client.calls == tools._search_breaker.threshold
+    assert outcomes[-1] == {"error": "circuit open"}
+
+
+class _SlowProvider(SearchProvider):
+    def __init__(self):
+        self.calls = 0
+
+    async def search(self, query, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return [{"url": "https://www.fda.gov/x", "title": query}]
+
+    @property
+    def provider_name(self):
+        return "slow"
+
+
+def test_concurrent_calls_while_half_open_send_one_probe(monkeypatch):
+    provider = _SlowProvider()
+    tools = RequirementsTools(search_provider=provider)
+    breaker = tools._search_breaker
+    breaker.failures = breaker.threshold
+    breaker.opened_at = 0.0
+
+    async def run():
+        try:
+            return await asyncio.gather(*(tools._run_web_query("FDA_8digit", "q%d" % i, 0.9) for i in range(4)))
+        finally:
+            await tools.aclose()
+
+    outcomes = asyncio.run(run())
+    assert provider.calls == 1
+    assert sum(o == {"error": "circuit open"} for o in outcomes) == 3
+    assert breaker.failures == 0 and not breaker.probing
+
+
+class _CountingFailingProvider(SearchProvider):
+    def __init__(self):
+        self.calls = 0
+
+    async def search(self, query, **kwargs):
+        self.calls += 1
+        if query == "cached":
+            return [{"url": "https://www.fda.gov/cached", "title": query}]
+        raise RuntimeError("provider down")
+
+    @property
+    def provider_name(self):
+        return "failing"
+
+
+def test_cache_hits_do_not_reset_failures():
+    provider = _CountingFailingProvider()
+    tools = RequirementsTools(search_provider=provider)
+    breaker = tools._search_breaker
+
+    async def run():
+        try:
+            # 캐시 채우기 (프로바이더 성공 1회)
+            await tools._run_web_query("FDA_8digit", "cached", 0.9)
+            for i in range(4):
+                await tools._run_web_query("FDA_8digit", "fail%d" % i, 0.9)
+            hit = await tools._run_web_query("FDA_8digit", "cached", 0.9)
+            assert hit["result_count"] == 1
+            assert breaker.failures == 4
+            return await tools._run_web_query("FDA_8digit", "fail-last", 0.9)
+        finally:
+            await tools.aclose()
+
+    asyncio.run(run())
+    assert provider.calls == 6
+    assert breaker.failures == breaker.threshold
+    assert not breaker.allow()
+
+
+def test_cached_query_is_not_used_as_half_open_trial():
+    provider = _CountingFailingProvider()
+    tools = RequirementsTools(search_provider=provider)
+    breaker = tools._search_breaker
+
+    async def run():
+        try:
+            await tools._run_web_query("FDA_8digit", "cached", 0.9)
+            breaker.failures = breaker.threshold
+            breaker.opened_at = 0.0
+            hit = await tools._run_web_query("FDA_8digit", "cached", 0.9)
+            assert hit["result_count"] == 1
+            # 캐시 적중은 시험 호출을 소비하지도, 차단을 해제하지도 않음
+            assert breaker.failures == breaker.threshold and not breaker.probing
+            await tools._run_web_query("FDA_8digit", "probe", 0.9)
+        finally:
+            await tools.aclose()
+
+    asyncio.run(run())
+    assert provider.calls == 2
+    assert breaker.failures == breaker.threshold and not breaker.probing
+    assert not breaker.allow()
+
+
+class _HangingProvider(SearchProvider):
+    def __init__(self):
+        self.calls = 0
+
+    async def search(self, query, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(60)
+
+    @property
+    def provider_name(self):
+        return "hanging"
+
+
+def test_cancelling_a_regular_call_keeps_the_trial_exclusive():
+    provider = _HangingProvider()
+    tools = RequirementsTools(search_provider=provider)
+    breaker = tools._search_breaker
+
+    async def run():
+        try:
+            # 차단 전 시작된 일반 호출
+            regular = asyncio.create_task(tools._run_web_query("FDA_8digit", "regular", 0.9))
+            await asyncio.sleep(0)
+            breaker.failures = breaker.threshold
+            breaker.opened_at = 0.0
+            probe = asyncio.create_task(tools._run_web_query("FDA_8digit", "probe", 0.9))
+            await asyncio.sleep(0)
+            assert breaker.probing
+            regular.cancel()
+            await asyncio.gather(regular, return_exceptions=True)
+            # 일반 호출 취소가 시험 호출 상태를 해제하지 않음 → 두 번째 시험 호출 불가
+            assert breaker.probing
+            blocked = await tools._run_web_query("FDA_8digit", "second", 0.9)
+            assert blocked == {"error": "circuit open"}
+            probe.cancel()
+            await asyncio.gather(probe, return_exceptions=True)
+            # 시험 호출 자체가 취소되면 해제
+            assert not breaker.probing
+        finally:
+            await tools.aclose()
+
+    asyncio.run(run())
+    assert provider.calls == 2
@@ -0,0 +1,64 @@
+"""하드코딩 HS 코드 → 기관 매핑 조회 테스트"""
+
+import asyncio
+
+import pytest
+
+from workflows.tools import RequirementsTools, SearchProvider
+
+
+@pytest.fixture(scope="module")
+def tools():
+    return RequirementsTools()
+
+
+@pytest.mark.parametrize("hs_code", ["3304.99", "33.04.99", "330499", "3304.99.5000"])
+def test_dotted_and_plain_codes_resolve_to_heading(tools, hs_code):
+    assert tools._match_hs_prefix(hs_code)[0] == "3304"
+
+
+@pytest.mark.parametrize("hs_code", ["33", "", "9999.00"])
+def test_unmapped_or_short_codes_do_not_match(tools, hs_code):
+    assert tools._match_hs_prefix(hs_code) == ("", {})
+
+
+def test_hardcoded_mapping_confidence(tools):
+    result = asyncio.run(tools._get_target_agencies_for_hs_code("33.04.99"))
+    assert result["source"] == "hardcoded"
+    assert result["confidence"] == 0.9
+
+
+def test_agency_domains_are_set_on_init(tools):
+    assert tools.agency_domains["FDA"] == "fda.gov"
+
+
+class _RecordingProvider(SearchProvider):
+    def __init__(self):
+        self.queries = []
+
+    async def search(self, query, **kwargs):
+        self.queries.append(query)
+        return [{"url": "https://example.com/anything", "title": query}]
+
+    @property
+    def provider_name(self):
+        return "recording"
+
+
+def test_unknown_agency_is_rejected_before_searching():
+    provider = _RecordingProvider()
+    tools = RequirementsTools(search_provider=provider)
+
+    async def run():
+        try:
+            return await tools.search_agency_documents("XYZ", "serum import")
+        finally:
+            await tools.aclose()
+
+    result = asyncio.run(run())
+    assert result["error"] == "unknown agency XYZ"
+    assert result["agency_results"] == [] and result["selected_url"] is None
+    # 빈 도메인이 모든 URL과 매칭되지 않도록 검색 자체를 하지 않음
+    assert provider.queries == []
+    with pytest.raises(AttributeError):
+        tools.search_xyz_documents
@@ -0,0 +1,68 @@
+"""하이브리드 검색 - 미리 시작한 판례 조회 태스크 정리 테스트"""
+
+import asyncio
+
+import pytest
+
+from workflows.tools import RequirementsTools
+
+
+def test_precedent_task_is_cancelled_when_combine_fails():
+    tools = RequirementsTools()
+    started = asyncio.Event()
+    cancelled = []
+
+    async def slow_precedents(hs_code):
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(hs_code)
+            raise
+
+    async def failing_combine(*args, **kwargs):
+        await started.wait()
+        raise RuntimeError("combine failed")
+
+    tools.get_cbp_precedents = slow_precedents
+    tools._combine_search_results = failing_combine
+    tools.backend_api = None
+    tools.data_gov_api = None
+
+    async def run():
+        try:
+            with pytest.raises(RuntimeError):
+                await tools.search_requirements_hybrid("3304.99", "serum")
+            await asyncio.sleep(0)
+            # 이벤트 루프 종료 정리 전에 이미 취소되어 있어야 함
+            assert cancelled == ["3304.99"]
+        finally:
+            await tools.aclose()
+
+    asyncio.run(run())
+
+
+def test_target_agency_failure_still_returns_combined_results():
+    tools = RequirementsTools()
+
+    async def no_precedents(hs_code):
+        return []
+
+    async def failing_target_agencies(hs_code, product_name=""):
+        raise RuntimeError("mapping backend down")
+
+    tools.get_cbp_precedents = no_precedents
+    tools._get_target_agencies_for_hs_code = failing_target_agencies
+    tools.backend_api = None
+    tools.data_gov_api = None
+
+    async def run():
+        try:
+            return await tools.search_requirements_hybrid("3304.99", "serum")
+        finally:
+            await tools.aclose()
+
+    result = asyncio.run(run())
+    assert result["web_results"] == {"error": "mapping backend down"}
+    assert result["combined_results"]["target_agencies"] == {}
+    assert result["combined_results"]["extracted_keywords"] == []
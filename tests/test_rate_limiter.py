@@ -0,0 +1,97 @@
+import asyncio
+import time
+
+import httpx
+import requests
+
+from app.services.requirements.tavily_search import AdaptiveRateLimiter, is_throttle_error
+
+
+def _http_error(status: int, headers=None) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://api.tavily.com/search")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    return httpx.HTTPStatusError(f"{status}", request=request, response=response)
+
+
+def _requests_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status} Client Error", response=response)
+
+
+async def _call(limiter: AdaptiveRateLimiter, exc: BaseException = None) -> None:
+    try:
+        async with limiter:
+            if exc is not None:
+                raise exc
+    except Exception as e:
+        assert e is exc
+
+
+def test_throttle_detection_uses_status_code():
+    assert is_throttle_error(_http_error(429))
+    assert is_throttle_error(_requests_error(432))
+    assert not is_throttle_error(_http_error(500))
+    # 메시지에 숫자가 들어 있어도 상태 코드가 아니면 제한으로 보지 않음
+    assert not is_throttle_error(RuntimeError("query 4290 failed"))
+    assert not AdaptiveRateLimiter._is_throttled(ValueError("HS 432110"))
+
+
+def test_additive_increase_and_multiplicative_decrease():
+    limiter = AdaptiveRateLimiter(rpm=1000, max_concurrency=8, alpha=0.5, beta=0.5)
+
+    async def scenario():
+        await _call(limiter, _http_error(429))
+        assert limiter.concurrency == 4.0
+        await _call(limiter, _requests_error(432))
+        assert limiter.concurrency == 2.0
+        await _call(limiter)
+        await _call(limiter)
+        assert limiter.concurrency == 3.0
+        # 제한과 무관한 오류는 상한을 바꾸지 않음
+        await _call(limiter, _http_error(500))
+        assert limiter.concurrency == 3.0
+        for _ in range(20):
+            await _call(limiter)
+        assert limiter.concurrency == 8.0
+
+    asyncio.run(scenario())
+
+
+def test_decrease_never_goes_below_one():
+    limiter = AdaptiveRateLimiter(rpm=1000, max_concurrency=2, beta=0.1)
+
+    async def scenario():
+        for _ in range(3):
+            await _call(limiter, _http_error(429))
+
+    asyncio.run(scenario())
+    assert limiter.concurrency == 1.0
+
+
+def test_retry_after_header_pauses_new_requests():
+    limiter = AdaptiveRateLimiter(rpm=1000, max_concurrency=4)
+
+    async def scenario():
+        await _call(limiter, _http_error(429, {"retry-after": "0.3"}))
+        started = time.monotonic()
+        await _call(limiter)
+        return time.monotonic() - started
+
+    assert asyncio.run(scenario()) >= 0.25
+
+
+def test_shared_limiter_works_across_event_loops():
+    # 동시 요청 1개로 대기를 유도해 Condition이 루프에 묶이는 경로를 태움
+    limiter = AdaptiveRateLimiter(rpm=1000, max_concurrency=1, alpha=0.0)
+
+    async def scenario():
+        async def worker():
+            async with limiter:
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(worker() for _ in range(3)))
+
+    for _ in range(2):
+        asyncio.run(scenario())
+    assert limiter._in_flight == 0
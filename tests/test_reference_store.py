@@ -0,0 +1,84 @@
+"""참고 링크 저장소 (JSONL + 기존 JSON 이관/압축) 테스트"""
+
+import asyncio
+import json
+
+import pytest
+
+from workflows.tools import RequirementsTools
+
+
+@pytest.fixture
+def tools(tmp_path):
+    t = RequirementsTools()
+    t.references_store_path = tmp_path / "reference_links.jsonl"
+    t.legacy_references_path = tmp_path / "reference_links.json"
+    yield t
+    asyncio.run(t.aclose())
+
+
+def _read_lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def test_legacy_store_is_validated_and_migrated(tools):
+    tools.legacy_references_path.write_text(json.dumps({
+        "3304.99:serum": {
+            "hs_code": "3304.99",
+            "product_name": "serum",
+            "agencies": {
+                "FDA": {"urls": ["https://www.fda.gov/cosmetics", "https://example.com/?ref=fda.gov"]},
+                "USDA": {"urls": ["https://www.fda.gov/x"]},  # 다른 기관 도메인
+                "XYZ": {"urls": ["https://xyz.gov/a"]},  # 미등록 기관
+            },
+        },
+        "0000.00:junk": {"agencies": {"EPA": {"urls": ["https://evil.example/epa.gov"]}}},
+        "broken": "not a dict",
+    }), encoding="utf-8")
+
+    refs = asyncio.run(tools.load_references())
+
+    assert list(refs) == ["3304.99:serum"]
+    assert refs["3304.99:serum"]["agencies"] == {"FDA": {"urls": ["https://www.fda.gov/cosmetics"]}}
+
+    assert asyncio.run(tools.flush_references()) is True
+    assert _read_lines(tools.references_store_path) == [{"3304.99:serum": refs["3304.99:serum"]}]
+
+
+def test_existing_jsonl_store_skips_legacy(tools):
+    tools.references_store_path.write_text(json.dumps({"a:b": {"agencies": {}}}) + "\n", encoding="utf-8")
+    tools.legacy_references_path.write_text(json.dumps({
+        "c:d": {"agencies": {"FDA": {"urls": ["https://www.fda.gov/x"]}}}
+    }), encoding="utf-8")
+
+    assert list(asyncio.run(tools.load_references())) == ["a:b"]
+    assert asyncio.run(tools.flush_references()) is False
+
+
+def test_repeated_saves_are_compacted(tools):
+    async def run():
+        for i in range(120):
+            tools.save_reference_links("3304.99", "serum", {
+                "FDA": {"agency": "FDA", "urls": [f"https://www.fda.gov/{i}"]}
+            })
+            tools.save_reference_links("8517.12", "phone", {
+                "FCC": {"agency": "FCC", "urls": ["https://www.fcc.gov/x"]}
+            })
+            await tools.flush_references()
+
+    asyncio.run(run())
+
+    # 같은 키를 덮어쓴 줄이 쌓이면 현재 인덱스 크기로 다시 씀
+    lines = _read_lines(tools.references_store_path)
+    assert len(lines) < 240
+    assert not tools.references_store_path.with_name("reference_links.jsonl.tmp").exists()
+
+    reloaded = RequirementsTools()
+    reloaded.references_store_path = tools.references_store_path
+    reloaded.legacy_references_path = tools.legacy_references_path
+    try:
+        refs = asyncio.run(reloaded.load_references())
+        assert set(refs) == {"3304.99:serum", "8517.12:phone"}
+        assert refs["3304.99:serum"]["agencies"]["FDA"]["urls"] == ["https://www.fda.gov/119"]
+    finally:
+        asyncio.run(reloaded.aclose())
@@ -0,0 +1,59 @@
+"""통합 워크플로우 구성 테스트"""
+
+import asyncio
+
+from workflows.unified_workflow import UnifiedRequirementsWorkflow, UnifiedWorkflowState
+
+
+def test_nodes_share_the_workflow_tools():
+    workflow = UnifiedRequirementsWorkflow()
+    assert workflow.nodes.tools is workflow.tools
+    assert workflow.nodes.web_scraper is workflow.tools.web_scraper
+
+    asyncio.run(workflow.aclose())
+    assert workflow.tools._http_client.is_closed
+
+
+def _replacing_node(result_key, metadata_key, delay, record):
+    """결과 메타데이터를 새 dict로 반환하는 모의 노드 (입력 dict를 제자리 수정하지 않음)"""
+    async def node(temp_state):
+        record.append(("start", result_key))
+        await asyncio.sleep(delay)
+        record.append(("end", result_key))
+        return {
+            result_key: {},
+            "detailed_metadata": {**temp_state["detailed_metadata"], metadata_key: {"node": result_key}},
+        }
+    return node
+
+
+def test_parallel_nodes_merge_their_metadata(monkeypatch):
+    workflow = UnifiedRequirementsWorkflow()
+    nodes = workflow.nodes
+    record = []
+
+    async def extract(temp_state):
+        temp_state["detailed_metadata"]["keyword_extraction"] = {"node": "keywords"}
+        return {"core_keywords": ["serum"], "keyword_strategies": [], "detailed_metadata": temp_state["detailed_metadata"]}
+
+    monkeypatch.setattr(nodes, "extract_core_keywords", extract)
+    # 하이브리드(느림)가 검색·스크래핑보다 늦게 끝나도 앞선 메타데이터를 덮어쓰지 않아야 함
+    monkeypatch.setattr(nodes, "search_agency_documents", _replacing_node("search_results", "search_step", 0.01, record))
+    monkeypatch.setattr(nodes, "scrape_documents", _replacing_node("scraped_data", "scraping_step", 0.01, record))
+    monkeypatch.setattr(nodes, "call_hybrid_api", _replacing_node("hybrid_result", "hybrid_step", 0.1, record))
+    monkeypatch.setattr(nodes, "consolidate_results", _replacing_node("consolidated_results", "consolidation_step", 0, record))
+
+    async def run():
+        try:
+            return await workflow._execute_parallel_workflow(UnifiedWorkflowState(hs_code="3304.99", product_name="serum"))
+        finally:
+            await workflow.aclose()
+
+    state = asyncio.run(run())
+
+    # 하이브리드 호출은 검색·스크래핑과 동시에 실행됨
+    assert record.index(("start", "scraped_data")) < record.index(("end", "hybrid_result"))
+    assert set(state.detailed_metadata) == {
+        "keyword_extraction", "search_step", "hybrid_step", "scraping_step", "consolidation_step"
+    }
+    assert state.final_result["detailed_metadata"] == state.detailed_metadata
@@ -0,0 +1,21 @@
+import pytest
+
+from app.services.requirements.url_utils import is_official_url, url_host
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.fda.gov/food", True),
+    ("https://fda.gov", True),
+    ("https://evil.com/.gov/page", False),
+    ("https://example.com/?ref=www.fda.gov", False),
+    ("https://fda.gov.example.com/", False),
+    ("http://[bad", False),
+    ("", False),
+])
+def test_is_official_url_checks_host_suffix(url, expected):
+    assert is_official_url(url) is expected
+
+
+def test_url_host_is_lowercase_and_empty_for_invalid():
+    assert url_host("https://WWW.FDA.GOV/x") == "www.fda.gov"
+    assert url_host("http://[bad") == ""
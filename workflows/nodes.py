@@ -5,7 +5,7 @@ LangGraph Nodes for Requirements Analysis
 (Updated: 2025-10-11 - Phase 2-4 전문 서비스 연결)
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from .tools import RequirementsTools
 from app.services.requirements.keyword_extractor import KeywordExtractor, HfKeywordExtractor, OpenAiKeywordExtractor
 from app.services.requirements.tavily_search import TavilySearchService
@@ -13,7 +13,16 @@ from app.services.requirements.web_scraper import WebScraper
 from app.services.requirements.error_handler import error_handler, WorkflowError, ErrorSeverity, ErrorRecoveryStrategy
 from app.models.requirement_models import RequirementAnalysisRequest
 from datetime import datetime
+from itertools import product
 import asyncio
+import json
+import logging
+
+# orjson은 선택 의존성 (설치되어 있으면 JSON 직렬화 가속, 없으면 표준 json 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Phase 2-4 전문 서비스 import
 from app.services.requirements.detailed_regulations_service import detailed_regulations_service
@@ -22,14 +31,38 @@ from app.services.requirements.penalties_service import penalties_service
 from app.services.requirements.validity_service import validity_service
 from app.services.requirements.cross_validation_service import CrossValidationService
 
+logger = logging.getLogger(__name__)
+
+def _dumps_pretty(obj: Any) -> bytes:
+    """결과 파일용 들여쓰기 JSON 직렬화 (orjson이 있으면 str 중간 생성 없이 bytes로 바로 인코딩)"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+
 
 class RequirementsNodes:
     """요구사항 분석을 위한 LangGraph 노드들"""
     
-    def __init__(self):
-        # RequirementsTools에서 프로바이더를 가져와서 사용
-        self.tools = RequirementsTools()
-        self.web_scraper = WebScraper()
+    # 기관별 검색 쿼리 템플릿 (site: 도메인은 RequirementsTools.agency_domains 사용)
+    _QUERY_TEMPLATES = {
+        "FDA": "import requirements {term} HS {code}",
+        "FCC": "device authorization requirements {term} HS {code}",
+        "CBP": "import documentation requirements HS {code} {term}",
+        "USDA": "agricultural import requirements {term} HS {code}",
+        "EPA": "environmental regulations {term} HS {code}",
+        "CPSC": "consumer product safety {term} HS {code}",
+        "KCS": "Korea customs import requirements {term} HS {code}",
+        "MFDS": "food drug safety import {term} HS {code}",
+        "MOTIE": "trade policy import requirements {term} HS {code}"
+    }
+    
+    def __init__(self, tools: Optional[RequirementsTools] = None):
+        # RequirementsTools에서 프로바이더를 가져와서 사용 (워크플로우가 주입하면 공유, 없으면 새로 생성)
+        self.tools = tools or RequirementsTools()
+        # RequirementsTools의 스크래퍼를 공유하여 HTTP 커넥션 풀 재사용 (초기화 실패 시 기본 스크래퍼 주입)
+        if self.tools.web_scraper is None:
+            self.tools.web_scraper = WebScraper()
+        self.web_scraper = self.tools.web_scraper
         self.keyword_extractor = None
         self.hf_extractor = None
         self.openai_extractor = None
@@ -41,7 +74,7 @@ class RequirementsNodes:
         self.validity = validity_service
         self.cross_validation = CrossValidationService()
         
-        print("✅ RequirementsNodes 초기화 완료 (Phase 2-4 서비스 포함)")
+        logger.info("✅ RequirementsNodes 초기화 완료 (Phase 2-4 서비스 포함)")
 
     async def extract_core_keywords(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """상품명/설명에서 핵심 키워드 추출 (간단 휴리스틱).
@@ -61,7 +94,7 @@ class RequirementsNodes:
                     self.hf_extractor = HfKeywordExtractor()
                 except Exception as e:
                     self.hf_extractor = None
-                    print(f"⚠️ HF 키워드 추출기 초기화 실패: {e}")
+                    logger.warning("⚠️ HF 키워드 추출기 초기화 실패: %s", e)
             
             if self.keyword_extractor is None:
                 self.keyword_extractor = KeywordExtractor()
@@ -71,7 +104,7 @@ class RequirementsNodes:
                     self.openai_extractor = OpenAiKeywordExtractor()
                 except Exception as e:
                     self.openai_extractor = None
-                    print(f"⚠️ OpenAI 키워드 추출기 초기화 실패: {e}")
+                    logger.warning("⚠️ OpenAI 키워드 추출기 초기화 실패: %s", e)
 
             core_keywords = []
             
@@ -79,32 +112,32 @@ class RequirementsNodes:
             try:
                 if self.openai_extractor:
                     core_keywords = self.openai_extractor.extract(name, desc, top_k=3)
-                    print(f"✅ OpenAI 키워드 추출 성공: {core_keywords}")
+                    logger.info("✅ OpenAI 키워드 추출 성공: %s", core_keywords)
             except Exception as e:
-                print(f"⚠️ OpenAI 키워드 추출 실패: {e}")
+                logger.warning("⚠️ OpenAI 키워드 추출 실패: %s", e)
                 core_keywords = []
             
             if not core_keywords:
                 try:
                     if self.hf_extractor:
                         core_keywords = self.hf_extractor.extract(name, desc, top_k=3)
-                        print(f"✅ HF 키워드 추출 성공: {core_keywords}")
+                        logger.info("✅ HF 키워드 추출 성공: %s", core_keywords)
                 except Exception as e:
-                    print(f"⚠️ HF 키워드 추출 실패: {e}")
+                    logger.warning("⚠️ HF 키워드 추출 실패: %s", e)
                     core_keywords = []
             
             if not core_keywords:
                 try:
                     core_keywords = self.keyword_extractor.extract(name, desc, top_k=3)
-                    print(f"✅ 휴리스틱 키워드 추출 성공: {core_keywords}")
+                    logger.info("✅ 휴리스틱 키워드 추출 성공: %s", core_keywords)
                 except Exception as e:
-                    print(f"❌ 휴리스틱 키워드 추출 실패: {e}")
+                    logger.error("❌ 휴리스틱 키워드 추출 실패: %s", e)
                     # 최종 폴백: 상품명에서 기본 키워드 추출
                     core_keywords = self._extract_fallback_keywords(name, desc)
-                    print(f"🔄 폴백 키워드 추출: {core_keywords}")
+                    logger.info("🔄 폴백 키워드 추출: %s", core_keywords)
             
         except Exception as e:
-            print(f"❌ 키워드 추출 노드 전체 실패: {e}")
+            logger.error("❌ 키워드 추출 노드 전체 실패: %s", e)
             # 에러 처리
             error_result = error_handler.handle_error(
                 WorkflowError(
@@ -118,7 +151,7 @@ class RequirementsNodes:
             
             if error_result['continue_workflow']:
                 core_keywords = error_result.get('fallback_data', {}).get('keywords', ['default'])
-                print(f"🔄 에러 복구 후 폴백 키워드 사용: {core_keywords}")
+                logger.info("🔄 에러 복구 후 폴백 키워드 사용: %s", core_keywords)
             else:
                 raise WorkflowError("키워드 추출 실패로 워크플로우 중단", ErrorSeverity.HIGH)
         
@@ -154,9 +187,9 @@ class RequirementsNodes:
         state["detailed_metadata"] = state.get("detailed_metadata", {})
         state["detailed_metadata"].update(keyword_metadata)
         
-        print(f"\n🔎 [NODE] 핵심 키워드: {core_keywords}")
-        print(f"🔎 [NODE] 키워드 전략: {[s['strategy'] for s in state['keyword_strategies']]}")
-        print(f"🔎 [METADATA] 키워드 추출 상세 정보 저장됨")
+        logger.info("\n🔎 [NODE] 핵심 키워드: %s", core_keywords)
+        logger.info("🔎 [NODE] 키워드 전략: %s", [s['strategy'] for s in state['keyword_strategies']])
+        logger.info("🔎 [METADATA] 키워드 추출 상세 정보 저장됨")
         state["next_action"] = "call_hybrid_api"
         return state
     
@@ -212,29 +245,19 @@ class RequirementsNodes:
         
         query_term = query_terms[0]  # 첫 번째 전략 사용
         
-        print(f"\n🔍 [NODE] 기관별 문서 검색 시작")
-        print(f"  📋 HS코드: {hs_code}")
-        print(f"  📦 상품명: {product_name}")
+        logger.info("\n🔍 [NODE] 기관별 문서 검색 시작")
+        logger.info("  📋 HS코드: %s", hs_code)
+        logger.info("  📦 상품명: %s", product_name)
         
         # 기본 URL 폴백 (TavilySearch 실패 시 사용) - 9개 기관 모두
-        default_urls = {
-            "FDA": "https://www.fda.gov",
-            "FCC": "https://www.fcc.gov",
-            "CBP": "https://www.cbp.gov",
-            "USDA": "https://www.usda.gov",
-            "EPA": "https://www.epa.gov",
-            "CPSC": "https://www.cpsc.gov",
-            "KCS": "https://www.customs.go.kr",
-            "MFDS": "https://www.mfds.go.kr",
-            "MOTIE": "https://www.motie.go.kr"
-        }
+        default_urls = self.tools.default_agency_urls
         
         # HS코드 8자리와 6자리 추출
         hs_code_8digit = hs_code
         hs_code_6digit = ".".join(hs_code.split(".")[:2]) if "." in hs_code else hs_code
         
-        print(f"  📋 8자리 HS코드: {hs_code_8digit}")
-        print(f"  📋 6자리 HS코드: {hs_code_6digit}")
+        logger.info("  📋 8자리 HS코드: %s", hs_code_8digit)
+        logger.info("  📋 6자리 HS코드: %s", hs_code_6digit)
         
         # 타겟 기관 결정 (AI 매핑 또는 하드코딩 또는 챕터 기반 추론)
         target_agencies_data = await self.tools._get_target_agencies_for_hs_code(hs_code, product_name)
@@ -243,112 +266,71 @@ class RequirementsNodes:
         # 타겟 기관이 없으면 최소한 FDA는 포함
         if not target_agencies:
             target_agencies = ["FDA"]
-            print(f"  ⚠️ 타겟 기관 없음 - 기본값 FDA 사용")
+            logger.warning("  ⚠️ 타겟 기관 없음 - 기본값 FDA 사용")
         
-        print(f"  🎯 타겟 기관: {', '.join(target_agencies)} ({target_agencies_data.get('source', 'unknown')})")
-        print(f"  💰 Tavily 검색 최적화: {len(target_agencies)}개 기관만 검색")
+        logger.info("  🎯 타겟 기관: %s (%s)", ', '.join(target_agencies), target_agencies_data.get('source', 'unknown'))
+        logger.info("  💰 Tavily 검색 최적화: %s개 기관만 검색", len(target_agencies))
         
         # 각 기관별 검색 쿼리 (8자리와 6자리 모두) - 타겟 기관만!
-        search_queries = {}
+        # 점(.)이 없는 HS코드는 6자리 == 8자리 → 동일 쿼리 중복 검색 방지
+        hs_code_variants = {"8digit": hs_code_8digit}
+        if hs_code_6digit != hs_code_8digit:
+            hs_code_variants["6digit"] = hs_code_6digit
+        else:
+            logger.info("  ♻️ 6자리 HS코드가 8자리와 동일 - 6자리 검색 생략")
         
-        # 기관별 사이트 도메인 매핑
-        agency_domains = {
-            "FDA": "fda.gov",
-            "FCC": "fcc.gov",
-            "CBP": "cbp.gov",
-            "USDA": "usda.gov",
-            "EPA": "epa.gov",
-            "CPSC": "cpsc.gov",
-            "KCS": "customs.go.kr",
-            "MFDS": "mfds.go.kr",
-            "MOTIE": "motie.go.kr"
+        agency_domains = self.tools.agency_domains
+        search_queries = {
+            f"{agency}_{kind}": f"site:{agency_domains.get(agency, f'{agency.lower()}.gov')} "
+                                + self._QUERY_TEMPLATES[agency].format(term=query_term, code=code)
+            for (kind, code), agency in product(hs_code_variants.items(), target_agencies)
+            if agency in self._QUERY_TEMPLATES
         }
         
-        # 타겟 기관만 검색 쿼리 생성
-        for agency in target_agencies:
-            domain = agency_domains.get(agency, f"{agency.lower()}.gov")
-            
-            # 8자리 HS코드 검색
-            if agency == "FDA":
-                search_queries[f"{agency}_8digit"] = f"site:{domain} import requirements {query_term} HS {hs_code_8digit}"
-            elif agency == "FCC":
-                search_queries[f"{agency}_8digit"] = f"site:{domain} device authorization requirements {query_term} HS {hs_code_8digit}"
-            elif agency == "CBP":
-                search_queries[f"{agency}_8digit"] = f"site:{domain} import documentation requirements HS {hs_code_8digit} {query_term}"
-            elif agency == "USDA":
-                search_queries[f"{agency}_8digit"] = f"site:{domain} agricultural import requirements {query_term} HS {hs_code_8digit}"
-            elif agency == "EPA":
-                search_queries[f"{agency}_8digit"] = f"site:{domain} environmental regulations {query_term} HS {hs_code_8digit}"
-            elif agency == "CPSC":
-                search_queries[f"{agency}_8digit"] = f"site:{domain} consumer product safety {query_term} HS {hs_code_8digit}"
-            elif agency == "KCS":
-                search_queries[f"{agency}_8digit"] = f"site:{domain} Korea customs import requirements {query_term} HS {hs_code_8digit}"
-            elif agency == "MFDS":
-                search_queries[f"{agency}_8digit"] = f"site:{domain} food drug safety import {query_term} HS {hs_code_8digit}"
-            elif agency == "MOTIE":
-                search_queries[f"{agency}_8digit"] = f"site:{domain} trade policy import requirements {query_term} HS {hs_code_8digit}"
+        search_results = {}
         
-        # 6자리 HS코드 검색 (유사) - 타겟 기관만!
-        for agency in target_agencies:
-            domain = agency_domains.get(agency, f"{agency.lower()}.gov")
-            
-            # 6자리 HS코드 검색
-            if agency == "FDA":
-                search_queries[f"{agency}_6digit"] = f"site:{domain} import requirements {query_term} HS {hs_code_6digit}"
-            elif agency == "FCC":
-                search_queries[f"{agency}_6digit"] = f"site:{domain} device authorization requirements {query_term} HS {hs_code_6digit}"
-            elif agency == "CBP":
-                search_queries[f"{agency}_6digit"] = f"site:{domain} import documentation requirements HS {hs_code_6digit} {query_term}"
-            elif agency == "USDA":
-                search_queries[f"{agency}_6digit"] = f"site:{domain} agricultural import requirements {query_term} HS {hs_code_6digit}"
-            elif agency == "EPA":
-                search_queries[f"{agency}_6digit"] = f"site:{domain} environmental regulations {query_term} HS {hs_code_6digit}"
-            elif agency == "CPSC":
-                search_queries[f"{agency}_6digit"] = f"site:{domain} consumer product safety {query_term} HS {hs_code_6digit}"
-            elif agency == "KCS":
-                search_queries[f"{agency}_6digit"] = f"site:{domain} Korea customs import requirements {query_term} HS {hs_code_6digit}"
-            elif agency == "MFDS":
-                search_queries[f"{agency}_6digit"] = f"site:{domain} food drug safety import {query_term} HS {hs_code_6digit}"
-            elif agency == "MOTIE":
-                search_queries[f"{agency}_6digit"] = f"site:{domain} trade policy import requirements {query_term} HS {hs_code_6digit}"
+        # 기관별 검색 동시 실행 (검색 결과를 15개로 확장, 도구 공용 동시 요청 상한 적용)
+        async def _search(query: str) -> List[Dict[str, Any]]:
+            async with self.tools.search_semaphore:
+                return await self.tools.search_provider.search(query, max_results=15)
         
-        search_results = {}
+        fetched = await asyncio.gather(*(_search(query) for query in search_queries.values()), return_exceptions=True)
         
-        for agency, query in search_queries.items():
-            print(f"\n  📡 {agency} 검색 중...")
-            print(f"    쿼리: {query}")
-            
-            # 프로바이더를 통한 검색 시도 (더 많은 결과 수집)
-            results = await self.tools.search_provider.search(query, max_results=15)  # 검색 결과를 15개로 확장
-            print(f"    📊 {self.tools.search_provider.provider_name} 검색 결과: {len(results)}개")
+        for (agency, query), results in zip(search_queries.items(), fetched):
+            logger.info("\n  📡 %s 검색 결과", agency)
+            logger.info("    쿼리: %s", query)
+            if isinstance(results, BaseException):
+                logger.error("    ❌ %s 검색 실패: %s", agency, results)
+                results = []
+            logger.info("    📊 %s 검색 결과: %s개", self.tools.search_provider.provider_name, len(results))
             
             # 검색 결과 처리
             chosen_urls = []
             
             if not results and self.tools.search_provider.provider_name == "disabled":
-                print(f"    🔇 검색 비활성화 모드: '{query}' 스킵됨")
+                logger.info("    🔇 검색 비활성화 모드: '%s' 스킵됨", query)
                 agency_name = agency.split("_")[0]
                 default_url = default_urls.get(agency_name)
                 if default_url:
                     chosen_urls = [default_url]
             elif not results:
-                print(f"    💡 팁: TAVILY_API_KEY를 설정하면 더 정확한 검색 결과를 얻을 수 있습니다.")
+                logger.info("    💡 팁: TAVILY_API_KEY를 설정하면 더 정확한 검색 결과를 얻을 수 있습니다.")
                 agency_name = agency.split("_")[0]
                 default_url = default_urls.get(agency_name)
                 if default_url:
                     chosen_urls = [default_url]
-                print(f"    🔄 {agency} TavilySearch 실패, 기본 URL 사용: {default_url}")
+                logger.info("    🔄 %s TavilySearch 실패, 기본 URL 사용: %s", agency, default_url)
             else:
                 # 검색 성공 - 여러 링크 수집 (최대 10개)
                 for i, result in enumerate(results, 1):
                     title = result.get('title', 'No title')
                     url = result.get('url', 'No URL')
-                    print(f"      {i}. {title}")
-                    print(f"         URL: {url}")
+                    logger.debug("      %s. %s", i, title)
+                    logger.debug("         URL: %s", url)
                 
                 # site: 쿼리로 검색했으므로 모든 결과가 공식 사이트 (최대 10개 선택)
                 chosen_urls = [result.get("url") for result in results[:10] if result.get("url")]
-                print(f"    ✅ {agency} 공식 사이트 결과 {len(chosen_urls)}개 선택")
+                logger.info("    ✅ %s 공식 사이트 결과 %s개 선택", agency, len(chosen_urls))
             
             search_results[agency] = {
                 "urls": chosen_urls,  # 여러 URL 저장
@@ -361,7 +343,7 @@ class RequirementsNodes:
         
         # 요약 카운트: 하나 이상의 URL 보유한 항목 수
         found_count = sum(1 for v in search_results.values() if v.get("urls"))
-        print(f"\n📋 [NODE] 검색 완료 - {found_count}개 URL 세트 발견")
+        logger.info("\n📋 [NODE] 검색 완료 - %s개 URL 세트 발견", found_count)
         
         # 🎯 기관별 검색 단계의 상세 metadata 수집
         search_metadata = {
@@ -396,10 +378,12 @@ class RequirementsNodes:
         state["search_results"] = search_results
         # 참고 링크 저장
         request = state["request"]
+        await self.tools.load_references()
         save_meta = self.tools.save_reference_links(request.hs_code, request.product_name, search_results)
+        await self.tools.flush_references()
         state["references_saved"] = save_meta
         
-        print(f"🔍 [METADATA] 기관별 검색 상세 정보 저장됨 - 총 {found_count}개 URL 발견")
+        logger.info("🔍 [METADATA] 기관별 검색 상세 정보 저장됨 - 총 %s개 URL 발견", found_count)
         state["next_action"] = "scrape_documents"
         return state
 
@@ -411,7 +395,7 @@ class RequirementsNodes:
         product_description = request.product_description or ""
         keywords = state.get("core_keywords") or []
         query_term = (keywords[0] if keywords else product_name) or ""
-        print(f"\n📡 [NODE] 하이브리드 API 호출 시작: {hs_code} / {product_name}")
+        logger.info("\n📡 [NODE] 하이브리드 API 호출 시작: %s / %s", hs_code, product_name)
         try:
             # Phase 2-4 포함된 하이브리드 검색
             hybrid_start_time = datetime.now()
@@ -443,10 +427,10 @@ class RequirementsNodes:
             state["detailed_metadata"].update(hybrid_metadata)
             
             state["hybrid_result"] = hybrid
-            print(f"📡 [METADATA] 하이브리드 API 검색 상세 정보 저장됨 - 응답시간: {(hybrid_end_time - hybrid_start_time).total_seconds()*1000:.0f}ms")
+            logger.info("📡 [METADATA] 하이브리드 API 검색 상세 정보 저장됨 - 응답시간: %.0fms", (hybrid_end_time - hybrid_start_time).total_seconds()*1000)
             state["next_action"] = "scrape_documents"
         except Exception as e:
-            print(f"  ❌ 하이브리드 호출 실패: {e}")
+            logger.error("  ❌ 하이브리드 호출 실패: %s", e)
             
             # 오류 발생 시에도 메타데이터 수집
             hybrid_metadata = {
@@ -473,7 +457,7 @@ class RequirementsNodes:
             state["detailed_metadata"].update(hybrid_metadata)
             
             state["hybrid_result"] = {"error": str(e)}
-            print(f"📡 [METADATA] 하이브리드 API 오류 정보 저장됨: {e}")
+            logger.info("📡 [METADATA] 하이브리드 API 오류 정보 저장됨: %s", e)
             state["next_action"] = "scrape_documents"
         return state
     
@@ -483,7 +467,7 @@ class RequirementsNodes:
         request = state["request"]
         hs_code = request.hs_code
         
-        print(f"\n🔍 [NODE] 문서 스크래핑 시작")
+        logger.info("\n🔍 [NODE] 문서 스크래핑 시작")
         
         scraped_data = {}
         
@@ -502,15 +486,35 @@ class RequirementsNodes:
             
             agency_results[agency_name][hs_code_type]["urls"] = search_data["urls"]
         
-        # 각 기관별로 스크래핑 수행
+        # 기관별 스크래핑 동시 실행 (8자리 + 6자리 URL 중 첫 URL 사용, 동시 요청 수 제한)
+        all_urls_by_agency = {
+            agency_name: agency_data["8digit"]["urls"] + agency_data["6digit"]["urls"]
+            for agency_name, agency_data in agency_results.items()
+        }
+        # 기관 → 스크래퍼 메서드 매핑은 RequirementsTools와 공유
+        scrapers = self.tools._scraper_dispatch
+        scrape_targets = [
+            agency_name for agency_name, all_urls in all_urls_by_agency.items()
+            if all_urls and agency_name in scrapers
+        ]
+        semaphore = asyncio.Semaphore(8)
+        
+        async def _scrape(agency_name: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await scrapers[agency_name](hs_code, all_urls_by_agency[agency_name][0])
+        
+        fetched = await asyncio.gather(*(_scrape(agency_name) for agency_name in scrape_targets), return_exceptions=True)
+        scrape_outcomes = dict(zip(scrape_targets, fetched))
+        
+        # 결과 처리는 기관 순서대로 (로그 출력 순서 유지)
         for agency_name, agency_data in agency_results.items():
-            print(f"\n  📄 {agency_name} 스크래핑 중...")
+            logger.info("\n  📄 %s 스크래핑 중...", agency_name)
             
             # 8자리와 6자리 URL 모두 수집
-            all_urls = agency_data["8digit"]["urls"] + agency_data["6digit"]["urls"]
+            all_urls = all_urls_by_agency[agency_name]
             
             if not all_urls:
-                print(f"    ❌ {agency_name}: 스크래핑할 URL 없음")
+                logger.warning("    ❌ %s: 스크래핑할 URL 없음", agency_name)
                 # URL이 없어도 None으로 결과 저장
                 scraped_data[agency_name] = {
                     "certifications": [],
@@ -523,46 +527,31 @@ class RequirementsNodes:
                 }
                 continue
             
-            print(f"    📋 8자리 URL: {len(agency_data['8digit']['urls'])}개")
-            print(f"    📋 6자리 URL: {len(agency_data['6digit']['urls'])}개")
-            print(f"    📋 총 URL: {len(all_urls)}개")
+            logger.info("    📋 8자리 URL: %s개", len(agency_data['8digit']['urls']))
+            logger.info("    📋 6자리 URL: %s개", len(agency_data['6digit']['urls']))
+            logger.info("    📋 총 URL: %s개", len(all_urls))
             
             try:
                 # 9개 기관 모두 처리
-                if agency_name == "FDA":
-                    result = await self.web_scraper.scrape_fda_requirements(hs_code, all_urls[0])
-                elif agency_name == "FCC":
-                    result = await self.web_scraper.scrape_fcc_requirements(hs_code, all_urls[0])
-                elif agency_name == "CBP":
-                    result = await self.web_scraper.scrape_cbp_requirements(hs_code, all_urls[0])
-                elif agency_name == "USDA":
-                    result = await self.web_scraper.scrape_usda_requirements(hs_code, all_urls[0])
-                elif agency_name == "EPA":
-                    result = await self.web_scraper.scrape_epa_requirements(hs_code, all_urls[0])
-                elif agency_name == "CPSC":
-                    result = await self.web_scraper.scrape_cpsc_requirements(hs_code, all_urls[0])
-                elif agency_name == "KCS":
-                    result = await self.web_scraper.scrape_kcs_requirements(hs_code, all_urls[0])
-                elif agency_name == "MFDS":
-                    result = await self.web_scraper.scrape_mfds_requirements(hs_code, all_urls[0])
-                elif agency_name == "MOTIE":
-                    result = await self.web_scraper.scrape_motie_requirements(hs_code, all_urls[0])
-                else:
-                    print(f"    ❌ {agency_name}: 지원되지 않는 기관")
+                if agency_name not in scrape_outcomes:
+                    logger.warning("    ❌ %s: 지원되지 않는 기관", agency_name)
                     continue
+                result = scrape_outcomes[agency_name]
+                if isinstance(result, BaseException):
+                    raise result
                 
                 # 스크래핑 결과 상세 로깅
                 certs = result.get("certifications", [])
                 docs = result.get("documents", [])
                 
-                print(f"    ✅ {agency_name} 스크래핑 성공:")
-                print(f"      📋 인증요건: {len(certs)}개")
+                logger.info("    ✅ %s 스크래핑 성공:", agency_name)
+                logger.info("      📋 인증요건: %s개", len(certs))
                 for cert in certs:
-                    print(f"        • {cert.get('name', 'Unknown')} ({cert.get('agency', 'Unknown')})")
+                    logger.debug("        • %s (%s)", cert.get('name', 'Unknown'), cert.get('agency', 'Unknown'))
                 
-                print(f"      📄 필요서류: {len(docs)}개")
+                logger.info("      📄 필요서류: %s개", len(docs))
                 for doc in docs:
-                    print(f"        • {doc.get('name', 'Unknown')}")
+                    logger.debug("        • %s", doc.get('name', 'Unknown'))
                 
                 # HS코드 구분 정보 추가
                 # 안전하게 리스트로 변환 (타입 에러 방지)
@@ -586,7 +575,7 @@ class RequirementsNodes:
                 scraped_data[agency_name] = result
                 
             except Exception as e:
-                print(f"    ❌ {agency_name} 스크래핑 실패: {e}")
+                logger.error("    ❌ %s 스크래핑 실패: %s", agency_name, e)
                 scraped_data[agency_name] = {
                     "certifications": [],
                     "documents": [],
@@ -598,7 +587,7 @@ class RequirementsNodes:
                     "hs_code_6digit": {"urls": agency_data["6digit"]["urls"], "results": []}
                 }
         
-        print(f"\n📋 [NODE] 스크래핑 완료 - {len(scraped_data)}개 기관 처리")
+        logger.info("\n📋 [NODE] 스크래핑 완료 - %s개 기관 처리", len(scraped_data))
         
         # 🎯 웹 스크래핑 단계의 상세 metadata 수집
         scraping_metadata = {
@@ -634,7 +623,7 @@ class RequirementsNodes:
         state["detailed_metadata"] = state.get("detailed_metadata", {})
         state["detailed_metadata"].update(scraping_metadata)
         
-        print(f"📋 [METADATA] 웹 스크래핑 상세 정보 저장됨 - 인증 요건: {scraping_metadata['scraping_step']['scraping_performance']['total_certifications_found']}개, 서류: {scraping_metadata['scraping_step']['scraping_performance']['total_documents_found']}개")
+        logger.info("📋 [METADATA] 웹 스크래핑 상세 정보 저장됨 - 인증 요건: %s개, 서류: %s개", scraping_metadata['scraping_step']['scraping_performance']['total_certifications_found'], scraping_metadata['scraping_step']['scraping_performance']['total_documents_found'])
         
         # 상태 업데이트 (기존 상태 유지)
         state["scraped_data"] = scraped_data
@@ -645,7 +634,7 @@ class RequirementsNodes:
         """결과 통합 노드"""
         scraped_data = state["scraped_data"]
         
-        print(f"\n🔍 [NODE] 결과 통합 시작")
+        logger.info("\n🔍 [NODE] 결과 통합 시작")
         
         all_certifications = []
         all_documents = []
@@ -655,36 +644,36 @@ class RequirementsNodes:
             status = data.get("status", "unknown")
             
             if status == "no_urls_found":
-                print(f"  ❌ {agency}: URL 없음 (None)")
+                logger.warning("  ❌ %s: URL 없음 (None)", agency)
                 continue
             elif status == "scraping_failed":
-                print(f"  ❌ {agency}: 스크래핑 실패 (None)")
+                logger.error("  ❌ %s: 스크래핑 실패 (None)", agency)
                 continue
             elif "error" in data:
-                print(f"  ❌ {agency}: 오류로 인해 제외 (None)")
+                logger.warning("  ❌ %s: 오류로 인해 제외 (None)", agency)
                 continue
                 
-            print(f"  📊 {agency} 데이터 통합:")
+            logger.info("  📊 %s 데이터 통합:", agency)
             
             # 인증요건 통합
             certs = data.get("certifications", [])
             all_certifications.extend(certs)
-            print(f"    📋 인증요건: {len(certs)}개 추가")
+            logger.info("    📋 인증요건: %s개 추가", len(certs))
             
             # 필요서류 통합
             docs = data.get("documents", [])
             all_documents.extend(docs)
-            print(f"    📄 필요서류: {len(docs)}개 추가")
+            logger.info("    📄 필요서류: %s개 추가", len(docs))
             
             # 출처 통합
             sources = data.get("sources", [])
             all_sources.extend(sources)
-            print(f"    📚 출처: {len(sources)}개 추가")
+            logger.info("    📚 출처: %s개 추가", len(sources))
         
-        print(f"\n📋 [NODE] 통합 완료:")
-        print(f"  📋 총 인증요건: {len(all_certifications)}개")
-        print(f"  📄 총 필요서류: {len(all_documents)}개")
-        print(f"  📚 총 출처: {len(all_sources)}개")
+        logger.info("\n📋 [NODE] 통합 완료:")
+        logger.info("  📋 총 인증요건: %s개", len(all_certifications))
+        logger.info("  📄 총 필요서류: %s개", len(all_documents))
+        logger.info("  📚 총 출처: %s개", len(all_sources))
         
         consolidation_start_time = datetime.now()
         
@@ -706,7 +695,7 @@ class RequirementsNodes:
                 
                 precedents_fetch_end = datetime.now()
                 precedents_fetch_time = (precedents_fetch_end - precedents_fetch_start).total_seconds() * 1000
-                print(f"📊 FAISS DB 판례 수집 성공: {len(precedents_list)}개 판례 확인됨 ({precedents_fetch_time:.0f}ms)")
+                logger.info("📊 FAISS DB 판례 수집 성공: %s개 판례 확인됨 (%.0fms)", len(precedents_list), precedents_fetch_time)
                 
                 cbp = {
                     "hs_code": request.hs_code,
@@ -719,7 +708,7 @@ class RequirementsNodes:
                 cbp = {"error": "precedent_fetch_failed", "error_message": str(e)}
                 precedents_fetch_end = datetime.now()
                 precedents_fetch_time = (precedents_fetch_end - precedents_fetch_start).total_seconds() * 1000
-                print(f"📊 FAISS DB 판례 수집 실패: {e} ({precedents_fetch_time:.0f}ms)")
+                logger.warning("📊 FAISS DB 판례 수집 실패: %s (%.0fms)", e, precedents_fetch_time)
 
         # 하이브리드(API+웹) 결과도 통합 (Phase 2-4 포함)
         hybrid = state.get("hybrid_result") or {}
@@ -750,10 +739,10 @@ class RequirementsNodes:
                     "penalties_enforcement": len(combined.get('penalties_enforcement', [])),
                     "validity_periods": len(combined.get('validity_periods', []))
                 }
-                print(f"  📊 Phase 2-4 결과 통합:")
-                print(f"    🧪 검사 절차: {phase_2_4_counts['testing_procedures']}개")
-                print(f"    ⚖️ 처벌 정보: {phase_2_4_counts['penalties_enforcement']}개")
-                print(f"    ⏰ 유효기간: {phase_2_4_counts['validity_periods']}개")
+                logger.info("  📊 Phase 2-4 결과 통합:")
+                logger.info("    🧪 검사 절차: %s개", phase_2_4_counts['testing_procedures'])
+                logger.info("    ⚖️ 처벌 정보: %s개", phase_2_4_counts['penalties_enforcement'])
+                logger.info("    ⏰ 유효기간: %s개", phase_2_4_counts['validity_periods'])
 
         consolidation_end_time = datetime.now()
         consolidation_time = (consolidation_end_time - consolidation_start_time).total_seconds() * 1000
@@ -792,13 +781,13 @@ class RequirementsNodes:
         state["detailed_metadata"] = state.get("detailed_metadata", {})
         state["detailed_metadata"].update(consolidation_metadata)
 
-        print(f"📋 [METADATA] 결과 통합 상세 정보 저장됨 - 총 시간: {consolidation_time:.0f}ms, 최종 결과: 인증 {len(all_certifications)}개, 서류 {len(all_documents)}개")
+        logger.info("📋 [METADATA] 결과 통합 상세 정보 저장됨 - 총 시간: %.0fms, 최종 결과: 인증 %s개, 서류 %s개", consolidation_time, len(all_certifications), len(all_documents))
 
         # Citations 추출 (백엔드 API에서 제공)
         citations = []
         if hybrid and not hybrid.get("error"):
             citations = hybrid.get("citations", [])
-            print(f"  📚 Citations 추출: {len(citations)}개")
+            logger.info("  📚 Citations 추출: %s개", len(citations))
         
         # LLM 요약 생성
         llm_summary = None
@@ -836,7 +825,7 @@ class RequirementsNodes:
                     "agency": citation.get("agency", "")
                 })
             
-            print(f"  🤖 LLM 요약 생성 중... (문서 {len(raw_documents)}개)")
+            logger.info("  🤖 LLM 요약 생성 중... (문서 %s개)", len(raw_documents))
             
             # summarize_regulations 메서드 호출
             summary_result = await llm_service.summarize_regulations(
@@ -860,10 +849,10 @@ class RequirementsNodes:
                     "tokens_used": summary_result.tokens_used,
                     "cost": summary_result.cost
                 }
-                print(f"  ✅ LLM 요약 생성 완료 - 신뢰도: {summary_result.confidence_score:.2f}")
+                logger.info("  ✅ LLM 요약 생성 완료 - 신뢰도: %.2f", summary_result.confidence_score)
             
         except Exception as e:
-            print(f"  ⚠️ LLM 요약 생성 실패: {e}")
+            logger.warning("  ⚠️ LLM 요약 생성 실패: %s", e)
             import traceback
             traceback.print_exc()
             llm_summary = None
@@ -871,7 +860,7 @@ class RequirementsNodes:
         # ========================================
         # 🚀 Phase 1-4 전문 서비스 호출 (병렬 실행)
         # ========================================
-        print(f"\n🚀 [PHASE 1-4] 전문 분석 서비스 실행 시작")
+        logger.info("\n🚀 [PHASE 1-4] 전문 분석 서비스 실행 시작")
         phase_start = datetime.now()
         
         phase_1_result = None  # 세부 규정
@@ -928,16 +917,16 @@ class RequirementsNodes:
             
             # 병렬 실행 및 결과 수집
             if tasks:
-                print(f"  🔄 {len(tasks)}개 분석 태스크 병렬 실행 중...")
+                logger.info("  🔄 %s개 분석 태스크 병렬 실행 중...", len(tasks))
                 completed_tasks = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
                 
                 # 결과 할당
                 for i, (name, _) in enumerate(tasks):
                     result = completed_tasks[i]
                     if isinstance(result, Exception):
-                        print(f"  ❌ {name} 분석 실패: {result}")
+                        logger.error("  ❌ %s 분석 실패: %s", name, result)
                     else:
-                        print(f"  ✅ {name} 분석 완료 - {len(result.get('sources', []))}개 출처")
+                        logger.info("  ✅ %s 분석 완료 - %s개 출처", name, len(result.get('sources', [])))
                         if name == "detailed_regulations":
                             detailed_regs_result = result
                         elif name == "testing_procedures":
@@ -949,7 +938,7 @@ class RequirementsNodes:
             
             # 교차 검증 (모든 결과 수집 후 실행)
             if llm_summary and request:
-                print(f"  🔍 교차 검증 실행 중...")
+                logger.info("  🔍 교차 검증 실행 중...")
                 try:
                     cross_validation_result = await self.cross_validation.validate_requirements(
                         hs_code=request.hs_code,
@@ -962,15 +951,14 @@ class RequirementsNodes:
                             "validity": phase_4_result
                         }
                     )
-                    print(f"  ✅ 교차 검증 완료 - 검증점수: {cross_validation_result.validation_score:.2f}, 충돌: {len(cross_validation_result.conflicts_found)}건")
+                    logger.info("  ✅ 교차 검증 완료 - 검증점수: %.2f, 충돌: %s건", cross_validation_result.validation_score, len(cross_validation_result.conflicts_found))
                 except Exception as e:
-                    print(f"  ⚠️ 교차 검증 실패: {e}")
+                    logger.warning("  ⚠️ 교차 검증 실패: %s", e)
                     cross_validation_result = None
             
             # 💾 판례 검증 전 중간 결과 저장 (디버깅용)
             if request:
                 try:
-                    import json
                     from pathlib import Path
                     
                     # 순환 참조 방지를 위한 안전한 직렬화
@@ -1011,18 +999,17 @@ class RequirementsNodes:
                     
                     output_file = output_dir / f"intermediate_{safe_filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
                     
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        json.dump(intermediate_data, f, indent=2, ensure_ascii=False, default=str)
+                    output_file.write_bytes(_dumps_pretty(intermediate_data))
                     
-                    print(f"  💾 중간 결과 저장 완료: {output_file}")
+                    logger.info("  💾 중간 결과 저장 완료: %s", output_file)
                     
                 except Exception as e:
-                    print(f"  ⚠️ 중간 결과 저장 실패 (계속 진행): {e}")
+                    logger.warning("  ⚠️ 중간 결과 저장 실패 (계속 진행): %s", e)
             
             # 🆕 판례 기반 검증 (FAISS DB 사용) - 교차 검증과 같은 위치에서 실행
             precedent_validation_result = None
             if request and precedents_list:
-                print(f"  🔍 판례 기반 검증 실행 중...")
+                logger.info("  🔍 판례 기반 검증 실행 중...")
                 try:
                     from app.services.requirements.precedent_validation_service import get_precedent_validation_service
                     precedent_validator = get_precedent_validation_service()
@@ -1037,18 +1024,18 @@ class RequirementsNodes:
                         precedents=precedents_list
                     )
                     
-                    print(f"  ✅ 판례 검증 완료 - 점수: {precedent_validation_result.validation_score:.2f}, 판정: {precedent_validation_result.verdict['status']}")
-                    print(f"    📊 일치: {len(precedent_validation_result.matched_requirements)}개, 누락: {len(precedent_validation_result.missing_requirements)}개, Red Flags: {len(precedent_validation_result.red_flags)}개")
+                    logger.info("  ✅ 판례 검증 완료 - 점수: %.2f, 판정: %s", precedent_validation_result.validation_score, precedent_validation_result.verdict['status'])
+                    logger.info("    📊 일치: %s개, 누락: %s개, Red Flags: %s개", len(precedent_validation_result.matched_requirements), len(precedent_validation_result.missing_requirements), len(precedent_validation_result.red_flags))
                     
                 except Exception as e:
-                    print(f"  ⚠️ 판례 검증 실패: {e}")
+                    logger.warning("  ⚠️ 판례 검증 실패: %s", e)
                     import traceback
                     traceback.print_exc()
                     precedent_validation_result = None
             
             # 🚀 LLM 요약에 Phase 1-4 결과 포함하여 재생성
             if request and (detailed_regs_result or phase_2_result or phase_3_result or phase_4_result):
-                print(f"  🔄 Phase 1-4 결과를 포함한 LLM 요약 재생성...")
+                logger.info("  🔄 Phase 1-4 결과를 포함한 LLM 요약 재생성...")
                 try:
                     # Phase 1-4 결과를 raw_documents에 추가
                     phase_documents = []
@@ -1123,20 +1110,20 @@ class RequirementsNodes:
                             "phase_4_validity": phase_4_result,
                             "cross_validation": cross_validation_result
                         }
-                        print(f"  ✅ Phase 1-4 포함 LLM 요약 재생성 완료 (확장 필드 포함)")
+                        logger.info("  ✅ Phase 1-4 포함 LLM 요약 재생성 완료 (확장 필드 포함)")
                     
                 except Exception as e:
-                    print(f"  ⚠️ Phase 1-4 포함 LLM 요약 실패: {e}")
+                    logger.warning("  ⚠️ Phase 1-4 포함 LLM 요약 실패: %s", e)
                     # 실패시 기존 요약 유지
             
         except Exception as e:
-            print(f"  ❌ Phase 2-4 분석 전체 실패: {e}")
+            logger.error("  ❌ Phase 2-4 분석 전체 실패: %s", e)
             import traceback
             traceback.print_exc()
         
         phase_end = datetime.now()
         phase_duration = (phase_end - phase_start).total_seconds() * 1000
-        print(f"✅ [PHASE 2-4] 전문 분석 완료 - 소요시간: {phase_duration:.0f}ms")
+        logger.info("✅ [PHASE 2-4] 전문 분석 완료 - 소요시간: %.0fms", phase_duration)
         
         # Phase 2-4 결과를 메타데이터에 추가
         phase_metadata = {
@@ -1171,17 +1158,17 @@ class RequirementsNodes:
         state["detailed_metadata"].update(phase_metadata)
         
         # Phase 1-4 결과 디버깅 로그
-        print(f"  🔍 [DEBUG] Phase 결과 상태:")
-        print(f"    📋 Phase 1 (detailed_regulations): {'✅' if detailed_regs_result else '❌'}")
-        print(f"    🧪 Phase 2 (testing_procedures): {'✅' if phase_2_result else '❌'}")
-        print(f"    ⚖️ Phase 3 (penalties): {'✅' if phase_3_result else '❌'}")
-        print(f"    ⏰ Phase 4 (validity): {'✅' if phase_4_result else '❌'}")
-        print(f"    🔍 교차 검증 (cross_validation): {'✅' if cross_validation_result else '❌'}")
+        logger.debug("  🔍 [DEBUG] Phase 결과 상태:")
+        logger.debug("    📋 Phase 1 (detailed_regulations): %s", '✅' if detailed_regs_result else '❌')
+        logger.debug("    🧪 Phase 2 (testing_procedures): %s", '✅' if phase_2_result else '❌')
+        logger.debug("    ⚖️ Phase 3 (penalties): %s", '✅' if phase_3_result else '❌')
+        logger.debug("    ⏰ Phase 4 (validity): %s", '✅' if phase_4_result else '❌')
+        logger.debug("    🔍 교차 검증 (cross_validation): %s", '✅' if cross_validation_result else '❌')
         
         # 🎯 통합 신뢰도 계산 (판례 검증 + 교차 검증 + 출처 신뢰도)
         overall_confidence = None
         if precedent_validation_result or cross_validation_result:
-            print(f"  📊 통합 신뢰도 계산 중...")
+            logger.info("  📊 통합 신뢰도 계산 중...")
             try:
                 # 출처 신뢰도 계산
                 official_sources_count = len([s for s in all_sources if '.gov' in str(s.get('url', ''))])
@@ -1237,10 +1224,10 @@ class RequirementsNodes:
                     }
                 }
                 
-                print(f"  ✅ 통합 신뢰도: {overall_score:.2f} ({confidence_level}) - {verdict_status}")
+                logger.info("  ✅ 통합 신뢰도: %.2f (%s) - %s", overall_score, confidence_level, verdict_status)
                 
             except Exception as e:
-                print(f"  ⚠️ 통합 신뢰도 계산 실패: {e}")
+                logger.warning("  ⚠️ 통합 신뢰도 계산 실패: %s", e)
                 overall_confidence = None
         
         # 상태 업데이트 (기존 상태 유지 + citations + llm_summary + Phase 1-4 결과 + 판례 검증 추가)
@@ -1285,7 +1272,6 @@ class RequirementsNodes:
         # 💾 최종 결과 저장 (판례 검증 포함)
         if request:
             try:
-                import json
                 from pathlib import Path
                 
                 # 순환 참조 방지를 위한 안전한 직렬화
@@ -1314,13 +1300,12 @@ class RequirementsNodes:
                 # 안전하게 직렬화
                 final_data = safe_serialize(state["consolidated_results"])
                 
-                with open(output_file, "w", encoding="utf-8") as f:
-                    json.dump(final_data, f, indent=2, ensure_ascii=False, default=str)
+                output_file.write_bytes(_dumps_pretty(final_data))
                 
-                print(f"  💾 최종 결과 저장 완료: {output_file}")
+                logger.info("  💾 최종 결과 저장 완료: %s", output_file)
                 
             except Exception as e:
-                print(f"  ⚠️ 최종 결과 저장 실패 (계속 진행): {e}")
+                logger.warning("  ⚠️ 최종 결과 저장 실패 (계속 진행): %s", e)
                 import traceback
                 traceback.print_exc()
         
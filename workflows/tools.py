@@ -3,9 +3,14 @@ LangGraph Tools for Requirements Analysis
 특정 작업을 수행하는 도구들
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Awaitable, List, Mapping, Optional, Tuple, Union, TypedDict, Annotated, Final
+import functools
 import asyncio
+import logging
+import re
+import time
 import httpx
+import aiofiles
 from pathlib import Path
 import json
 try:
@@ -15,17 +20,550 @@ except ImportError:
     print("⚠️ pypdf 패키지가 설치되지 않아 PDF 읽기 기능이 비활성화됩니다.")
     PdfReader = None
     HAS_PYPDF = False
+# orjson은 선택 의존성 (설치되어 있으면 JSON 직렬화 가속, 없으면 표준 json 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from io import BytesIO
-from datetime import datetime
+from types import MappingProxyType
+from datetime import datetime, timezone
+from dataclasses import dataclass
+from collections import Counter, OrderedDict
 import importlib.util
 import sys
 from abc import ABC, abstractmethod
+from langgraph.graph import StateGraph, START, END
+from langgraph.types import Send
 from app.services.requirements.tavily_search import TavilySearchService
 from app.services.requirements.web_scraper import WebScraper
 from app.services.requirements.data_gov_api import DataGovAPIService
 from app.services.requirements.backend_api_service import get_backend_service
 from app.services.requirements.hs_code_agency_ai_mapper import get_hs_code_mapper
 from app.services.requirements.env_manager import env_manager
+from app.services.requirements.url_utils import url_host, is_official_url
+
+logger = logging.getLogger(__name__)
+
+# 요구사항 분석 휴리스틱 상수 (USD 단가, 복잡도 임계값)
+_CERT_COST_LOW = 100
+_CERT_COST_HIGH = 500
+_DOC_COST_LOW = 50
+_DOC_COST_HIGH = 200
+_COMPLETENESS_DIV = 10.0
+_MULTI_CERT_THRESHOLD = 5
+_MULTI_AGENCY_THRESHOLD = 3
+_MAX_PDF_BYTES = 20 * 1024 * 1024  # summarize_pdf 다운로드 상한
+_PDF_EXCERPT_CHARS = 1200  # summarize_pdf 발췌 길이
+_MAPPING_MISS_TTL = 300.0  # AI 매핑 실패 결과 재사용 시간(초)
+_WEB_QUERY_TIMEOUT = 8.0  # 단일 웹 검색 쿼리 상한 (초)
+_WEB_SNIPPET_CHARS = 512  # 반환 web_results에 남기는 본문 길이
+# 쿼리 키 토큰 → 카테고리 (순서대로 검사)
+_CATEGORY_KEY_TOKENS: Final[Tuple[Tuple[str, frozenset], ...]] = (
+    ("detailed_regulations", frozenset({"cosmetic", "regulations", "standards", "limits", "restrictions", "safety"})),
+    ("testing_procedures", frozenset({"testing", "inspection", "procedures", "authorization", "phase2"})),
+    ("penalties_enforcement", frozenset({"penalties", "enforcement", "violations", "recall", "phase3"})),
+    ("validity_periods", frozenset({"validity", "renewal", "duration", "period", "phase4"})),
+)
+# 카테고리별 본문 키워드 (대소문자 무시 부분 문자열 매칭 - content.lower() 복사 없이 검사)
+_CATEGORY_CONTENT_RE: Final[Dict[str, "re.Pattern[str]"]] = {
+    category: re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+    for category, keywords in {
+        "basic_requirements": ("import", "requirements", "regulations", "compliance", "standards"),
+        "detailed_regulations": ("regulation", "standard", "limit", "restriction"),
+        "testing_procedures": ("test", "inspection", "procedure", "authorization"),
+        "penalties_enforcement": ("penalty", "enforcement", "violation", "fine"),
+        "validity_periods": ("validity", "renewal", "duration", "period"),
+    }.items()
+}
+# 카테고리 → (추출 대상 키, 이름 라벨, 설명 라벨, required 값 - None이면 필드 생략)
+_CATEGORY_EXTRACTORS: Final[Dict[str, Tuple[str, str, str, Optional[bool]]]] = {
+    "basic_requirements": ("certifications", "수입 요구사항", "수입 요구사항", True),
+    "detailed_regulations": ("detailed_regulations", "세부 규정", "세부 규정", None),
+    "testing_procedures": ("testing_procedures", "검사 절차", "검사 절차", None),
+    "penalties_enforcement": ("penalties_enforcement", "처벌 정보", "처벌 정보", None),
+    "validity_periods": ("validity_periods", "유효기간", "유효기간 정보", None),
+}
+# 카테고리별 통계 → 웹 추출 결과 키 (기본 요구사항은 인증요건 수로 집계)
+_CATEGORY_STAT_KEYS: Final = (
+    ("basic_requirements", "certifications"),
+    ("detailed_regulations", "detailed_regulations"),
+    ("testing_procedures", "testing_procedures"),
+    ("penalties_enforcement", "penalties_enforcement"),
+    ("validity_periods", "validity_periods"),
+)
+_HTTP_URL_RE = re.compile(r"^https?://", re.IGNORECASE)
+_PRODUCT_KEYWORDS = (
+    "vitamin", "serum", "cream", "extract", "ginseng", "rice", "noodle",
+    "kimchi", "snack", "perfume", "cosmetic", "supplement", "food",
+    "electronic", "device", "toy", "clothing", "textile"
+)
+# 전방탐색 캡처로 겹치는 매치까지 수집 (기존 `keyword in text` 부분 문자열 검사와 동일)
+_PRODUCT_KEYWORD_RE = re.compile("(?=(" + "|".join(map(re.escape, _PRODUCT_KEYWORDS)) + "))")
+# 공백 기준 4자 이상 단어 (str.split() + len > 3 과 동일 - 루프를 re 엔진에서 처리)
+_LONG_WORD_RE = re.compile(r"\S{4,}")
+_KEYWORD_STOPWORDS = frozenset({"premium", "korean", "instant", "pack"})
+_CRITICAL_LEVELS = frozenset({"critical", "high-critical", "mandatory-critical"})
+
+
+@dataclass(slots=True)
+class AnalysisResult:
+    """요구사항 분석 결과 (analyze_requirements 반환 스키마)"""
+    total_certifications: int
+    total_documents: int
+    total_sources: int
+    agency_stats: Dict[str, int]
+    high_priority_count: int
+    required_docs_count: int
+    quality_metrics: Dict[str, Any]
+    cost_analysis: Dict[str, Any]
+    risk_analysis: Dict[str, Any]
+    analysis_complete: bool = True
+
+    def as_dict(self) -> Dict[str, Any]:
+        """워크플로우 상태/응답용 dict 변환 (asdict의 재귀 deepcopy 없이 얕은 변환)"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass(slots=True)
+class WebRequirement:
+    """웹 검색 결과에서 추출한 요구사항 (통합 단계에서 dict로 변환)"""
+    name: str
+    required: Optional[bool]
+    description: str
+    agency: str
+    url: str
+    confidence: float
+    source_type: str
+
+    def as_dict(self) -> Dict[str, Any]:
+        """응답용 dict 변환 (required는 기본 요구사항에만 포함)"""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        if self.required is None:
+            del data["required"]
+        return data
+
+
+@dataclass(slots=True)
+class WebSource:
+    """웹 검색 출처 정보"""
+    title: str
+    url: str
+    type: str
+    relevance: str
+    agency: str
+    category: str
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _freeze_table(table: Dict[str, Dict[str, List[str]]]) -> Mapping[str, Mapping[str, Tuple[str, ...]]]:
+    """공유 조회 테이블을 읽기 전용으로 고정 (내부 list → tuple, dict → MappingProxyType)"""
+    return MappingProxyType({
+        key: MappingProxyType({field: tuple(values) for field, values in entry.items()})
+        for key, entry in table.items()
+    })
+
+
+# HS 코드(4자리) 기반 정부기관 매핑 (하드코딩, 모든 인스턴스가 공유, 읽기 전용)
+_HS_CODE_AGENCY_MAPPING: Final[Mapping[str, Mapping[str, Tuple[str, ...]]]] = _freeze_table({
+    # 화장품 및 미용 제품 (33xx)
+    "3304": {
+        "primary_agencies": ["FDA", "CPSC"],
+        "secondary_agencies": ["FTC"],
+        "search_keywords": ["cosmetic", "skincare", "beauty", "serum", "cream"],
+        "requirements": ["cosmetic registration", "ingredient safety", "labeling compliance", "consumer safety"]
+    },
+    "3307": {
+        "primary_agencies": ["FDA"],
+        "secondary_agencies": ["DOT"],  # 운송 관련 (알코올 함유)
+        "search_keywords": ["perfume", "toilet water", "fragrance", "alcohol"],
+        "requirements": ["cosmetic registration", "alcohol content", "shipping requirements"]
+    },
+    
+    # 식품 및 건강보조식품 (21xx, 19xx, 20xx)
+    "2106": {
+        "primary_agencies": ["FDA"],
+        "secondary_agencies": ["USDA"],
+        "search_keywords": ["dietary supplement", "ginseng", "extract", "health"],
+        "requirements": ["prior notice", "DSHEA compliance", "cGMP", "health claims"]
+    },
+    "1904": {
+        "primary_agencies": ["FDA"],
+        "secondary_agencies": ["USDA"],
+        "search_keywords": ["rice", "cereal", "prepared food", "instant"],
+        "requirements": ["prior notice", "nutritional labeling", "allergen declaration"]
+    },
+    "1905": {
+        "primary_agencies": ["FDA"],
+        "secondary_agencies": ["USDA"],
+        "search_keywords": ["snack", "cracker", "cookie", "baker"],
+        "requirements": ["prior notice", "nutritional labeling", "FALCPA", "inspection"]
+    },
+    "1902": {
+        "primary_agencies": ["FDA"],
+        "secondary_agencies": ["USDA"],
+        "search_keywords": ["pasta", "noodle", "instant", "ramen"],
+        "requirements": ["prior notice", "nutritional labeling", "allergen", "sodium"]
+    },
+    "2005": {
+        "primary_agencies": ["FDA"],
+        "secondary_agencies": ["USDA"],
+        "search_keywords": ["vegetable", "kimchi", "fermented", "preserved"],
+        "requirements": ["prior notice", "HARPC", "acidified foods", "refrigeration"]
+    },
+    
+    # 전자제품 및 통신 (84xx, 85xx)
+    "8471": {
+        "primary_agencies": ["FCC"],
+        "secondary_agencies": ["CPSC"],
+        "search_keywords": ["computer", "electronic", "device", "equipment"],
+        "requirements": ["device authorization", "EMC", "safety standards"]
+    },
+    "8517": {
+        "primary_agencies": ["FCC"],
+        "secondary_agencies": ["CPSC"],
+        "search_keywords": ["telephone", "communication", "wireless", "radio"],
+        "requirements": ["equipment authorization", "radio frequency", "EMC"]
+    },
+    
+    # 의류 및 섬유 (61xx, 62xx)
+    "6109": {
+        "primary_agencies": ["CPSC"],
+        "secondary_agencies": ["FTC"],
+        "search_keywords": ["t-shirt", "clothing", "textile", "garment"],
+        "requirements": ["flammability", "care labeling", "fiber content"]
+    },
+    
+    # 장난감 및 어린이 제품 (95xx)
+    "9503": {
+        "primary_agencies": ["CPSC"],
+        "secondary_agencies": ["FDA"],
+        "search_keywords": ["toy", "children", "play", "game"],
+        "requirements": ["safety standards", "lead content", "small parts", "age grading"]
+    }
+})
+
+# 기관별 도메인 매핑
+_AGENCY_DOMAINS: Final[Mapping[str, str]] = MappingProxyType({
+    "FDA": "fda.gov",
+    "FCC": "fcc.gov", 
+    "CBP": "cbp.gov",
+    "USDA": "usda.gov",
+    "EPA": "epa.gov",
+    "CPSC": "cpsc.gov",
+    "KCS": "customs.go.kr",  # 한국 관세청
+    "MFDS": "mfds.go.kr",    # 식품의약품안전처
+    "MOTIE": "motie.go.kr"   # 산업통상자원부
+})
+
+# 기관별 WebScraper 스크래핑 메서드 이름
+_SCRAPER_METHODS: Final[Mapping[str, str]] = MappingProxyType({
+    agency: f"scrape_{agency.lower()}_requirements" for agency in _AGENCY_DOMAINS
+})
+
+
+# 검색 쿼리 템플릿: (키 템플릿, 쿼리 템플릿)
+# {A}=기관, {al}=기관 소문자, {pn}=상품명, {hs}=HS 코드, {kw}=키워드
+_HS_BASE_QUERY_TEMPLATES: Final[List[Tuple[str, str]]] = [
+    ("{A}_hs_requirements", "site:{al}.gov import requirements {pn} HS {hs}"),
+]
+# 기관별 특화 템플릿: (게이트, 키 템플릿, 쿼리 템플릿) - 게이트가 있으면 매핑의 search_keywords에 포함될 때만 사용
+_HS_AGENCY_QUERY_TEMPLATES: Final[Dict[str, List[Tuple[Optional[str], str, str]]]] = {
+    "FDA": [
+        ("cosmetic", "{A}_hs_cosmetic", "site:{al}.gov cosmetic regulations HS {hs} ingredient safety"),
+        ("food", "{A}_hs_food", "site:{al}.gov food import requirements HS {hs} prior notice"),
+        ("supplement", "{A}_hs_supplement", "site:{al}.gov dietary supplement requirements HS {hs} DSHEA"),
+    ],
+    "USDA": [
+        (None, "{A}_hs_agricultural", "site:{al}.gov agricultural import requirements HS {hs}"),
+        (None, "{A}_hs_organic", "site:{al}.gov organic certification HS {hs}"),
+    ],
+    "EPA": [
+        (None, "{A}_hs_chemical", "site:{al}.gov chemical regulations HS {hs}"),
+        (None, "{A}_hs_environmental", "site:{al}.gov environmental standards HS {hs}"),
+    ],
+    "FCC": [
+        (None, "{A}_hs_device", "site:{al}.gov device authorization HS {hs}"),
+        (None, "{A}_hs_emc", "site:{al}.gov EMC electromagnetic compatibility HS {hs}"),
+    ],
+    "CPSC": [
+        (None, "{A}_hs_safety", "site:{al}.gov safety standards HS {hs}"),
+        (None, "{A}_hs_recall", "site:{al}.gov recall information HS {hs}"),
+    ],
+}
+_KEYWORD_QUERY_TEMPLATES: Final[Dict[str, str]] = {
+    **dict.fromkeys(["vitamin", "serum", "cream", "cosmetic"], "site:{al}.gov cosmetic regulations {kw} import requirements"),
+    **dict.fromkeys(["ginseng", "extract", "supplement"], "site:{al}.gov dietary supplement {kw} import requirements"),
+    **dict.fromkeys(["rice", "noodle", "kimchi", "food"], "site:{al}.gov food import requirements {kw}"),
+    **dict.fromkeys(["electronic", "device"], "site:{al}.gov device authorization {kw}"),
+    **dict.fromkeys(["toy", "clothing", "textile"], "site:{al}.gov safety standards {kw}"),
+}
+_FULLNAME_QUERY_TEMPLATES: Final[List[Tuple[str, str]]] = [
+    ("{A}_fullname_import", 'site:{al}.gov "{pn}" import requirements'),
+    ("{A}_fullname_regulations", 'site:{al}.gov "{pn}" regulations compliance'),
+]
+_PHASE_QUERY_TEMPLATES: Final[List[Tuple[str, str]]] = [
+    # Phase 2: 검사 절차 및 방법
+    ("{A}_phase2_testing", "site:{al}.gov testing procedures {pn} HS {hs}"),
+    ("{A}_phase2_inspection", "site:{al}.gov inspection methods {pn} HS {hs}"),
+    ("{A}_phase2_authorization", "site:{al}.gov authorization procedures {pn} HS {hs}"),
+    # Phase 3: 처벌 및 벌금 정보
+    ("{A}_phase3_penalties", "site:{al}.gov penalties violations {pn} HS {hs}"),
+    ("{A}_phase3_enforcement", "site:{al}.gov enforcement actions {pn} HS {hs}"),
+    ("{A}_phase3_fines", "site:{al}.gov civil penalties {pn} HS {hs}"),
+    # Phase 4: 유효기간 및 갱신 정보
+    ("{A}_phase4_validity", "site:{al}.gov certificate validity period {pn} HS {hs}"),
+    ("{A}_phase4_renewal", "site:{al}.gov certification renewal {pn} HS {hs}"),
+    ("{A}_phase4_duration", "site:{al}.gov permit duration {pn} HS {hs}"),
+]
+
+
+def _render_queries(templates: List[Tuple[str, str]], ctx: Dict[str, str]) -> Dict[str, str]:
+    """(키 템플릿, 쿼리 템플릿) 목록을 컨텍스트로 채워 {키: 쿼리} 생성"""
+    return {key.format_map(ctx): query.format_map(ctx) for key, query in templates}
+
+
+def _project_web_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """반환용 검색 결과 경량화 (추출이 끝난 뒤 url/title/score/snippet만 유지)"""
+    return {
+        "url": result.get("url"),
+        "title": result.get("title"),
+        "score": result.get("score"),
+        "snippet": (result.get("content") or "")[:_WEB_SNIPPET_CHARS],
+    }
+
+
+def _dedupe_queries(queries: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """정규화(소문자/공백 축약)한 쿼리 문자열이 같으면 한 번만 검색 - (고유 쿼리, 중복 키 -> 대표 키) 반환"""
+    canonical: Dict[str, str] = {}
+    unique: Dict[str, str] = {}
+    aliases: Dict[str, str] = {}
+    for key, query in queries.items():
+        norm = " ".join(query.lower().split())
+        first = canonical.setdefault(norm, key)
+        if first == key:
+            unique[key] = query
+        else:
+            aliases[key] = first
+    return unique, aliases
+
+
+@functools.lru_cache(maxsize=2048)
+def _extract_product_keywords(product_name: str, product_description: str = "") -> Tuple[str, ...]:
+    """상품명/설명 키워드 추출 (순수 함수 - 결과는 불변 튜플로 캐시)"""
+    name_lower = product_name.lower()
+    # 상품명/설명에서 키워드 추출 (단일 패스 스캔, dict 키로 중복 제거 - 등장 순서 유지)
+    keywords = dict.fromkeys(_PRODUCT_KEYWORD_RE.findall(f"{name_lower} {product_description.lower()}"))
+    
+    # 상품명에서 직접 추출 (이미 찾은 키워드는 불용어 검사 생략)
+    keywords.update(dict.fromkeys(
+        word for word in _LONG_WORD_RE.findall(name_lower)
+        if word not in keywords and word not in _KEYWORD_STOPWORDS
+    ))
+    
+    # 순서가 실행마다 같아야 상위 키워드 기반 쿼리(keywords[:3])가 재현됨
+    return tuple(keywords)
+
+
+# HS 챕터 그룹 (기본 기관 추론용)
+_FOOD_CHAPTERS = frozenset(f"{chapter:02d}" for chapter in range(1, 25))
+_CHEMICAL_CHAPTERS = frozenset(f"{chapter:02d}" for chapter in range(28, 39))
+
+
+@functools.lru_cache(maxsize=128)
+def _infer_agencies_for_chapter(hs_chapter: str) -> Tuple[str, ...]:
+    """HS 챕터(앞 2자리)별 기본 기관 추론"""
+    if hs_chapter in _FOOD_CHAPTERS:
+        # 농식품 (01-24장)
+        return ("FDA", "USDA")
+    if hs_chapter in _CHEMICAL_CHAPTERS:
+        # 화학제품 (28-38장)
+        return ("FDA", "EPA")
+    if hs_chapter in ("84", "85", "90"):
+        # 전기전자 (84, 85, 90장)
+        return ("FCC", "EPA")
+    if hs_chapter in ("94", "95"):
+        # 가구, 완구 (94, 95장)
+        return ("CPSC",)
+    # 기타 - 최소 3개 기관
+    return ("FDA", "EPA", "CBP")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_cbp_collector_class():
+    """precedents-analysis/cbp_scraper.py의 CBPDataCollector 클래스를 동적 로드한다."""
+    try:
+        # 이미 로드된 모듈이 있으면 파일 조회/스펙 생성 생략
+        module = sys.modules.get("cbp_scraper")
+        if module is None:
+            base_dir = Path(__file__).resolve().parents[1]  # ai-engine/app
+            project_root = base_dir.parent  # ai-engine
+            target_path = project_root / "precedents-analysis" / "cbp_scraper.py"
+            if not target_path.exists():
+                return None
+            spec = importlib.util.spec_from_file_location("cbp_scraper", str(target_path))
+            if spec is None or spec.loader is None:
+                return None
+            module = importlib.util.module_from_spec(spec)
+            sys.modules["cbp_scraper"] = module
+            spec.loader.exec_module(module)
+        return getattr(module, "CBPDataCollector", None)
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_cbp_collector():
+    """CBPDataCollector 싱글톤 (메모리 캐시를 모든 RequirementsTools 인스턴스가 공유)"""
+    collector_cls = _load_cbp_collector_class()
+    return collector_cls() if collector_cls else None
+
+
+def _extract_pdf_excerpt(data: BytesIO, max_pages: int, max_chars: int) -> Tuple[int, str]:
+    """PDF 앞부분 발췌 (asyncio.to_thread에서 실행) - 발췌 길이를 넘으면 이후 페이지 추출 생략"""
+    reader = PdfReader(data)
+    num_pages = min(len(reader.pages), max_pages)
+    parts: List[str] = []
+    length = -1  # 줄바꿈 구분자 포함 누적 길이
+    pages_read = 0
+    for i in range(num_pages):
+        pages_read += 1
+        try:
+            text = (reader.pages[i].extract_text() or "").strip()
+        except Exception:
+            continue
+        if text:
+            parts.append(text)
+            length += len(text) + 1
+            if length > max_chars:
+                break
+    combined = "\n".join(parts)
+    return pages_read, (combined[:max_chars] + "…") if len(combined) > max_chars else combined
+
+
+def _json_default(obj: Any) -> Any:
+    """json.dumps 보조 변환 (set → 정렬된 list)"""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+async def _read_cache(path: Path) -> Optional[str]:
+    """로컬 캐시 파일 비동기 읽기 (없으면 None)"""
+    try:
+        async with aiofiles.open(path, "r", encoding="utf-8") as f:
+            return await f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """JSONL 한 줄 직렬화 (orjson이 있으면 사용, 없으면 표준 json)"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, default=_json_default) + "\n").encode("utf-8")
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """JSON 역직렬화 (orjson이 있으면 사용, 없으면 표준 json)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _parse_reference_lines(raw: Optional[str]) -> Dict[str, Any]:
+    """JSONL 참고 링크 저장소 파싱 (한 줄에 {key: payload}, 같은 키는 마지막 줄 우선)"""
+    store: Dict[str, Any] = {}
+    for line in (raw or "").splitlines():
+        if not line.strip():
+            continue
+        try:
+            store.update(_json_loads(line))
+        except json.JSONDecodeError:
+            # 중단된 append로 잘린 줄은 건너뜀
+            continue
+    return store
+
+
+def _is_agency_url(agency: str, url: Any) -> bool:
+    """URL 호스트가 기관 도메인(또는 그 하위 도메인)인지 검사 (미등록 기관은 False)"""
+    domain = _AGENCY_DOMAINS.get(agency.split("_")[0])
+    if not domain or not isinstance(url, str) or not _HTTP_URL_RE.match(url):
+        return False
+    host = url_host(url)
+    return host == domain or host.endswith("." + domain)
+
+
+def _validate_legacy_references(legacy: Dict[str, Any]) -> Dict[str, Any]:
+    """이관할 기존 저장소 항목 검증 - 기관 도메인에 속하지 않는 URL은 버리고, URL이 남지 않은 항목은 제외"""
+    valid: Dict[str, Any] = {}
+    for key, payload in legacy.items():
+        agencies = payload.get("agencies") if isinstance(payload, dict) else None
+        if not isinstance(agencies, dict):
+            continue
+        kept = {}
+        for agency, entry in agencies.items():
+            urls = entry.get("urls") if isinstance(entry, dict) else None
+            urls = [url for url in urls or () if _is_agency_url(agency, url)]
+            if urls:
+                kept[agency] = {"urls": urls}
+        if kept:
+            valid[key] = {**payload, "agencies": kept}
+    return valid
+
+
+def _append_bytes(path: Path, data: bytes) -> None:
+    """파일 끝에 UTF-8 바이트 추가 (asyncio.to_thread에서 실행)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("ab+") as f:
+        # 이전 append가 중간에 끊겨 줄바꿈 없이 끝났으면 새 줄에서 시작
+        if f.seek(0, 2):
+            f.seek(-1, 2)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.write(data)
+
+
+def _replace_bytes(path: Path, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 교체 (asyncio.to_thread에서 실행, 중간 실패 시 기존 파일 유지)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify_query_key(query_key: str) -> Tuple[str, str, str]:
+    """웹 검색 쿼리 키 → (기관, 카테고리, 검색 유형)"""
+    # 쿼리 키는 '<기관>_<유형>_<주제>' 형식 → 토큰 집합 교집합으로 분류
+    parts = query_key.split("_")
+    tokens = set(parts)
+    search_type = "hs_code" if "hs" in tokens else "keyword"
+    
+    # 쿼리 키워드 기반 카테고리 분류 (Phase 1-4, 앞선 카테고리 우선)
+    category = next(
+        (name for name, keys in _CATEGORY_KEY_TOKENS if not tokens.isdisjoint(keys)),
+        "basic_requirements"
+    )
+    
+    # 기관 추출
+    return parts[0].upper(), category, search_type
+
+
+def _merge_dicts(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+    """병렬 노드 결과 병합 리듀서"""
+    merged = dict(left or {})
+    merged.update(right or {})
+    return merged
+
+
+class _WebSearchState(TypedDict):
+    """웹 검색 서브그래프 상태"""
+    queries: Dict[str, str]
+    target_confidence: float
+    web_results: Annotated[Dict[str, Any], _merge_dicts]
 
 
 class SearchProvider(ABC):
@@ -50,12 +588,9 @@ class TavilyProvider(SearchProvider):
         self.service = TavilySearchService()
     
     async def search(self, query: str, **kwargs) -> List[Dict[str, Any]]:
-        try:
-            results = await self.service.search(query, **kwargs)
-            return results if results else []
-        except Exception as e:
-            print(f"❌ Tavily 검색 실패: {e}")
-            return []
+        # 실패를 빈 결과로 삼키지 않고 전파 (호출 측 서킷 브레이커가 장애를 감지하도록)
+        results = await self.service.search(query, raise_errors=True, **kwargs)
+        return results if results else []
     
     @property
     def provider_name(self) -> str:
@@ -66,7 +601,7 @@ class DisabledProvider(SearchProvider):
     """검색 비활성화 프로바이더 (Tavily 432 에러 시 사용)"""
     
     async def search(self, query: str, **kwargs) -> List[Dict[str, Any]]:
-        print(f"🔇 검색 비활성화 모드: '{query}' 스킵됨")
+        logger.info("🔇 검색 비활성화 모드: '%s' 스킵됨", query)
         return []
     
     @property
@@ -74,154 +609,243 @@ class DisabledProvider(SearchProvider):
         return "disabled"
 
 
+class _CircuitBreaker:
+    """연속 실패 시 일정 시간 호출 차단 (프로바이더 장애 시 쿼리마다 타임아웃 대기 방지)"""
+    
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = 0.0
+        # 반개방 상태의 시험 호출 진행 여부 (결과가 나올 때까지 다른 호출은 차단)
+        self.probing = False
+    
+    def admit(self) -> Tuple[bool, bool]:
+        """(호출 허용 여부, 이번 호출이 반개방 시험 호출인지)"""
+        if self.failures < self.threshold:
+            return True, False
+        if not self.probing and time.monotonic() - self.opened_at >= self.cooldown:
+            # 대기 시간 경과 → 시험 호출 1건만 허용
+            self.probing = True
+            return True, True
+        return False, False
+    
+    def allow(self) -> bool:
+        return self.admit()[0]
+    
+    def release_probe(self) -> None:
+        """결과 없이 끝난(취소된) 시험 호출 해제 - 다음 호출이 다시 시험"""
+        self.probing = False
+    
+    def record_success(self) -> None:
+        self.failures = 0
+        self.probing = False
+    
+    def record_failure(self, probe: bool = False) -> bool:
+        """실패 기록 (이번 실패로 차단이 시작되면 True)"""
+        if probe:
+            # 시험 호출 실패 → 대기 시간부터 다시 차단
+            self.probing = False
+            self.opened_at = time.monotonic()
+            return True
+        self.failures += 1
+        if self.failures == self.threshold:
+            self.opened_at = time.monotonic()
+            return True
+        return False
+
+
+class CachedSearchProvider(SearchProvider):
+    """검색 결과 TTL/LRU 캐시 프로바이더 (동일 쿼리 중복 API 호출 방지)"""
+    
+    def __init__(self, provider: SearchProvider, ttl: float = 6 * 3600, max_entries: int = 2048):
+        self.provider = provider
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[tuple, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        # 동일 키 동시 요청은 한 번만 조회 (나머지는 락 대기 후 캐시 사용)
+        self._locks: Dict[tuple, asyncio.Lock] = {}
+    
+    def _get_fresh(self, key: tuple) -> Optional[List[Dict[str, Any]]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > self.ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return list(entry[1])
+    
+    @staticmethod
+    def _key(query: str, kwargs: Dict[str, Any]) -> tuple:
+        return (query.strip().lower(), tuple(sorted(kwargs.items())))
+    
+    def cached(self, query: str, **kwargs) -> Optional[List[Dict[str, Any]]]:
+        """캐시된 결과만 조회 (프로바이더 호출 없음, 없거나 만료면 None)"""
+        return self._get_fresh(self._key(query, kwargs))
+    
+    async def search(self, query: str, **kwargs) -> List[Dict[str, Any]]:
+        key = self._key(query, kwargs)
+        cached = self._get_fresh(key)
+        if cached is not None:
+            return cached
+        
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._get_fresh(key)
+            if cached is not None:
+                return cached
+            try:
+                results = await self.provider.search(query, **kwargs)
+            finally:
+                self._locks.pop(key, None)
+            # 빈 결과는 실패(에러 시 [] 반환)일 수 있으므로 캐시하지 않음
+            if results:
+                self._cache[key] = (time.monotonic(), results)
+                if len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+            return list(results or [])
+    
+    async def aclose(self) -> None:
+        provider_close = getattr(self.provider, "aclose", None)
+        if provider_close:
+            await provider_close()
+    
+    @property
+    def provider_name(self) -> str:
+        return self.provider.provider_name
+
+
 class RequirementsTools:
     """요구사항 분석을 위한 LangGraph 도구들"""
     
-    def __init__(self, search_provider: Optional[SearchProvider] = None):
+    def __init__(self, search_provider: Optional[SearchProvider] = None, search_concurrency: Optional[int] = None):
         # 환경변수 관리자를 통한 검색 프로바이더 설정
         provider_config = env_manager.get_search_provider_config()
         
         if provider_config['provider'] == "disabled" or not provider_config['is_available']:
             self.search_provider = DisabledProvider()
-            print(f"🔇 검색 프로바이더: {provider_config['provider']} (API 키 없음)")
+            logger.info("🔇 검색 프로바이더: %s (API 키 없음)", provider_config['provider'])
         else:
             self.search_provider = TavilyProvider()
-            print(f"✅ 검색 프로바이더: {provider_config['provider']} (API 키 있음)")
+            logger.info("✅ 검색 프로바이더: %s (API 키 있음)", provider_config['provider'])
         
         # 외부에서 제공된 프로바이더가 있으면 사용
         if search_provider:
             self.search_provider = search_provider
+        # 실제 검색 프로바이더는 결과 캐시로 감쌈
+        if not isinstance(self.search_provider, (DisabledProvider, CachedSearchProvider)):
+            self.search_provider = CachedSearchProvider(self.search_provider)
+        # 웹 검색 동시 요청 상한 (프로바이더 rate limit 보호, 모든 검색 경로가 공유)
+        self.search_concurrency = search_concurrency or env_manager.get_setting('SEARCH_CONCURRENCY', 8)
+        self.search_semaphore = asyncio.Semaphore(self.search_concurrency)
+        self._search_breaker = _CircuitBreaker()
             
         # HS 코드 기반 기관 매핑
-        self.hs_code_agency_mapping = self._build_hs_code_mapping()
+        self.hs_code_agency_mapping = _HS_CODE_AGENCY_MAPPING
+        
+        # 기관별 도메인 매핑
+        self.agency_domains = _AGENCY_DOMAINS
+        # 기관별 기본 URL (검색 실패 시 폴백)
+        self.default_agency_urls = {agency: f"https://www.{domain}" for agency, domain in self.agency_domains.items()}
+        # 기관 커버리지 계산용 (기관 추가 시 자동 반영)
+        self._inv_n_agencies = 1.0 / len(self.agency_domains)
+        # 기관별 (도메인, ".도메인") - URL 호스트명 필터링용
+        self._agency_hosts = {agency: (domain, "." + domain) for agency, domain in self.agency_domains.items()}
             
+        # 공유 HTTP 커넥션 풀 (요청마다 TLS 핸드셰이크/DNS 조회 반복 방지)
+        # 다기관 동시 스크래핑 기준: 전체 100 연결, 유휴 keep-alive 20개를 5분간 유지
+        self._http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=15.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=300.0)
+        )
+        
         # API 키 예외 처리
         try:
-            self.web_scraper = WebScraper()
+            self.web_scraper = WebScraper(client=self._http_client)
         except Exception as e:
-            print(f"⚠️ WebScraper 초기화 실패: {e}")
+            logger.warning("⚠️ WebScraper 초기화 실패: %s", e)
             self.web_scraper = None
         
         try:
             self.data_gov_api = DataGovAPIService()
         except Exception as e:
-            print(f"⚠️ DataGovAPIService 초기화 실패: {e}")
+            logger.warning("⚠️ DataGovAPIService 초기화 실패: %s", e)
             self.data_gov_api = None
         
         # 백엔드 API 서비스 (새로운 통합 방식)
         try:
             self.backend_api = get_backend_service()
         except Exception as e:
-            print(f"⚠️ BackendAPIService 초기화 실패: {e}")
+            logger.warning("⚠️ BackendAPIService 초기화 실패: %s", e)
             self.backend_api = None
         
         try:
             self.precedent_collector = self._init_cbp_collector()
         except Exception as e:
-            print(f"⚠️ CBP Collector 초기화 실패: {e}")
+            logger.warning("⚠️ CBP Collector 초기화 실패: %s", e)
             self.precedent_collector = None
         
-        self.references_store_path = Path("reference_links.json")
+        # 참고 링크 저장소 (append-only JSONL + 메모리 인덱스) - 실행 위치(CWD)가 아닌 설정된 데이터 디렉토리 기준
+        data_dir = Path(env_manager.get_setting('DATA_DIR'))
+        self.references_store_path = data_dir / "reference_links.jsonl"
+        self.legacy_references_path = data_dir / "reference_links.json"  # 이전 단일 JSON 저장소 (최초 로드 시 이관)
+        self._refs_lines = 0  # 파일의 줄 수 (압축 시점 판단용)
+        self._refs: Optional[Dict[str, Any]] = None
+        self._refs_pending: Dict[str, Any] = {}
+        self._refs_lock = asyncio.Lock()
+        
+        # 백엔드 AI 매핑 캐시 ((HS 코드, 상품명) → 매핑, LRU) + 동시 조회 병합용 키별 락
+        self._mapping_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._mapping_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        # 매핑 실패 키 → 실패 시각 (TTL 동안 백엔드 재조회/재생성 생략)
+        self._mapping_misses: Dict[Tuple[str, str], float] = {}
+        
+        # 하이브리드 웹 검색 서브그래프 (쿼리별 병렬 노드)
+        self._web_search_graph = self._build_web_search_graph()
         
         # API 상태 로깅
         api_status = env_manager.get_api_status_summary()
-        print(f"📊 API 상태 요약: {api_status['available_api_keys']}/{api_status['total_api_keys']}개 키 사용 가능")
+        logger.info("📊 API 상태 요약: %s/%s개 키 사용 가능", api_status['available_api_keys'], api_status['total_api_keys'])
         if api_status['missing_keys']:
-            print(f"⚠️ 누락된 API 키: {', '.join(api_status['missing_keys'])}")
+            logger.warning("⚠️ 누락된 API 키: %s", ', '.join(api_status['missing_keys']))
     
-    def get_api_status(self) -> Dict[str, Any]:
-        """API 키 상태 반환"""
+    async def aclose(self) -> None:
+        """미기록 참고 링크 저장 후 공유 HTTP 커넥션 풀 종료 (애플리케이션 종료 시 호출)"""
+        await self.flush_references()
+        await self._http_client.aclose()
+        provider_close = getattr(self.search_provider, "aclose", None)
+        if provider_close:
+            await provider_close()
+    
+    @functools.cached_property
+    def api_status(self) -> Dict[str, Any]:
+        """API 키 상태 (프로세스 수명 동안 불변 - 최초 조회 시 1회 계산)"""
         return env_manager.get_api_status_summary()
     
-    def validate_dependencies(self) -> Dict[str, bool]:
-        """필수 의존성 검증"""
-        validation = {
+    @functools.cached_property
+    def dependencies(self) -> Dict[str, bool]:
+        """필수 의존성 상태 (초기화 이후 불변 - 최초 조회 시 1회 계산)"""
+        return {
             'search_provider': self.search_provider.provider_name != 'disabled',
             'web_scraper': self.web_scraper is not None,
             'data_gov_api': self.data_gov_api is not None,
             'cbp_collector': self.precedent_collector is not None
         }
-        return validation
-    def _build_hs_code_mapping(self) -> Dict[str, Dict[str, Any]]:
-        """HS 코드 기반 정부기관 매핑 구축"""
-        return {
-            # 화장품 및 미용 제품 (33xx)
-                    "3304": {
-                        "primary_agencies": ["FDA", "CPSC"],
-                        "secondary_agencies": ["FTC"],
-                        "search_keywords": ["cosmetic", "skincare", "beauty", "serum", "cream"],
-                        "requirements": ["cosmetic registration", "ingredient safety", "labeling compliance", "consumer safety"]
-                    },
-            "3307": {
-                "primary_agencies": ["FDA"],
-                "secondary_agencies": ["DOT"],  # 운송 관련 (알코올 함유)
-                "search_keywords": ["perfume", "toilet water", "fragrance", "alcohol"],
-                "requirements": ["cosmetic registration", "alcohol content", "shipping requirements"]
-            },
-            
-            # 식품 및 건강보조식품 (21xx, 19xx, 20xx)
-            "2106": {
-                "primary_agencies": ["FDA"],
-                "secondary_agencies": ["USDA"],
-                "search_keywords": ["dietary supplement", "ginseng", "extract", "health"],
-                "requirements": ["prior notice", "DSHEA compliance", "cGMP", "health claims"]
-            },
-            "1904": {
-                "primary_agencies": ["FDA"],
-                "secondary_agencies": ["USDA"],
-                "search_keywords": ["rice", "cereal", "prepared food", "instant"],
-                "requirements": ["prior notice", "nutritional labeling", "allergen declaration"]
-            },
-            "1905": {
-                "primary_agencies": ["FDA"],
-                "secondary_agencies": ["USDA"],
-                "search_keywords": ["snack", "cracker", "cookie", "baker"],
-                "requirements": ["prior notice", "nutritional labeling", "FALCPA", "inspection"]
-            },
-            "1902": {
-                "primary_agencies": ["FDA"],
-                "secondary_agencies": ["USDA"],
-                "search_keywords": ["pasta", "noodle", "instant", "ramen"],
-                "requirements": ["prior notice", "nutritional labeling", "allergen", "sodium"]
-            },
-            "2005": {
-                "primary_agencies": ["FDA"],
-                "secondary_agencies": ["USDA"],
-                "search_keywords": ["vegetable", "kimchi", "fermented", "preserved"],
-                "requirements": ["prior notice", "HARPC", "acidified foods", "refrigeration"]
-            },
-            
-            # 전자제품 및 통신 (84xx, 85xx)
-            "8471": {
-                "primary_agencies": ["FCC"],
-                "secondary_agencies": ["CPSC"],
-                "search_keywords": ["computer", "electronic", "device", "equipment"],
-                "requirements": ["device authorization", "EMC", "safety standards"]
-            },
-            "8517": {
-                "primary_agencies": ["FCC"],
-                "secondary_agencies": ["CPSC"],
-                "search_keywords": ["telephone", "communication", "wireless", "radio"],
-                "requirements": ["equipment authorization", "radio frequency", "EMC"]
-            },
-            
-            # 의류 및 섬유 (61xx, 62xx)
-            "6109": {
-                "primary_agencies": ["CPSC"],
-                "secondary_agencies": ["FTC"],
-                "search_keywords": ["t-shirt", "clothing", "textile", "garment"],
-                "requirements": ["flammability", "care labeling", "fiber content"]
-            },
-            
-            # 장난감 및 어린이 제품 (95xx)
-            "9503": {
-                "primary_agencies": ["CPSC"],
-                "secondary_agencies": ["FDA"],
-                "search_keywords": ["toy", "children", "play", "game"],
-                "requirements": ["safety standards", "lead content", "small parts", "age grading"]
-            }
-        }
-
+    
+    def invalidate_status(self) -> None:
+        """캐시된 API 키/의존성 상태 폐기 (환경 변수나 프로바이더를 바꾼 뒤 호출)"""
+        self.__dict__.pop('api_status', None)
+        self.__dict__.pop('dependencies', None)
+    
+    def get_api_status(self) -> Dict[str, Any]:
+        """API 키 상태 반환 (하위 호환성 - 호출자가 수정해도 캐시는 유지되도록 사본)"""
+        return dict(self.api_status)
+    
+    def validate_dependencies(self) -> Dict[str, bool]:
+        """필수 의존성 검증 (하위 호환성 - 호출자가 수정해도 캐시는 유지되도록 사본)"""
+        return dict(self.dependencies)
+    
     async def _get_target_agencies_for_hs_code(self, hs_code: str, product_name: str = "") -> Dict[str, Any]:
         """
         HS 코드를 기반으로 타겟 기관 및 검색 전략 반환
@@ -235,48 +859,33 @@ class RequirementsTools:
         # HS 코드에서 4자리 코드 추출
         hs_4digit = hs_code.split('.')[0] if '.' in hs_code else hs_code[:4]
         
-        # 1. 하드코딩 매핑 확인 (가장 빠름)
-        mapping = self.hs_code_agency_mapping.get(hs_4digit, {})
+        # 1. 하드코딩 매핑 확인 (가장 빠름) - 점 표기 등과 무관하게 숫자 접두사로 조회 (예: 33.04.99 → 3304)
+        matched_key, mapping = self._match_hs_prefix(hs_code)
         
         if mapping:
-            print(f"✅ 하드코딩 매핑 사용 - HS: {hs_code}")
+            logger.info("✅ 하드코딩 매핑 사용 - HS: %s (매칭: %s)", hs_code, matched_key)
             return {
-                **mapping,
+                # 공유 테이블은 읽기 전용 tuple → 호출자에게는 기존과 같이 list 사본 반환
+                **{field: list(values) for field, values in mapping.items()},
                 "confidence": 0.9,
                 "source": "hardcoded"
             }
         
-        # 2. 백엔드 DB에서 AI 매핑 조회 또는 생성
+        # 2. 백엔드 DB에서 AI 매핑 조회 또는 생성 (성공 결과는 캐시 - 워크플로우 내 반복 조회 시 HTTP 생략)
         try:
             if self.backend_api:
-                ai_mapping = await self._get_or_generate_ai_mapping(hs_code, product_name)
-                if ai_mapping and ai_mapping.get("primary_agencies"):
-                    print(f"✅ AI 매핑 사용 - HS: {hs_code}, 신뢰도: {ai_mapping.get('confidence', 0):.2f}")
+                ai_mapping = await self._get_cached_ai_mapping(hs_code, product_name)
+                if ai_mapping:
+                    logger.info("✅ AI 매핑 사용 - HS: %s, 신뢰도: %.2f", hs_code, ai_mapping.get("confidence", 0))
                     return ai_mapping
         except Exception as e:
-            print(f"⚠️ AI 매핑 조회/생성 실패: {e}")
+            logger.warning("⚠️ AI 매핑 조회/생성 실패: %s", e)
         
         # 3. 기본 매핑 (HS 코드 챕터별 추론)
         hs_chapter = hs_4digit[:2]  # HS 코드 앞 2자리 (챕터)
+        default_agencies = list(_infer_agencies_for_chapter(hs_chapter))
         
-        # HS 챕터별 기본 기관 추론
-        if hs_chapter in ["01", "02", "03", "04", "05", "06", "07", "08", "09", "10", "11", "12", "13", "14", "15", "16", "17", "18", "19", "20", "21", "22", "23", "24"]:
-            # 농식품 (01-24장)
-            default_agencies = ["FDA", "USDA"]
-        elif hs_chapter in ["28", "29", "30", "31", "32", "33", "34", "35", "36", "37", "38"]:
-            # 화학제품 (28-38장)
-            default_agencies = ["FDA", "EPA"]
-        elif hs_chapter in ["84", "85", "90"]:
-            # 전기전자 (84, 85, 90장)
-            default_agencies = ["FCC", "EPA"]
-        elif hs_chapter in ["94", "95"]:
-            # 가구, 완구 (94, 95장)
-            default_agencies = ["CPSC"]
-        else:
-            # 기타 - 최소 3개 기관
-            default_agencies = ["FDA", "EPA", "CBP"]
-        
-        print(f"⚠️ HS 코드 {hs_code} 매핑 없음 - 챕터 {hs_chapter} 기반 추론: {default_agencies}")
+        logger.info("⚠️ HS 코드 %s 매핑 없음 - 챕터 %s 기반 추론: %s", hs_code, hs_chapter, default_agencies)
         return {
             "primary_agencies": default_agencies,
             "secondary_agencies": [],
@@ -286,54 +895,102 @@ class RequirementsTools:
             "source": "chapter_based_inference"
         }
     
+    async def _get_cached_ai_mapping(self, hs_code: str, product_name: str) -> Optional[Dict[str, Any]]:
+        """AI 매핑 조회 (캐시 우선, 같은 키 동시 요청은 한 번만 백엔드 호출)"""
+        key = (hs_code, product_name)
+        cached = self._mapping_cache.get(key)
+        if cached is None:
+            if self._is_recent_mapping_miss(key):
+                return None
+            lock = self._mapping_locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                cached = self._mapping_cache.get(key)
+                if cached is None:
+                    # 대기 중 앞선 요청이 실패했으면 같은 HS 코드로 다시 생성 요청하지 않음
+                    if self._is_recent_mapping_miss(key):
+                        return None
+                    try:
+                        ai_mapping = await self._get_or_generate_ai_mapping(hs_code, product_name)
+                    finally:
+                        self._mapping_locks.pop(key, None)
+                    # 기관이 없는 매핑/실패는 짧은 TTL 동안만 기억 (이후 호출에서 재시도)
+                    if not (ai_mapping and ai_mapping.get("primary_agencies")):
+                        self._mapping_misses.pop(key, None)
+                        self._mapping_misses[key] = time.monotonic()
+                        if len(self._mapping_misses) > 1024:
+                            del self._mapping_misses[next(iter(self._mapping_misses))]
+                        return None
+                    self._mapping_cache[key] = cached = ai_mapping
+                    if len(self._mapping_cache) > 1024:
+                        self._mapping_cache.popitem(last=False)
+        self._mapping_cache.move_to_end(key)
+        # 호출자가 결과를 수정해도 캐시가 바뀌지 않도록 list 사본 반환
+        return {field: list(value) if isinstance(value, list) else value for field, value in cached.items()}
+    
+    def _is_recent_mapping_miss(self, key: Tuple[str, str]) -> bool:
+        failed_at = self._mapping_misses.get(key)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at < _MAPPING_MISS_TTL:
+            return True
+        del self._mapping_misses[key]
+        return False
+    
+    def clear_mapping_cache(self) -> None:
+        """AI 매핑 캐시 비우기 (백엔드 매핑 갱신 후/테스트용)"""
+        self._mapping_cache.clear()
+        self._mapping_misses.clear()
+    
+    def _match_hs_prefix(self, hs_code: str) -> Tuple[str, Dict[str, Any]]:
+        """HS 코드 숫자열의 4자리(호) 접두사로 매핑 조회 (매핑 키는 모두 4자리)"""
+        key = "".join(ch for ch in hs_code if ch.isdigit())[:4]
+        mapping = self.hs_code_agency_mapping.get(key) if len(key) == 4 else None
+        return (key, mapping) if mapping else ("", {})
+    
     async def _get_or_generate_ai_mapping(self, hs_code: str, product_name: str) -> Optional[Dict[str, Any]]:
         """백엔드에서 AI 매핑 조회 또는 생성"""
         try:
-            import httpx
-            
-            # 백엔드 API 호출 (AI Engine을 통해 생성하고 DB에 저장)
+            # 백엔드 API 호출 (AI Engine을 통해 생성하고 DB에 저장) - 공유 클라이언트로 keep-alive 연결 재사용
+            client = self._http_client
             url = f"{self.backend_api.base_url}/api/hs-code-agency-mappings/search"
             params = {"hsCode": hs_code}
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, params=params)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    # DB에 있으면 반환
-                    if data:
-                        return self._parse_backend_mapping(data)
-                
-                # DB에 없으면 AI로 생성 요청
-                print(f"🤖 AI 매핑 생성 요청 - HS: {hs_code}")
-                
-                # 백엔드가 AI Engine을 호출하여 생성하도록 요청
-                generate_url = f"{self.backend_api.base_url}/api/hs-code-agency-mappings/generate"
-                generate_data = {
-                    "hsCode": hs_code,
-                    "productName": product_name,
-                    "productCategory": ""
-                }
-                
-                response = await client.post(generate_url, json=generate_data)
-                
-                if response.status_code in [200, 201]:
-                    data = response.json()
+            response = await client.get(url, params=params)
+            
+            if response.status_code == 200:
+                data = _json_loads(response.content)
+                # DB에 있으면 반환
+                if data:
                     return self._parse_backend_mapping(data)
+            
+            # DB에 없으면 AI로 생성 요청
+            logger.info("🤖 AI 매핑 생성 요청 - HS: %s", hs_code)
+            
+            # 백엔드가 AI Engine을 호출하여 생성하도록 요청
+            generate_url = f"{self.backend_api.base_url}/api/hs-code-agency-mappings/generate"
+            generate_data = {
+                "hsCode": hs_code,
+                "productName": product_name,
+                "productCategory": ""
+            }
+            
+            response = await client.post(generate_url, json=generate_data)
+            
+            if response.status_code in [200, 201]:
+                data = _json_loads(response.content)
+                return self._parse_backend_mapping(data)
                     
         except Exception as e:
-            print(f"⚠️ 백엔드 매핑 조회/생성 실패: {e}")
+            logger.warning("⚠️ 백엔드 매핑 조회/생성 실패: %s", e)
         
         return None
     
     def _parse_backend_mapping(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """백엔드 매핑 데이터 파싱"""
         try:
-            import json
-            
             agencies_json = data.get("recommendedAgencies", "{}")
-            if isinstance(agencies_json, str):
-                agencies_data = json.loads(agencies_json)
+            if isinstance(agencies_json, (str, bytes)):
+                agencies_data = _json_loads(agencies_json)
             else:
                 agencies_data = agencies_json
             
@@ -346,68 +1003,26 @@ class RequirementsTools:
                 "source": "ai_generated"
             }
         except Exception as e:
-            print(f"⚠️ 백엔드 매핑 파싱 실패: {e}")
+            logger.warning("⚠️ 백엔드 매핑 파싱 실패: %s", e)
             return {}
 
     def _extract_keywords_from_product(self, product_name: str, product_description: str = "") -> List[str]:
-        """상품명과 설명에서 핵심 키워드 추출"""
-        keywords = []
-        
-        # 상품명에서 키워드 추출
-        name_keywords = [
-            "vitamin", "serum", "cream", "extract", "ginseng", "rice", "noodle", 
-            "kimchi", "snack", "perfume", "cosmetic", "supplement", "food",
-            "electronic", "device", "toy", "clothing", "textile"
-        ]
-        
-        product_text = f"{product_name} {product_description}".lower()
-        for keyword in name_keywords:
-            if keyword in product_text:
-                keywords.append(keyword)
-        
-        # 상품명에서 직접 추출
-        words = product_name.lower().split()
-        for word in words:
-            if len(word) > 3 and word not in ["premium", "korean", "instant", "pack"]:
-                keywords.append(word)
-        
-        return list(set(keywords))  # 중복 제거
+        """상품명과 설명에서 핵심 키워드 추출 (동일 입력은 캐시 재사용)"""
+        return list(_extract_product_keywords(product_name, product_description))
 
     def _build_hs_code_based_queries(self, product_name: str, hs_code: str, target_agencies: Dict[str, Any]) -> Dict[str, str]:
         """HS 코드 기반 기본 검색 쿼리 생성"""
         queries = {}
+        search_keywords = target_agencies.get("search_keywords", [])
         
-        # 주요 기관별 검색 (HS 코드 기반)
+        # 주요 기관별 검색 (HS 코드 기반) + 세부 규정 검색 (기관별 특화)
         for agency in target_agencies.get("primary_agencies", []):
-            agency_lower = agency.lower()
-            
-            # 기본 요구사항 검색
-            queries[f"{agency}_hs_requirements"] = f"site:{agency_lower}.gov import requirements {product_name} HS {hs_code}"
-            
-            # 세부 규정 검색 (기관별 특화)
-            if agency == "FDA":
-                if "cosmetic" in target_agencies.get("search_keywords", []):
-                    queries[f"{agency}_hs_cosmetic"] = f"site:{agency_lower}.gov cosmetic regulations HS {hs_code} ingredient safety"
-                if "food" in target_agencies.get("search_keywords", []):
-                    queries[f"{agency}_hs_food"] = f"site:{agency_lower}.gov food import requirements HS {hs_code} prior notice"
-                if "supplement" in target_agencies.get("search_keywords", []):
-                    queries[f"{agency}_hs_supplement"] = f"site:{agency_lower}.gov dietary supplement requirements HS {hs_code} DSHEA"
-            
-            elif agency == "USDA":
-                queries[f"{agency}_hs_agricultural"] = f"site:{agency_lower}.gov agricultural import requirements HS {hs_code}"
-                queries[f"{agency}_hs_organic"] = f"site:{agency_lower}.gov organic certification HS {hs_code}"
-            
-            elif agency == "EPA":
-                queries[f"{agency}_hs_chemical"] = f"site:{agency_lower}.gov chemical regulations HS {hs_code}"
-                queries[f"{agency}_hs_environmental"] = f"site:{agency_lower}.gov environmental standards HS {hs_code}"
-            
-            elif agency == "FCC":
-                queries[f"{agency}_hs_device"] = f"site:{agency_lower}.gov device authorization HS {hs_code}"
-                queries[f"{agency}_hs_emc"] = f"site:{agency_lower}.gov EMC electromagnetic compatibility HS {hs_code}"
-            
-            elif agency == "CPSC":
-                queries[f"{agency}_hs_safety"] = f"site:{agency_lower}.gov safety standards HS {hs_code}"
-                queries[f"{agency}_hs_recall"] = f"site:{agency_lower}.gov recall information HS {hs_code}"
+            ctx = {"A": agency, "al": agency.lower(), "pn": product_name, "hs": hs_code}
+            templates = _HS_BASE_QUERY_TEMPLATES + [
+                (key, query) for gate, key, query in _HS_AGENCY_QUERY_TEMPLATES.get(agency, ())
+                if gate is None or gate in search_keywords
+            ]
+            queries.update(_render_queries(templates, ctx))
         
         return queries
 
@@ -415,22 +1030,13 @@ class RequirementsTools:
         """키워드 기반 추가 검색 쿼리 생성"""
         queries = {}
         
-        # 주요 기관별 키워드 검색
+        # 주요 기관별 키워드 검색 (상위 3개 키워드만 사용, 키워드별 특화 템플릿)
         for agency in target_agencies.get("primary_agencies", []):
             agency_lower = agency.lower()
-            
-            for keyword in keywords[:3]:  # 상위 3개 키워드만 사용
-                # 키워드별 특화 검색
-                if keyword in ["vitamin", "serum", "cream", "cosmetic"]:
-                    queries[f"{agency}_kw_{keyword}"] = f"site:{agency_lower}.gov cosmetic regulations {keyword} import requirements"
-                elif keyword in ["ginseng", "extract", "supplement"]:
-                    queries[f"{agency}_kw_{keyword}"] = f"site:{agency_lower}.gov dietary supplement {keyword} import requirements"
-                elif keyword in ["rice", "noodle", "kimchi", "food"]:
-                    queries[f"{agency}_kw_{keyword}"] = f"site:{agency_lower}.gov food import requirements {keyword}"
-                elif keyword in ["electronic", "device"]:
-                    queries[f"{agency}_kw_{keyword}"] = f"site:{agency_lower}.gov device authorization {keyword}"
-                elif keyword in ["toy", "clothing", "textile"]:
-                    queries[f"{agency}_kw_{keyword}"] = f"site:{agency_lower}.gov safety standards {keyword}"
+            for keyword in keywords[:3]:
+                template = _KEYWORD_QUERY_TEMPLATES.get(keyword)
+                if template:
+                    queries[f"{agency}_kw_{keyword}"] = template.format_map({"al": agency_lower, "kw": keyword})
         
         return queries
 
@@ -440,11 +1046,8 @@ class RequirementsTools:
         
         # 주요 기관별 상품명 전체 검색
         for agency in target_agencies.get("primary_agencies", []):
-            agency_lower = agency.lower()
-            
-            # 상품명 전체로 포괄적 검색
-            queries[f"{agency}_fullname_import"] = f"site:{agency_lower}.gov \"{product_name}\" import requirements"
-            queries[f"{agency}_fullname_regulations"] = f"site:{agency_lower}.gov \"{product_name}\" regulations compliance"
+            ctx = {"A": agency, "al": agency.lower(), "pn": product_name, "hs": hs_code}
+            queries.update(_render_queries(_FULLNAME_QUERY_TEMPLATES, ctx))
         
         return queries
     
@@ -453,76 +1056,62 @@ class RequirementsTools:
         queries = {}
         
         for agency in target_agencies.get("primary_agencies", []):
-            agency_lower = agency.lower()
-            
-            # Phase 2: 검사 절차 및 방법
-            queries[f"{agency}_phase2_testing"] = f"site:{agency_lower}.gov testing procedures {product_name} HS {hs_code}"
-            queries[f"{agency}_phase2_inspection"] = f"site:{agency_lower}.gov inspection methods {product_name} HS {hs_code}"
-            queries[f"{agency}_phase2_authorization"] = f"site:{agency_lower}.gov authorization procedures {product_name} HS {hs_code}"
-            
-            # Phase 3: 처벌 및 벌금 정보
-            queries[f"{agency}_phase3_penalties"] = f"site:{agency_lower}.gov penalties violations {product_name} HS {hs_code}"
-            queries[f"{agency}_phase3_enforcement"] = f"site:{agency_lower}.gov enforcement actions {product_name} HS {hs_code}"
-            queries[f"{agency}_phase3_fines"] = f"site:{agency_lower}.gov civil penalties {product_name} HS {hs_code}"
-            
-            # Phase 4: 유효기간 및 갱신 정보
-            queries[f"{agency}_phase4_validity"] = f"site:{agency_lower}.gov certificate validity period {product_name} HS {hs_code}"
-            queries[f"{agency}_phase4_renewal"] = f"site:{agency_lower}.gov certification renewal {product_name} HS {hs_code}"
-            queries[f"{agency}_phase4_duration"] = f"site:{agency_lower}.gov permit duration {product_name} HS {hs_code}"
+            ctx = {"A": agency, "al": agency.lower(), "pn": product_name, "hs": hs_code}
+            queries.update(_render_queries(_PHASE_QUERY_TEMPLATES, ctx))
         
         return queries
 
     def _init_cbp_collector(self):
-        """precedents-analysis/cbp_scraper.py의 CBPDataCollector를 동적 로드한다."""
-        try:
-            base_dir = Path(__file__).resolve().parents[1]  # ai-engine/app
-            project_root = base_dir.parent  # ai-engine
-            target_path = project_root / "precedents-analysis" / "cbp_scraper.py"
-            if not target_path.exists():
-                return None
-            spec = importlib.util.spec_from_file_location("cbp_scraper", str(target_path))
-            if spec is None or spec.loader is None:
-                return None
-            module = importlib.util.module_from_spec(spec)
-            sys.modules["cbp_scraper"] = module
-            spec.loader.exec_module(module)
-            if hasattr(module, "CBPDataCollector"):
-                return module.CBPDataCollector()
-        except Exception:
-            return None
-        return None
-
-        
-        # 기관별 도메인 매핑
-        self.agency_domains = {
-            "FDA": "fda.gov",
-            "FCC": "fcc.gov", 
-            "CBP": "cbp.gov",
-            "USDA": "usda.gov",
-            "EPA": "epa.gov",
-            "CPSC": "cpsc.gov",
-            "KCS": "customs.go.kr",  # 한국 관세청
-            "MFDS": "mfds.go.kr",    # 식품의약품안전처
-            "MOTIE": "motie.go.kr"   # 산업통상자원부
-        }
+        """CBPDataCollector 인스턴스 반환 (모듈 로드/생성은 프로세스당 1회)"""
+        return _get_cbp_collector()
     
     async def search_agency_documents(self, agency: str, query: str, max_results: int = 5) -> Dict[str, Any]:
         """기관별 문서 검색 도구 (통합)"""
-        print(f"🔧 [TOOL] {agency} 문서 검색: {query}")
+        logger.info("🔧 [TOOL] %s 문서 검색: %s", agency, query)
         
-        results = await self.search_provider.search(query, max_results=max_results)
+        # 미등록 기관은 빈 도메인("")이 모든 URL과 매칭되므로 검색 전에 차단
+        agency_domain = self.agency_domains.get(agency)
+        if agency_domain is None:
+            logger.warning("  ⚠️ 알 수 없는 기관: %s", agency)
+            return {
+                "agency": agency,
+                "query": query,
+                "total_results": 0,
+                "agency_results": [],
+                "selected_url": None,
+                "domain": None,
+                "error": f"unknown agency {agency}"
+            }
+        
+        try:
+            async with self.search_semaphore:
+                results = await self.search_provider.search(query, max_results=max_results)
+        except Exception as e:
+            logger.error("❌ %s 검색 실패: %s", agency, e)
+            return {
+                "agency": agency,
+                "query": query,
+                "total_results": 0,
+                "agency_results": [],
+                "selected_url": None,
+                "domain": agency_domain,
+                "error": str(e)
+            }
         
-        # 기관별 도메인 필터링
-        agency_domain = self.agency_domains.get(agency, "")
+        # 기관별 도메인 필터링 (호스트명 일치 또는 하위 도메인)
+        domain, subdomain_suffix = self._agency_hosts[agency]
         agency_results = []
+        verbose = logger.isEnabledFor(logging.DEBUG)
         
         for result in results:
-            url = result.get("url", "")
-            if agency_domain in url:
+            host = url_host(result.get("url") or "")
+            if host == domain or host.endswith(subdomain_suffix):
                 agency_results.append(result)
-                print(f"  ✅ {agency} 공식 문서 발견: {result.get('title', 'No title')}")
-            else:
-                print(f"  ❌ {agency} 외부 문서 제외: {result.get('title', 'No title')}")
+                if verbose:
+                    logger.debug("  ✅ %s 공식 문서 발견: %s", agency, result.get('title', 'No title'))
+            elif verbose:
+                logger.debug("  ❌ %s 외부 문서 제외: %s", agency, result.get('title', 'No title'))
+        logger.info("  ✅ %s 공식 문서: %d/%d개", agency, len(agency_results), len(results))
         
         return {
             "agency": agency,
@@ -533,53 +1122,36 @@ class RequirementsTools:
             "domain": agency_domain
         }
     
-    async def search_fda_documents(self, query: str, max_results: int = 5) -> Dict[str, Any]:
-        """FDA 관련 문서 검색 도구 (하위 호환성)"""
-        return await self.search_agency_documents("FDA", query, max_results)
-    
-    # 미국 정부 기관들
-    async def search_fcc_documents(self, query: str, max_results: int = 5) -> Dict[str, Any]:
-        """FCC 관련 문서 검색 도구"""
-        return await self.search_agency_documents("FCC", query, max_results)
-    
-    async def search_cbp_documents(self, query: str, max_results: int = 5) -> Dict[str, Any]:
-        """CBP 관련 문서 검색 도구"""
-        return await self.search_agency_documents("CBP", query, max_results)
-    
-    async def search_usda_documents(self, query: str, max_results: int = 5) -> Dict[str, Any]:
-        """USDA 관련 문서 검색 도구"""
-        return await self.search_agency_documents("USDA", query, max_results)
-    
-    async def search_epa_documents(self, query: str, max_results: int = 5) -> Dict[str, Any]:
-        """EPA 관련 문서 검색 도구"""
-        return await self.search_agency_documents("EPA", query, max_results)
-    
-    async def search_cpsc_documents(self, query: str, max_results: int = 5) -> Dict[str, Any]:
-        """CPSC 관련 문서 검색 도구"""
-        return await self.search_agency_documents("CPSC", query, max_results)
-    
-    # 한국 정부 기관들
-    async def search_kcs_documents(self, query: str, max_results: int = 5) -> Dict[str, Any]:
-        """한국 관세청 관련 문서 검색 도구"""
-        return await self.search_agency_documents("KCS", query, max_results)
-    
-    async def search_mfds_documents(self, query: str, max_results: int = 5) -> Dict[str, Any]:
-        """식품의약품안전처 관련 문서 검색 도구"""
-        return await self.search_agency_documents("MFDS", query, max_results)
+    def __getattr__(self, name: str):
+        """search_<agency>_documents 형태의 기관별 검색 도구 (하위 호환성)
+
+        예: search_fda_documents, search_kcs_documents, search_motie_documents
+        """
+        if name.startswith("search_") and name.endswith("_documents"):
+            agency = name[7:-10].upper()
+            if agency in self.__dict__.get("agency_domains", {}):
+                async def _search(query: str, max_results: int = 5, _agency: str = agency) -> Dict[str, Any]:
+                    return await self.search_agency_documents(_agency, query, max_results)
+                return _search
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
     
-    async def search_motie_documents(self, query: str, max_results: int = 5) -> Dict[str, Any]:
-        """산업통상자원부 관련 문서 검색 도구"""
-        return await self.search_agency_documents("MOTIE", query, max_results)
+    @functools.cached_property
+    def _scraper_dispatch(self) -> Dict[str, Any]:
+        """기관 -> WebScraper 바운드 메서드 (최초 스크래핑 시 1회 구성)"""
+        return {
+            agency: method for agency, name in _SCRAPER_METHODS.items()
+            if (method := getattr(self.web_scraper, name, None)) is not None
+        }
     
     async def scrape_document(self, agency: str, url: str, hs_code: str) -> Dict[str, Any]:
         """특정 문서 스크래핑 도구 (확장)"""
-        print(f"🔧 [TOOL] {agency} 문서 스크래핑")
-        print(f"  URL: {url}")
-        print(f"  HS코드: {hs_code}")
+        logger.info("🔧 [TOOL] %s 문서 스크래핑", agency)
+        logger.info("  URL: %s", url)
+        logger.info("  HS코드: %s", hs_code)
         
         # WebScraper가 초기화되지 않은 경우
         if not self.web_scraper:
-            print(f"  ❌ WebScraper가 초기화되지 않음")
+            logger.warning("  ❌ WebScraper가 초기화되지 않음")
             return {
                 "agency": agency,
                 "error": "WebScraper not initialized",
@@ -589,25 +1161,10 @@ class RequirementsTools:
             }
         
         try:
-            # 기관별 스크래핑 메서드 매핑
-            scraper_methods = {
-                "FDA": "scrape_fda_requirements",
-                "FCC": "scrape_fcc_requirements", 
-                "CBP": "scrape_cbp_requirements",
-                "USDA": "scrape_usda_requirements",
-                "EPA": "scrape_epa_requirements",
-                "CPSC": "scrape_cpsc_requirements",
-                "KCS": "scrape_kcs_requirements",
-                "MFDS": "scrape_mfds_requirements",
-                "MOTIE": "scrape_motie_requirements"
-            }
-            
-            method_name = scraper_methods.get(agency)
-            if not method_name:
+            if agency not in _SCRAPER_METHODS:
                 return {"error": f"Unknown agency: {agency}"}
             
-            # 동적으로 스크래핑 메서드 호출
-            scraper_method = getattr(self.web_scraper, method_name, None)
+            scraper_method = self._scraper_dispatch.get(agency)
             if not scraper_method:
                 return {"error": f"Scraper method not implemented for {agency}"}
             
@@ -618,25 +1175,32 @@ class RequirementsTools:
             docs = result.get("documents", [])
             sources = result.get("sources", [])
             
-            print(f"  ✅ {agency} 스크래핑 성공:")
-            print(f"    📋 인증요건: {len(certs)}개")
-            for i, cert in enumerate(certs, 1):
-                print(f"      {i}. {cert.get('name', 'Unknown')} ({cert.get('agency', 'Unknown')})")
-                print(f"         설명: {cert.get('description', 'No description')}")
-            
-            print(f"    📄 필요서류: {len(docs)}개")
-            for i, doc in enumerate(docs, 1):
-                print(f"      {i}. {doc.get('name', 'Unknown')}")
-                print(f"         설명: {doc.get('description', 'No description')}")
-            
-            print(f"    📚 출처: {len(sources)}개")
-            for i, source in enumerate(sources, 1):
-                print(f"      {i}. {source.get('title', 'Unknown')} ({source.get('type', 'Unknown')})")
+            logger.info("  ✅ %s 스크래핑 성공: 인증요건 %d개, 필요서류 %d개, 출처 %d개",
+                        agency, len(certs), len(docs), len(sources))
+            if logger.isEnabledFor(logging.DEBUG):
+                lines = [f"    📋 인증요건: {len(certs)}개"]
+                lines += [
+                    f"      {i}. {c.get('name', 'Unknown')} ({c.get('agency', 'Unknown')})\n"
+                    f"         설명: {c.get('description', 'No description')}"
+                    for i, c in enumerate(certs, 1)
+                ]
+                lines.append(f"    📄 필요서류: {len(docs)}개")
+                lines += [
+                    f"      {i}. {d.get('name', 'Unknown')}\n"
+                    f"         설명: {d.get('description', 'No description')}"
+                    for i, d in enumerate(docs, 1)
+                ]
+                lines.append(f"    📚 출처: {len(sources)}개")
+                lines += [
+                    f"      {i}. {src.get('title', 'Unknown')} ({src.get('type', 'Unknown')})"
+                    for i, src in enumerate(sources, 1)
+                ]
+                logger.debug("\n".join(lines))
             
             return result
             
         except Exception as e:
-            print(f"  ❌ {agency} 스크래핑 실패: {e}")
+            logger.error("  ❌ %s 스크래핑 실패: %s", agency, e)
             return {
                 "agency": agency,
                 "error": str(e),
@@ -662,57 +1226,117 @@ class RequirementsTools:
     async def summarize_pdf(self, url: str, max_pages: int = 5) -> Dict[str, Any]:
         """PDF 문서를 다운로드하여 앞부분을 요약(발췌)한다."""
         try:
-            async with httpx.AsyncClient(timeout=20) as client:
-                resp = await client.get(url)
+            # 스트리밍 다운로드 (크기 상한 초과 시 중단)
+            data = BytesIO()
+            async with self._http_client.stream("GET", url, timeout=20) as resp:
                 resp.raise_for_status()
-                data = BytesIO(resp.content)
-                reader = PdfReader(data)
-                num_pages = min(len(reader.pages), max_pages)
-                text_chunks: List[str] = []
-                for i in range(num_pages):
-                    try:
-                        text_chunks.append(reader.pages[i].extract_text() or "")
-                    except Exception:
-                        continue
-                combined = "\n".join([t.strip() for t in text_chunks if t and t.strip()])
-                preview = (combined[:1200] + "…") if len(combined) > 1200 else combined
-                return {
-                    "url": url,
-                    "pages_read": num_pages,
-                    "excerpt": preview,
-                    "char_count": len(preview)
-                }
+                # Content-Length로 상한 초과가 확실하면 본문을 받지 않고 바로 중단
+                declared = resp.headers.get("content-length", "")
+                if declared.isdigit() and int(declared) > _MAX_PDF_BYTES:
+                    return {"url": url, "error": f"PDF too large (>{_MAX_PDF_BYTES} bytes)"}
+                async for chunk in resp.aiter_bytes(64 * 1024):
+                    data.write(chunk)
+                    if data.tell() > _MAX_PDF_BYTES:
+                        return {"url": url, "error": f"PDF too large (>{_MAX_PDF_BYTES} bytes)"}
+            # PDF 파싱/텍스트 정리는 CPU 작업이므로 스레드에서 실행
+            num_pages, preview = await asyncio.to_thread(_extract_pdf_excerpt, data, max_pages, _PDF_EXCERPT_CHARS)
+            return {
+                "url": url,
+                "pages_read": num_pages,
+                "excerpt": preview,
+                "char_count": len(preview)
+            }
         except Exception as e:
             return {"url": url, "error": str(e)}
 
     def save_reference_links(self, hs_code: str, product_name: str, search_results: Dict[str, Any]) -> Dict[str, Any]:
-        """검색된 참고 링크들을 로컬 JSON에 저장/병합한다."""
+        """검색된 참고 링크들을 로컬 JSONL 저장소에 저장/병합한다."""
         try:
-            existing: Dict[str, Any] = {}
-            if self.references_store_path.exists():
-                existing = json.loads(self.references_store_path.read_text(encoding="utf-8"))
+            existing = self._load_references()
             key = f"{hs_code}:{product_name}"
             payload = {
                 "hs_code": hs_code,
                 "product_name": product_name,
-                "saved_at": datetime.utcnow().isoformat() + "Z",
+                "saved_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
                 "agencies": {}
             }
             for k, v in search_results.items():
                 agency = v.get("agency") or k
-                urls = v.get("urls", [])
-                payload["agencies"].setdefault(agency, {"urls": []})
-                # 병합
-                payload["agencies"][agency]["urls"] = list({*payload["agencies"][agency]["urls"], *urls})
+                # 병합 (set에 누적, 직렬화 시점에만 정렬된 리스트로 변환)
+                payload["agencies"].setdefault(agency, {"urls": set()})["urls"].update(v.get("urls", []))
             existing[key] = payload
-            self.references_store_path.write_text(json.dumps(existing, ensure_ascii=False, indent=2), encoding="utf-8")
+            self._refs_pending[key] = payload  # 디스크 기록(append)은 flush_references()에서 수행
             return {"saved": True, "reference_key": key, "agencies": list(payload["agencies"].keys())}
         except Exception as e:
             return {"saved": False, "error": str(e)}
     
+    def _load_references(self) -> Dict[str, Any]:
+        """참고 링크 저장소 로드 (최초 1회만 파일 파싱, 이후 메모리 사용)"""
+        if self._refs is None:
+            raw = legacy_raw = None
+            if self.references_store_path.exists():
+                raw = self.references_store_path.read_text(encoding="utf-8")
+            elif self.legacy_references_path.exists():
+                legacy_raw = self.legacy_references_path.read_text(encoding="utf-8")
+            self._init_references(raw, legacy_raw)
+        return self._refs
+    
+    async def load_references(self) -> Dict[str, Any]:
+        """참고 링크 저장소 비동기 로드 (aiofiles - 최초 파싱 시 이벤트 루프 블로킹 방지)"""
+        if self._refs is None:
+            raw = await _read_cache(self.references_store_path)
+            legacy_raw = await _read_cache(self.legacy_references_path) if raw is None else None
+            # 읽는 동안 동기 경로에서 이미 로드했으면 그 결과 유지
+            if self._refs is None:
+                self._init_references(raw, legacy_raw)
+        return self._refs
+    
+    def _init_references(self, raw: Optional[str], legacy_raw: Optional[str]) -> None:
+        """메모리 인덱스 구성 (JSONL이 아직 없으면 기존 단일 JSON 저장소 내용을 다음 flush에서 이관)"""
+        self._refs = _parse_reference_lines(raw)
+        self._refs_lines = raw.count("\n") if raw else 0
+        if legacy_raw:
+            try:
+                legacy = _json_loads(legacy_raw)
+            except json.JSONDecodeError:
+                legacy = None
+            if isinstance(legacy, dict):
+                migrated = _validate_legacy_references(legacy)
+                if len(migrated) < len(legacy):
+                    logger.warning("⚠️ 기존 참고 링크 %s건 중 %s건만 이관 (기관 도메인 불일치 항목 제외)", len(legacy), len(migrated))
+                self._refs = {**migrated, **self._refs}
+                self._refs_pending = {**migrated, **self._refs_pending}
+    
+    async def flush_references(self) -> bool:
+        """새로 저장된 참고 링크만 JSONL 파일 끝에 추가 (파일 쓰기는 스레드에서 실행)
+
+        덮어쓴 키의 이전 줄이 쌓여 파일이 키 수의 2배를 넘으면 현재 인덱스로 파일을 다시 씀(압축)
+        """
+        async with self._refs_lock:
+            if not self._refs_pending:
+                return False
+            # 직렬화는 이벤트 루프에서 수행 (쓰기 도중 다른 코루틴의 변경과 충돌 방지)
+            pending, self._refs_pending = self._refs_pending, {}
+            refs = self._refs
+            compact = refs is not None and self._refs_lines + len(pending) > 2 * len(refs) + 100
+            try:
+                if compact:
+                    data = b"".join(_dumps_line({key: payload}) for key, payload in refs.items())
+                    await asyncio.to_thread(_replace_bytes, self.references_store_path, data)
+                    self._refs_lines = len(refs)
+                else:
+                    lines = b"".join(_dumps_line({key: payload}) for key, payload in pending.items())
+                    await asyncio.to_thread(_append_bytes, self.references_store_path, lines)
+                    self._refs_lines += len(pending)
+            except Exception as e:
+                self._refs_pending = {**pending, **self._refs_pending}
+                logger.error("⚠️ 참고 링크 저장 실패: %s", e)
+                return False
+            return True
+    
     async def analyze_requirements(self, requirements_data: Dict[str, Any]) -> Dict[str, Any]:
         """요구사항 분석 도구 (확장)"""
-        print(f"🔧 [TOOL] 요구사항 분석 시작")
+        logger.info("🔧 [TOOL] 요구사항 분석 시작")
         
         certifications = requirements_data.get("certifications", [])
         documents = requirements_data.get("documents", [])
@@ -723,99 +1347,179 @@ class RequirementsTools:
         total_docs = len(documents)
         total_sources = len(sources)
         
-        # 기관별 통계
-        agency_stats = {}
+        # 기관별 통계 + 우선순위 분석 (인증요건 단일 순회)
+        agency_stats = Counter()
+        high_priority_count = 0
+        has_critical = False
         for cert in certifications:
-            agency = cert.get("agency", "Unknown")
-            agency_stats[agency] = agency_stats.get(agency, 0) + 1
-        
-        # 우선순위 분석
-        high_priority = [c for c in certifications if c.get("priority") == "high"]
-        required_docs = [d for d in documents if d.get("required", False)]
+            agency_stats[cert.get("agency", "Unknown")] += 1
+            priority = cert.get("priority")
+            if priority == "high":
+                high_priority_count += 1
+            if not has_critical and (
+                cert.get("critical") is True
+                or str(priority or "").lower() in _CRITICAL_LEVELS
+                or str(cert.get("severity") or "").lower() in _CRITICAL_LEVELS
+            ):
+                has_critical = True
+        agency_stats = dict(agency_stats)
+        required_docs_count = sum(1 for d in documents if d.get("required", False))
         
         # 품질 지표 계산
-        completeness_score = min(1.0, (total_certs + total_docs) / 10)  # 0-1 스케일
-        coverage_ratio = len(agency_stats) / len(self.agency_domains)  # 기관 커버리지
+        completeness_score = min(1.0, (total_certs + total_docs) / _COMPLETENESS_DIV)  # 0-1 스케일
+        n_agencies = len(agency_stats)
+        coverage_ratio = n_agencies * self._inv_n_agencies  # 기관 커버리지
         
         # 복잡도 분석
         complexity_factors = []
-        if total_certs > 5:
+        if total_certs > _MULTI_CERT_THRESHOLD:
             complexity_factors.append("다중 인증 요구")
-        if len(agency_stats) > 3:
+        if n_agencies > _MULTI_AGENCY_THRESHOLD:
             complexity_factors.append("다기관 규제")
-        if any("critical" in str(cert).lower() for cert in certifications):
+        if has_critical:
             complexity_factors.append("중요 인증 요구")
         
-        compliance_complexity = "simple" if len(complexity_factors) == 0 else "moderate" if len(complexity_factors) <= 2 else "complex"
+        n_factors = len(complexity_factors)
+        compliance_complexity = "simple" if n_factors == 0 else "moderate" if n_factors <= 2 else "complex"
         
         # 비용 추정 (간단한 휴리스틱)
-        estimated_cost_low = total_certs * 100 + total_docs * 50  # USD
-        estimated_cost_high = total_certs * 500 + total_docs * 200
+        estimated_cost_low = total_certs * _CERT_COST_LOW + total_docs * _DOC_COST_LOW  # USD
+        estimated_cost_high = total_certs * _CERT_COST_HIGH + total_docs * _DOC_COST_HIGH
         
         # 리스크 분석
         risk_factors = []
         if total_certs == 0:
             risk_factors.append("인증 요구사항 불명확")
-        if len(required_docs) > 10:
+        if required_docs_count > 10:
             risk_factors.append("서류 요구사항 과다")
         if coverage_ratio < 0.3:
             risk_factors.append("기관 커버리지 부족")
         
-        overall_risk_level = "low" if len(risk_factors) == 0 else "medium" if len(risk_factors) <= 2 else "high"
-        
-        print(f"  📊 분석 결과:")
-        print(f"    📋 총 인증요건: {total_certs}개")
-        print(f"    📄 총 필요서류: {total_docs}개")
-        print(f"    📚 총 출처: {total_sources}개")
-        print(f"    🏢 기관별 인증요건:")
-        for agency, count in agency_stats.items():
-            print(f"      • {agency}: {count}개")
-        print(f"    ⚠️ 고우선순위 인증요건: {len(high_priority)}개")
-        print(f"    📋 필수 서류: {len(required_docs)}개")
-        print(f"    📈 완성도 점수: {completeness_score:.2f}")
-        print(f"    🎯 기관 커버리지: {coverage_ratio:.2f}")
-        print(f"    ⚡ 복잡도: {compliance_complexity}")
-        print(f"    💰 예상 비용: ${estimated_cost_low}-${estimated_cost_high}")
-        print(f"    ⚠️ 리스크 레벨: {overall_risk_level}")
-        
-        return {
-            # 기본 통계
-            "total_certifications": total_certs,
-            "total_documents": total_docs,
-            "total_sources": total_sources,
-            "agency_stats": agency_stats,
-            "high_priority_count": len(high_priority),
-            "required_docs_count": len(required_docs),
-            
-            # 품질 지표
-            "quality_metrics": {
+        n_risks = len(risk_factors)
+        overall_risk_level = "low" if n_risks == 0 else "medium" if n_risks <= 2 else "high"
+        
+        logger.info(
+            "  📊 분석 결과: 인증요건 %s개, 필요서류 %s개, 출처 %s개, 복잡도 %s, 리스크 %s",
+            total_certs, total_docs, total_sources, compliance_complexity, overall_risk_level
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            lines = ["    🏢 기관별 인증요건:"]
+            lines.extend(f"      • {agency}: {count}개" for agency, count in agency_stats.items())
+            lines.extend([
+                f"    ⚠️ 고우선순위 인증요건: {high_priority_count}개",
+                f"    📋 필수 서류: {required_docs_count}개",
+                f"    📈 완성도 점수: {completeness_score:.2f}",
+                f"    🎯 기관 커버리지: {coverage_ratio:.2f}",
+                f"    💰 예상 비용: ${estimated_cost_low}-${estimated_cost_high}",
+            ])
+            logger.debug("\n".join(lines))
+        
+        return AnalysisResult(
+            total_certifications=total_certs,
+            total_documents=total_docs,
+            total_sources=total_sources,
+            agency_stats=agency_stats,
+            high_priority_count=high_priority_count,
+            required_docs_count=required_docs_count,
+            quality_metrics={
                 "completeness_score": completeness_score,
                 "coverage_ratio": coverage_ratio,
                 "compliance_complexity": compliance_complexity,
                 "complexity_factors": complexity_factors
             },
-            
-            # 비용 분석
-            "cost_analysis": {
+            cost_analysis={
                 "estimated_cost_low": estimated_cost_low,
                 "estimated_cost_high": estimated_cost_high,
                 "currency": "USD"
             },
-            
-            # 리스크 분석
-            "risk_analysis": {
+            risk_analysis={
                 "overall_risk_level": overall_risk_level,
                 "risk_factors": risk_factors
-            },
+            }
+        ).as_dict()
+    
+    def _build_web_search_graph(self):
+        """웹 검색 서브그래프: START → 쿼리별 search_query 노드 (fan-out) → END (fan-in)"""
+        def fan_out(state: _WebSearchState) -> List[Send]:
+            return [
+                Send("search_query", {"query_key": key, "query": query, "target_confidence": state["target_confidence"]})
+                for key, query in state["queries"].items()
+            ]
+        
+        async def search_query(task: Dict[str, Any]) -> Dict[str, Any]:
+            entry = await self._run_web_query(task["query_key"], task["query"], task["target_confidence"])
+            return {"web_results": {task["query_key"]: entry}}
+        
+        graph = StateGraph(_WebSearchState)
+        graph.add_node("search_query", search_query)
+        graph.add_conditional_edges(START, fan_out, ["search_query"])
+        graph.add_edge("search_query", END)
+        return graph.compile()
+    
+    async def _search_with_breaker(self, query: str) -> Optional[List[Dict[str, Any]]]:
+        """서킷 브레이커를 거쳐 프로바이더 검색 (차단 중이면 None)"""
+        breaker = self._search_breaker
+        # 프로바이더 동시 요청 수 제한 (타임아웃은 실제 검색 호출에만 적용)
+        async with self.search_semaphore:
+            # 프로바이더 장애로 차단 중이면 타임아웃까지 기다리지 않고 즉시 실패
+            allowed, is_probe = breaker.admit()
+            if not allowed:
+                return None
+            try:
+                results = await asyncio.wait_for(
+                    self.search_provider.search(query, max_results=5), timeout=_WEB_QUERY_TIMEOUT
+                )
+            except asyncio.CancelledError:
+                # 취소된 시험 호출은 결과가 없으므로 다음 호출이 다시 시험하도록 해제
+                if is_probe:
+                    breaker.release_probe()
+                raise
+            except Exception:
+                if breaker.record_failure(probe=is_probe):
+                    logger.warning("    🚫 웹 검색 연속 실패 - %ss 동안 검색 차단", breaker.cooldown)
+                raise
+            breaker.record_success()
+            return results
+    
+    async def _run_web_query(self, query_key: str, query: str, target_confidence: float) -> Dict[str, Any]:
+        """단일 웹 검색 쿼리 실행 및 결과 분류"""
+        try:
+            if self.search_provider:
+                # 캐시 적중은 프로바이더를 호출하지 않으므로 서킷 브레이커 판정/기록에서 제외
+                cache_lookup = getattr(self.search_provider, "cached", None)
+                search_results = cache_lookup(query, max_results=5) if cache_lookup else None
+                if search_results is None:
+                    search_results = await self._search_with_breaker(query)
+                    if search_results is None:
+                        return {"error": "circuit open"}
+            else:
+                logger.warning("    ⚠️ 검색 프로바이더 없음: %s 스킵됨", query_key)
+                search_results = []
+            agency, category, search_type = _classify_query_key(query_key)
             
-            "analysis_complete": True
-        }
+            # http(s) URL만 수집 (mailto/ftp 등 제외) - 통합 단계에서 재검사하지 않도록 플래그 저장
+            urls = [url for r in search_results if (url := r.get("url")) and _HTTP_URL_RE.match(url)]
+            
+            return {
+                "query": query,
+                "results": search_results,
+                "urls": urls,
+                "has_urls": bool(urls),
+                "agency": agency,
+                "category": category,
+                "search_type": search_type,
+                "result_count": len(search_results),
+                "target_confidence": target_confidence
+            }
+        except TimeoutError:
+            logger.warning("    ⏱️ 웹 검색 타임아웃 (%ss): %s", _WEB_QUERY_TIMEOUT, query_key)
+            return {"error": "timeout"}
+        except Exception as e:
+            return {"error": str(e)}
     
     async def search_requirements_hybrid(self, hs_code: str, product_name: str, product_description: str = "") -> Dict[str, Any]:
         """하이브리드 검색: Backend API (우선) + Tavily Search (보조)"""
-        print(f"\n🚀 [HYBRID] 하이브리드 검색 시작")
-        print(f"  📋 HS코드: {hs_code}")
-        print(f"  📦 상품명: {product_name}")
+        logger.info("\n🚀 [HYBRID] 하이브리드 검색 시작\n  📋 HS코드: %s\n  📦 상품명: %s", hs_code, product_name)
         
         results = {
             "hs_code": hs_code,
@@ -828,141 +1532,148 @@ class RequirementsTools:
             "citations": []  # 출처 정보 추가
         }
         
-        # 1. Backend API 검색 (우선 - 정부 API 통합 수집)
+        # 판례 조회는 HS 코드에만 의존 → 미리 시작해 API/웹 검색 시간 동안 함께 진행
+        precedents_task = asyncio.create_task(self.get_cbp_precedents(hs_code))
+        
         try:
-            print(f"\n  🔍 1단계: Backend API 검색 (정부 API 통합)")
-            if not self.backend_api:
-                print(f"    ⚠️ BackendAPIService가 초기화되지 않음 - 대체 방식 사용")
-                # 백엔드 API 없으면 기존 방식 사용
-                if self.data_gov_api:
-                    api_results = await self.data_gov_api.search_requirements_by_hs_code(hs_code, product_name)
-                    results["search_methods"].append("data_gov_api_fallback")
+            # 1. Backend API 검색 (우선 - 정부 API 통합 수집)
+            try:
+                logger.info("\n  🔍 1단계: Backend API 검색 (정부 API 통합)")
+                if not self.backend_api:
+                    logger.warning("    ⚠️ BackendAPIService가 초기화되지 않음 - 대체 방식 사용")
+                    # 백엔드 API 없으면 기존 방식 사용
+                    if self.data_gov_api:
+                        api_results = await self.data_gov_api.search_requirements_by_hs_code(hs_code, product_name)
+                        results["search_methods"].append("data_gov_api_fallback")
+                    else:
+                        api_results = {
+                            "hs_code": hs_code,
+                            "product_name": product_name,
+                            "error": "No API service available",
+                            "total_requirements": 0,
+                            "agencies": {}
+                        }
                 else:
-                    api_results = {
-                        "hs_code": hs_code,
-                        "product_name": product_name,
-                        "error": "No API service available",
-                        "total_requirements": 0,
-                        "agencies": {}
-                    }
-            else:
-                # 백엔드 API 호출
-                backend_response = await self.backend_api.collect_requirements(
-                    product=product_name,
-                    hs_code=hs_code,
-                    include_raw_data=False
-                )
+                    # 백엔드 API 호출
+                    backend_response = await self.backend_api.collect_requirements(
+                        product=product_name,
+                        hs_code=hs_code,
+                        include_raw_data=False
+                    )
                 
-                # AI 분석용 포맷으로 변환
-                api_results = self.backend_api.format_for_ai_analysis(backend_response)
-                results["search_methods"].append("backend_api")
+                    # AI 분석용 포맷으로 변환
+                    api_results = self.backend_api.format_for_ai_analysis(backend_response)
+                    results["search_methods"].append("backend_api")
                 
-                # Citations 추출
-                results["citations"] = backend_response.get("citations", [])
-                print(f"    📚 출처: {len(results['citations'])}개")
+                    # Citations 추출
+                    results["citations"] = backend_response.get("citations", [])
+                    logger.info("    📚 출처: %s개", len(results['citations']))
             
-            results["api_results"] = api_results
-            total_reqs = api_results.get('requirements_summary', {}).get('total', 0) or api_results.get('total_requirements', 0)
-            print(f"    ✅ API 검색 완료: {total_reqs}개 요구사항")
+                results["api_results"] = api_results
+                total_reqs = api_results.get('requirements_summary', {}).get('total', 0) or api_results.get('total_requirements', 0)
+                logger.info("    ✅ API 검색 완료: %s개 요구사항", total_reqs)
             
-        except Exception as e:
-            print(f"    ❌ API 검색 실패: {e}")
-            results["api_results"] = {"error": str(e)}
-        
-        # 2. Tavily Search (타겟 기관 기반 검색)
-        try:
-            print(f"\n  🔍 2단계: Tavily Search (타겟 기관 기반)")
+            except Exception as e:
+                logger.error("    ❌ API 검색 실패: %s", e)
+                results["api_results"] = {"error": str(e)}
+        
+            # 2. Tavily Search (타겟 기관 기반 검색)
+            # 기관 분석/키워드 추출이 실패해도 결과 통합 단계에서 참조할 수 있도록 기본값 설정
+            target_agencies: Dict[str, Any] = {}
+            keywords: List[str] = []
+            try:
+                logger.info("\n  🔍 2단계: Tavily Search (타겟 기관 기반)")
             
-            # HS 코드 기반 타겟 기관 분석 (AI 매핑 포함)
-            target_agencies = await self._get_target_agencies_for_hs_code(hs_code, product_name)
+                # HS 코드 기반 타겟 기관 분석 (AI 매핑 포함)
+                target_agencies = await self._get_target_agencies_for_hs_code(hs_code, product_name)
             
-            # AI 매핑이 있으면 해당 기관만 검색, 없으면 전체 검색
-            if target_agencies.get("source") in ["hardcoded", "ai_generated"]:
-                print(f"  ✅ 타겟 기관 확정 ({target_agencies.get('source')}): {target_agencies.get('primary_agencies')}")
-                print(f"  💰 Tavily 검색 최적화: 타겟 기관만 검색")
-            else:
-                print(f"  ⚠️ 타겟 기관 불명확 ({target_agencies.get('source')})")
-                print(f"  💸 Tavily 검색 확장: 모든 기관 검색 (비용 증가)")
+                # AI 매핑이 있으면 해당 기관만 검색, 없으면 전체 검색
+                if target_agencies.get("source") in ["hardcoded", "ai_generated"]:
+                    logger.info("  ✅ 타겟 기관 확정 (%s): %s", target_agencies.get('source'), target_agencies.get('primary_agencies'))
+                    logger.info("  💰 Tavily 검색 최적화: 타겟 기관만 검색")
+                else:
+                    logger.warning("  ⚠️ 타겟 기관 불명확 (%s)", target_agencies.get('source'))
+                    logger.info("  💸 Tavily 검색 확장: 모든 기관 검색 (비용 증가)")
             
-            # 상품명/설명에서 키워드 추출
-            keywords = self._extract_keywords_from_product(product_name, product_description)
+                # 상품명/설명에서 키워드 추출
+                keywords = self._extract_keywords_from_product(product_name, product_description)
             
-            # 3단계 검색 쿼리 생성
-            # 1단계: HS 코드 기반 검색 (가장 정확)
-            hs_queries = self._build_hs_code_based_queries(product_name, hs_code, target_agencies)
+                # 3단계 검색 쿼리 생성
+                # 1단계: HS 코드 기반 검색 (가장 정확)
+                hs_queries = self._build_hs_code_based_queries(product_name, hs_code, target_agencies)
             
-            # 2단계: AI 키워드 기반 검색 (정확도 높음)
-            keyword_queries = self._build_keyword_based_queries(product_name, keywords, target_agencies)
+                # 2단계: AI 키워드 기반 검색 (정확도 높음)
+                keyword_queries = self._build_keyword_based_queries(product_name, keywords, target_agencies)
             
-            # 3단계: 상품명 전체 검색 (포괄적)
-            fullname_queries = self._build_fullname_queries(product_name, hs_code, target_agencies)
+                # 3단계: 상품명 전체 검색 (포괄적)
+                fullname_queries = self._build_fullname_queries(product_name, hs_code, target_agencies)
             
-            # Phase 2-4 전용 검색 쿼리 생성
-            phase_queries = self._build_phase_specific_queries(product_name, hs_code, target_agencies)
+                # Phase 2-4 전용 검색 쿼리 생성
+                phase_queries = self._build_phase_specific_queries(product_name, hs_code, target_agencies)
             
-            # 복합 검색 쿼리 병합
-            web_queries = {**hs_queries, **keyword_queries, **fullname_queries, **phase_queries}
+                # 복합 검색 쿼리 병합
+                web_queries = {**hs_queries, **keyword_queries, **fullname_queries, **phase_queries}
             
-            print(f"  📊 3단계 검색 쿼리 구성:")
-            print(f"    1️⃣ HS 코드 기반: {len(hs_queries)}개")
-            print(f"    2️⃣ AI 키워드 기반: {len(keyword_queries)}개")
-            print(f"    3️⃣ 상품명 전체: {len(fullname_queries)}개")
-            print(f"    ➕ Phase 2-4: {len(phase_queries)}개")
+                # 쿼리 구성 요약은 한 레코드로 출력 (INFO 비활성 시 join/포맷 생략)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "\n".join((
+                            "  📊 3단계 검색 쿼리 구성:",
+                            "    1️⃣ HS 코드 기반: %s개",
+                            "    2️⃣ AI 키워드 기반: %s개",
+                            "    3️⃣ 상품명 전체: %s개",
+                            "    ➕ Phase 2-4: %s개",
+                            "  🎯 타겟 기관: %s",
+                            "  📊 검색 신뢰도: %.1f%%",
+                            "  🔑 추출된 키워드: %s",
+                            "  🔍 총 검색 쿼리: %s개 (HS코드 %s개 + 키워드 %s개 + Phase2-4 %s개)",
+                        )),
+                        len(hs_queries), len(keyword_queries), len(fullname_queries), len(phase_queries),
+                        ', '.join(target_agencies.get('primary_agencies', [])),
+                        target_agencies.get('confidence', 0) * 100,
+                        ', '.join(keywords[:5]),
+                        len(web_queries), len(hs_queries), len(keyword_queries), len(phase_queries)
+                    )
             
-            print(f"  🎯 타겟 기관: {', '.join(target_agencies.get('primary_agencies', []))}")
-            print(f"  📊 검색 신뢰도: {target_agencies.get('confidence', 0):.1%}")
-            print(f"  🔑 추출된 키워드: {', '.join(keywords[:5])}")
-            print(f"  🔍 총 검색 쿼리: {len(web_queries)}개 (HS코드 {len(hs_queries)}개 + 키워드 {len(keyword_queries)}개 + Phase2-4 {len(phase_queries)}개)")
+                # 빌더 간 중복 쿼리는 한 번만 검색하고 결과를 원래 키 전부에 다시 배분
+                unique_queries, query_aliases = _dedupe_queries(web_queries)
+                if query_aliases:
+                    logger.info("  ♻️ 중복 쿼리 %s개 제외", len(query_aliases))
             
-            web_results = {}
-            for query_key, query in web_queries.items():
-                try:
-                    if self.search_provider:
-                        search_results = await self.search_provider.search(query, max_results=5)
-                    else:
-                        print(f"    ⚠️ 검색 프로바이더 없음: {query_key} 스킵됨")
-                        search_results = []
-                    # 결과 분류 (HS 코드 기반 + 키워드 기반)
-                    category = "basic_requirements"
-                    search_type = "hs_code" if "hs_" in query_key else "keyword"
-                    
-                    # 쿼리 키워드 기반 카테고리 분류 (Phase 1-4)
-                    if any(keyword in query_key for keyword in ["cosmetic", "regulations", "standards", "limits", "restrictions", "safety"]):
-                        category = "detailed_regulations"
-                    elif any(keyword in query_key for keyword in ["testing", "inspection", "procedures", "authorization", "phase2"]):
-                        category = "testing_procedures"
-                    elif any(keyword in query_key for keyword in ["penalties", "enforcement", "violations", "recall", "phase3"]):
-                        category = "penalties_enforcement"
-                    elif any(keyword in query_key for keyword in ["validity", "renewal", "duration", "period", "phase4"]):
-                        category = "validity_periods"
-                    
-                    # 기관 추출
-                    agency = query_key.split("_")[0].upper()
-                    
-                    web_results[query_key] = {
-                        "query": query,
-                        "results": search_results,
-                        "urls": [r.get("url") for r in search_results if r.get("url")],
-                        "agency": agency,
-                        "category": category,
-                        "search_type": search_type,
-                        "result_count": len(search_results),
-                        "target_confidence": target_agencies.get("confidence", 0.5)
-                    }
-                except Exception as e:
-                    web_results[query_key] = {"error": str(e)}
+                # 쿼리별 노드로 fan-out → LangGraph가 같은 superstep에서 동시 실행
+                graph_state = await self._web_search_graph.ainvoke({
+                    "queries": unique_queries,
+                    "target_confidence": target_agencies.get("confidence", 0.5),
+                    "web_results": {}
+                })
+                web_results = graph_state["web_results"]
+                for key, first in query_aliases.items():
+                    entry = web_results.get(first)
+                    if entry is None or "error" in entry:
+                        web_results[key] = entry if entry is not None else {"error": "missing result"}
+                        continue
+                    # 기관/카테고리는 쿼리 키에서 분류하므로 원래 키 기준으로 다시 채움
+                    agency, category, search_type = _classify_query_key(key)
+                    web_results[key] = {**entry, "agency": agency, "category": category, "search_type": search_type}
             
-            results["web_results"] = web_results
-            results["search_methods"].append("tavily_search")
-            print(f"    ✅ 웹 검색 완료: {len(web_results)}개 쿼리")
+                results["web_results"] = web_results
+                results["search_methods"].append("tavily_search")
+                logger.info("    ✅ 웹 검색 완료: %s개 쿼리", len(web_results))
             
-        except Exception as e:
-            print(f"    ❌ 웹 검색 실패: {e}")
-            results["web_results"] = {"error": str(e)}
+            except Exception as e:
+                logger.error("    ❌ 웹 검색 실패: %s", e)
+                results["web_results"] = {"error": str(e)}
+        
+            # 3. 결과 통합
+            logger.info("\n  🔄 3단계: 결과 통합")
+            combined_results = await self._combine_search_results(
+                hs_code, results["api_results"], results["web_results"], precedents=precedents_task
+            )
+        finally:
+            # 통합 전에 예외/취소로 빠져나가면 판례 조회가 고아 태스크로 남지 않도록 정리
+            if not precedents_task.done():
+                precedents_task.cancel()
         
-        # 3. 결과 통합
-        print(f"\n  🔄 3단계: 결과 통합")
-        combined_results = self._combine_search_results(hs_code, results["api_results"], results["web_results"])
         combined_results["target_agencies"] = target_agencies  # 타겟 기관 정보 추가
         combined_results["extracted_keywords"] = keywords  # 추출된 키워드 정보 추가
         
@@ -971,29 +1682,51 @@ class RequirementsTools:
         
         results["combined_results"] = combined_results
         
-        print(f"\n✅ [HS 코드 + 키워드 복합 검색] 완료")
-        print(f"  🔍 검색 방법: {', '.join(results['search_methods'])}")
-        print(f"  🎯 타겟 기관: {', '.join(target_agencies.get('primary_agencies', []))}")
-        print(f"  📊 검색 신뢰도: {target_agencies.get('confidence', 0):.1%}")
-        print(f"  🔑 추출된 키워드: {', '.join(keywords[:5])}")
-        print(f"  📚 출처(Citations): {len(results['citations'])}개")
-        print(f"  📋 총 요구사항: {combined_results.get('total_requirements', 0)}개")
-        print(f"  🏆 인증요건: {combined_results.get('total_certifications', 0)}개")
-        print(f"  📄 필요서류: {combined_results.get('total_documents', 0)}개")
-        
-        # 카테고리별 결과 출력
-        category_stats = combined_results.get('category_stats', {})
-        print(f"  📊 카테고리별 검색 결과:")
-        print(f"    🔍 기본 요구사항: {category_stats.get('basic_requirements', 0)}개")
-        print(f"    📋 세부 규정: {category_stats.get('detailed_regulations', 0)}개")
-        print(f"    🧪 검사 절차: {category_stats.get('testing_procedures', 0)}개")
-        print(f"    ⚖️ 처벌 정보: {category_stats.get('penalties_enforcement', 0)}개")
-        print(f"    ⏰ 유효기간: {category_stats.get('validity_periods', 0)}개")
+        # 요구사항 추출이 끝났으므로 쿼리별 원본 본문은 버리고 요약 필드만 반환 (결과 dict/직렬화 크기 축소)
+        for entry in results["web_results"].values():
+            if isinstance(entry, dict) and entry.get("results"):
+                entry["results"] = [_project_web_result(r) for r in entry["results"]]
+        
+        # 완료 요약 + 카테고리별 결과를 한 레코드로 출력
+        if logger.isEnabledFor(logging.INFO):
+            category_stats = combined_results.get('category_stats', {})
+            logger.info(
+                "\n".join((
+                    "\n✅ [HS 코드 + 키워드 복합 검색] 완료",
+                    "  🔍 검색 방법: %s",
+                    "  🎯 타겟 기관: %s",
+                    "  📊 검색 신뢰도: %.1f%%",
+                    "  🔑 추출된 키워드: %s",
+                    "  📚 출처(Citations): %s개",
+                    "  📋 총 요구사항: %s개",
+                    "  🏆 인증요건: %s개",
+                    "  📄 필요서류: %s개",
+                    "  📊 카테고리별 검색 결과:",
+                    "    🔍 기본 요구사항: %s개",
+                    "    📋 세부 규정: %s개",
+                    "    🧪 검사 절차: %s개",
+                    "    ⚖️ 처벌 정보: %s개",
+                    "    ⏰ 유효기간: %s개",
+                )),
+                ', '.join(results['search_methods']),
+                ', '.join(target_agencies.get('primary_agencies', [])),
+                target_agencies.get('confidence', 0) * 100,
+                ', '.join(keywords[:5]),
+                len(results['citations']),
+                combined_results.get('total_requirements', 0),
+                combined_results.get('total_certifications', 0),
+                combined_results.get('total_documents', 0),
+                category_stats.get('basic_requirements', 0),
+                category_stats.get('detailed_regulations', 0),
+                category_stats.get('testing_procedures', 0),
+                category_stats.get('penalties_enforcement', 0),
+                category_stats.get('validity_periods', 0)
+            )
         
         return results
     
     def _extract_requirements_from_web_results(self, web_results: Dict[str, Any]) -> Dict[str, Any]:
-        """웹 검색 결과에서 요구사항 추출"""
+        """웹 검색 결과에서 요구사항 추출 (WebRequirement/WebSource 목록 + 출처 기관, dict 변환은 통합 단계에서)"""
         extracted_requirements = {
             "certifications": [],
             "documents": [],
@@ -1003,190 +1736,139 @@ class RequirementsTools:
             "penalties_enforcement": [],
             "validity_periods": []
         }
+        sources = extracted_requirements["sources"]
+        sources_append = sources.append  # 루프 내 속성 조회 생략
+        source_index: Dict[str, Tuple[int, float]] = {}  # URL → (sources 내 위치, 최고 신뢰도)
+        # 출처가 채택된 기관 (처음 발견 순서) - 통합 단계에서 sources를 다시 순회하지 않도록 함께 수집
+        agencies = extracted_requirements["agencies"] = {}
         
         for query_key, result in web_results.items():
-            if "error" in result:
+            # 웹 검색 단계 전체 실패 시 web_results는 {"error": "..."} (쿼리별 결과 아님)
+            if not isinstance(result, dict) or "error" in result or not result.get("has_urls", True):
                 continue
                 
             agency = result.get("agency", "Unknown")
             category = result.get("category", "basic_requirements")
             search_results = result.get("results", [])
+            extractor = _CATEGORY_EXTRACTORS.get(category)
+            if extractor:
+                target_key, name_label, desc_label, required = extractor
+                target_append = extracted_requirements[target_key].append
+                extractor_re = _CATEGORY_CONTENT_RE[category]
             
             for search_result in search_results:
-                url = search_result.get("url", "")
+                url = search_result.get("url") or ""
+                if not _HTTP_URL_RE.match(url):
+                    continue
                 title = search_result.get("title", "")
-                content = search_result.get("content", "")
+                content = search_result.get("content") or ""
                 score = search_result.get("score", 0)
                 
                 # 공식 사이트 vs 기타 사이트 구분
-                is_official = any(domain in url for domain in [".gov", ".fda.gov", ".usda.gov", ".epa.gov", ".fcc.gov", ".cbp.gov", ".cpsc.gov"])
+                is_official = is_official_url(url)
                 source_type = "공식 사이트" if is_official else "기타 사이트"
                 
                 # 신뢰도 계산 (공식 사이트는 높은 점수)
                 confidence = score * (1.2 if is_official else 0.8)
                 
-                # 카테고리별 요구사항 추출
-                if category == "basic_requirements":
-                    # 기본 요구사항: import, requirements, regulations 등이 포함된 경우
-                    if any(keyword in content.lower() for keyword in ["import", "requirements", "regulations", "compliance", "standards"]):
-                        extracted_requirements["certifications"].append({
-                            "name": f"{agency} 수입 요구사항 ({title[:50]}...)",
-                            "required": True,
-                            "description": f"{source_type}에서 확인된 {agency} 수입 요구사항",
-                            "agency": agency,
-                            "url": url,
-                            "confidence": confidence,
-                            "source_type": source_type
-                        })
-                
-                elif category == "detailed_regulations":
-                    if any(keyword in content.lower() for keyword in ["regulation", "standard", "limit", "restriction"]):
-                        extracted_requirements["detailed_regulations"].append({
-                            "name": f"{agency} 세부 규정 ({title[:50]}...)",
-                            "description": f"{source_type}에서 확인된 {agency} 세부 규정",
-                            "agency": agency,
-                            "url": url,
-                            "confidence": confidence,
-                            "source_type": source_type
-                        })
-                
-                elif category == "testing_procedures":
-                    if any(keyword in content.lower() for keyword in ["test", "inspection", "procedure", "authorization"]):
-                        extracted_requirements["testing_procedures"].append({
-                            "name": f"{agency} 검사 절차 ({title[:50]}...)",
-                            "description": f"{source_type}에서 확인된 {agency} 검사 절차",
-                            "agency": agency,
-                            "url": url,
-                            "confidence": confidence,
-                            "source_type": source_type
-                        })
-                
-                elif category == "penalties_enforcement":
-                    if any(keyword in content.lower() for keyword in ["penalty", "enforcement", "violation", "fine"]):
-                        extracted_requirements["penalties_enforcement"].append({
-                            "name": f"{agency} 처벌 정보 ({title[:50]}...)",
-                            "description": f"{source_type}에서 확인된 {agency} 처벌 정보",
-                            "agency": agency,
-                            "url": url,
-                            "confidence": confidence,
-                            "source_type": source_type
-                        })
-                
-                elif category == "validity_periods":
-                    if any(keyword in content.lower() for keyword in ["validity", "renewal", "duration", "period"]):
-                        extracted_requirements["validity_periods"].append({
-                            "name": f"{agency} 유효기간 ({title[:50]}...)",
-                            "description": f"{source_type}에서 확인된 {agency} 유효기간 정보",
-                            "agency": agency,
-                            "url": url,
-                            "confidence": confidence,
-                            "source_type": source_type
-                        })
+                # 카테고리별 요구사항 추출 (디스패치 테이블 - 본문 키워드 일치 시 1건 추가)
+                if extractor and extractor_re.search(content):
+                    target_append(WebRequirement(
+                        f"{agency} {name_label} ({title[:50]}...)",
+                        required,
+                        f"{source_type}에서 확인된 {agency} {desc_label}",
+                        agency,
+                        url,
+                        confidence,
+                        source_type
+                    ))
                 
-                # 출처 정보 추가
-                extracted_requirements["sources"].append({
-                    "title": title,
-                    "url": url,
-                    "type": source_type,
-                    "relevance": "high" if confidence > 0.7 else "medium" if confidence > 0.5 else "low",
-                    "agency": agency,
-                    "category": category
-                })
+                # 출처 정보 추가 (URL당 1건 - 중복 URL은 신뢰도가 더 높을 때만 같은 자리에서 교체)
+                seen = source_index.get(url)
+                if seen is not None and confidence <= seen[1]:
+                    continue
+                source = WebSource(
+                    title,
+                    url,
+                    source_type,
+                    "high" if confidence > 0.7 else "medium" if confidence > 0.5 else "low",
+                    agency,
+                    category
+                )
+                if seen is None:
+                    source_index[url] = (len(sources), confidence)
+                    sources_append(source)
+                else:
+                    sources[seen[0]] = source
+                    source_index[url] = (seen[0], confidence)
+                agencies[agency] = None
         
         return extracted_requirements
 
-    def _combine_search_results(self, hs_code: str, api_results: Dict[str, Any], web_results: Dict[str, Any]) -> Dict[str, Any]:
-        """API와 웹 검색 결과 통합 + 판례 기반 검증 주입"""
+    async def _combine_search_results(
+        self,
+        hs_code: str,
+        api_results: Dict[str, Any],
+        web_results: Dict[str, Any],
+        precedents: Optional[Awaitable[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """API와 웹 검색 결과 통합 + 판례 기반 검증 주입 (precedents: 미리 시작한 판례 조회, 없으면 여기서 조회)"""
         # 웹 검색 결과에서 요구사항 추출
         web_requirements = self._extract_requirements_from_web_results(web_results)
         
+        # API 결과 중 성공한 기관만 한 번 필터링
+        api_success = "agencies" in api_results and "error" not in api_results
+        successful_agencies = {
+            agency: data for agency, data in api_results.get("agencies", {}).items()
+            if data.get("status") == "success"
+        } if api_success else {}
+        
+        # API 결과 + 웹 검색 결과 통합 (기관 데이터를 한 번만 순회, None 값은 빈 튜플 처리)
+        certifications: List[Dict[str, Any]] = []
+        documents: List[Dict[str, Any]] = []
+        sources: List[Dict[str, Any]] = []
+        certs_extend, docs_extend, sources_extend = certifications.extend, documents.extend, sources.extend
+        for data in successful_agencies.values():
+            certs_extend(data.get("certifications") or ())
+            docs_extend(data.get("documents") or ())
+            sources_extend(data.get("sources") or ())
+        certs_extend(r.as_dict() for r in web_requirements["certifications"])
+        docs_extend(r.as_dict() for r in web_requirements["documents"])
+        sources_extend(source.as_dict() for source in web_requirements["sources"])
+        
+        # API + 웹 검색에서 찾은 기관들 (dict 키로 O(1) 중복 제거, 처음 발견된 순서 유지)
+        found = dict.fromkeys(successful_agencies)
+        found.update(web_requirements["agencies"])
+        found.pop("Unknown", None)
+        
+        total_certifications = len(certifications)
+        total_documents = len(documents)
+        
         combined = {
-            "certifications": [],
-            "documents": [],
-            "sources": [],
-            "detailed_regulations": [],
-            "testing_procedures": [],
-            "penalties_enforcement": [],
-            "validity_periods": [],
-            "total_requirements": 0,
-            "total_certifications": 0,
-            "total_documents": 0,
-            "agencies_found": [],
+            "certifications": certifications,
+            "documents": documents,
+            "sources": sources,
+            "detailed_regulations": [r.as_dict() for r in web_requirements["detailed_regulations"]],
+            "testing_procedures": [r.as_dict() for r in web_requirements["testing_procedures"]],
+            "penalties_enforcement": [r.as_dict() for r in web_requirements["penalties_enforcement"]],
+            "validity_periods": [r.as_dict() for r in web_requirements["validity_periods"]],
+            "total_requirements": total_certifications + total_documents,
+            "total_certifications": total_certifications,
+            "total_documents": total_documents,
+            "agencies_found": list(found),
+            # 카테고리별 통계
             "category_stats": {
-                "basic_requirements": 0,
-                "detailed_regulations": 0,
-                "testing_procedures": 0,
-                "penalties_enforcement": 0,
-                "validity_periods": 0
+                category: len(web_requirements[key]) for category, key in _CATEGORY_STAT_KEYS
             },
             "search_sources": {
-                "api_success": "agencies" in api_results and "error" not in api_results,
+                "api_success": api_success,
                 "web_success": len(web_results) > 0 and "error" not in web_results
             }
         }
         
-        # API 결과 통합
-        if "agencies" in api_results and "error" not in api_results:
-            agencies = api_results.get("agencies", {})
-            for agency, data in agencies.items():
-                if data.get("status") == "success":
-                    combined["certifications"].extend(data.get("certifications", []))
-                    combined["documents"].extend(data.get("documents", []))
-                    combined["sources"].extend(data.get("sources", []))
-                    combined["agencies_found"].append(agency)
-        
-        # 웹 검색 결과 통합 (새로운 추출 로직 사용)
-        combined["certifications"].extend(web_requirements["certifications"])
-        combined["documents"].extend(web_requirements["documents"])
-        combined["sources"].extend(web_requirements["sources"])
-        combined["detailed_regulations"].extend(web_requirements["detailed_regulations"])
-        combined["testing_procedures"].extend(web_requirements["testing_procedures"])
-        combined["penalties_enforcement"].extend(web_requirements["penalties_enforcement"])
-        combined["validity_periods"].extend(web_requirements["validity_periods"])
-        
-        # 웹 검색에서 찾은 기관들 추가
-        web_agencies = set()
-        for source in web_requirements["sources"]:
-            agency = source.get("agency", "Unknown")
-            if agency != "Unknown":
-                web_agencies.add(agency)
-        
-        for agency in web_agencies:
-            if agency not in combined["agencies_found"]:
-                combined["agencies_found"].append(agency)
-        
-        # 카테고리별 통계 계산
-        combined["category_stats"]["basic_requirements"] = len(web_requirements["certifications"])
-        combined["category_stats"]["detailed_regulations"] = len(web_requirements["detailed_regulations"])
-        combined["category_stats"]["testing_procedures"] = len(web_requirements["testing_procedures"])
-        combined["category_stats"]["penalties_enforcement"] = len(web_requirements["penalties_enforcement"])
-        combined["category_stats"]["validity_periods"] = len(web_requirements["validity_periods"])
-        
-        # 통계 계산
-        combined["total_certifications"] = len(combined["certifications"])
-        combined["total_documents"] = len(combined["documents"])
-        combined["total_requirements"] = combined["total_certifications"] + combined["total_documents"]
-        
-        # 판례 기반 검증 단계 (CBP)
+        # 판례 기반 검증 단계 (CBP) - 호출자의 이벤트 루프에서 바로 await
         try:
-            precedents_payload = None
-            if hasattr(self, 'get_cbp_precedents'):
-                precedents_payload = awaitable_result = None
-            # 동기/비동기 호환 처리
-            try:
-                import asyncio
-                if asyncio.get_event_loop().is_running():
-                    # tools는 일반 메서드이므로 내부에서 비동기 호출을 안전하게 처리할 수 없을 수 있음
-                    # precedents는 내부적으로 비동기일 수 있으므로 별도 헬퍼 사용
-                    precedents_payload = asyncio.get_event_loop().run_until_complete(
-                        self.get_cbp_precedents(hs_code)  # type: ignore
-                    )
-                else:
-                    precedents_payload = asyncio.run(self.get_cbp_precedents(hs_code))  # type: ignore
-            except RuntimeError:
-                # 이미 상위가 이벤트 루프를 관리 중인 경우, None으로 설정
-                print(f"⚠️ 이벤트 루프 충돌 - 판례 조회 스킵")
-                precedents_payload = None
+            precedents_payload = await (precedents if precedents is not None else self.get_cbp_precedents(hs_code))
 
             if isinstance(precedents_payload, dict):
                 combined["precedents"] = {
@@ -1197,22 +1879,30 @@ class RequirementsTools:
                 precedents_list = precedents_payload.get("precedents", [])
 
                 # 간단 검증 로직: 동일 기관 언급 또는 공식 도메인 포함 시 verified 표시
+                # 판례 본문은 한 번만 소문자로 합쳐 두고, 기관별 판정은 재사용
+                # 판례 사이를 NUL로 구분해 하나의 문자열로 만들면 기관당 부분 문자열 검색 1회로 끝남
+                precedent_text = "\x00".join(
+                    " ".join((
+                        str(case.get("title", "")),
+                        str(case.get("summary", "")),
+                        str(case.get("agency", "")),
+                        str(case.get("url", ""))
+                    ))
+                    for case in precedents_list
+                ).lower()
+                verified_by_agency: Dict[str, bool] = {}
+
                 def mark_verified(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
                     marked: List[Dict[str, Any]] = []
                     for it in items:
-                        agency = (it.get("agency") or it.get("source") or "").upper()
-                        verified = False
-                        for case in precedents_list:
-                            text_blob = " ".join([
-                                str(case.get("title", "")),
-                                str(case.get("summary", "")),
-                                str(case.get("agency", "")),
-                                str(case.get("url", ""))
-                            ]).lower()
-                            if agency and agency.lower() in text_blob:
-                                verified = True
-                                break
-                        it["verified_by_precedent"] = bool(verified)
+                        agency = (it.get("agency") or it.get("source") or "").lower()
+                        verified = verified_by_agency.get(agency)
+                        if verified is None:
+                            # 구분자가 없는 기관명은 판례 경계를 넘어 매칭될 수 없음
+                            verified = verified_by_agency[agency] = (
+                                bool(agency) and "\x00" not in agency and agency in precedent_text
+                            )
+                        it["verified_by_precedent"] = verified
                         marked.append(it)
                     return marked
 
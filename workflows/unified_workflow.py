@@ -26,18 +26,21 @@
 """
 
 from langgraph.graph import StateGraph
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, NamedTuple, Optional
 from dataclasses import dataclass
 from datetime import datetime
 import asyncio
+import logging
 from .nodes import RequirementsNodes
 from .tools import RequirementsTools
 from app.services.requirements.error_handler import error_handler, WorkflowError, ErrorSeverity
 from app.services.requirements.env_manager import env_manager
-from app.services.requirements.parallel_processor import parallel_processor, ProcessingTask, ProcessingMode
+from app.services.requirements.parallel_processor import parallel_processor
 from app.services.requirements.enhanced_cache_service import enhanced_cache
 from app.services.requirements.confidence_calculator import get_confidence_calculator
 
+logger = logging.getLogger(__name__)
+
 @dataclass
 class UnifiedWorkflowState:
     """통합 워크플로우 상태"""
@@ -64,18 +67,40 @@ class UnifiedWorkflowState:
     # 최종 결과
     final_result: Dict[str, Any] = None
 
+class _NodeRequest(NamedTuple):
+    """RequirementsNodes에 전달하는 요청 (노드는 hs_code/product_name/product_description 속성만 사용)"""
+    hs_code: str
+    product_name: str
+    product_description: str = ""
+
+    @classmethod
+    def from_state(cls, state: "UnifiedWorkflowState") -> "_NodeRequest":
+        return cls(state.hs_code, state.product_name, state.product_description)
+
 class UnifiedRequirementsWorkflow:
     """통합 요구사항 분석 워크플로우"""
     
+    # 노드별 선행 노드 (병렬 실행 시 선행 노드가 모두 끝나면 바로 시작)
+    # hybrid_api_call은 키워드만 사용하므로 문서 검색/스크래핑과 동시에 진행
+    _NODE_DEPENDENCIES = {
+        "extract_keywords": (),
+        "search_documents": ("extract_keywords",),
+        "hybrid_api_call": ("extract_keywords",),
+        "scrape_documents": ("search_documents",),
+        "consolidate_results": ("search_documents", "hybrid_api_call", "scrape_documents"),
+        "finalize_results": ("consolidate_results",),
+    }
+    
     def __init__(self):
-        self.nodes = RequirementsNodes()
+        # 도구는 1개만 생성해 노드에 주입 (HTTP 커넥션 풀/검색 캐시/서킷 브레이커 공유)
         self.tools = RequirementsTools()
+        self.nodes = RequirementsNodes(tools=self.tools)
         self.workflow = self._create_workflow()
         
         # API 상태 확인
         api_status = env_manager.get_api_status_summary()
-        print(f"🚀 통합 워크플로우 초기화 완료")
-        print(f"📊 API 상태: {api_status['available_api_keys']}/{api_status['total_api_keys']}개 키 사용 가능")
+        logger.info("🚀 통합 워크플로우 초기화 완료")
+        logger.info("📊 API 상태: %s/%s개 키 사용 가능", api_status['available_api_keys'], api_status['total_api_keys'])
     
     def _create_workflow(self) -> StateGraph:
         """워크플로우 생성"""
@@ -102,29 +127,33 @@ class UnifiedRequirementsWorkflow:
         
         return workflow.compile()
     
+    @staticmethod
+    def _merge_metadata(state: UnifiedWorkflowState, base: Dict[str, Any], result_state: Dict[str, Any]) -> None:
+        """노드가 추가/변경한 메타데이터 키만 현재 state에 병합 (동시 실행 노드의 결과를 덮어쓰지 않음)"""
+        updated = result_state.get("detailed_metadata") or {}
+        delta = {key: value for key, value in updated.items() if base.get(key) is not value}
+        state.detailed_metadata = {**(state.detailed_metadata or {}), **delta}
+    
     async def _extract_keywords_node(self, state: UnifiedWorkflowState) -> UnifiedWorkflowState:
         """키워드 추출 노드"""
         try:
-            print(f"\n🔎 [UNIFIED] 키워드 추출 시작")
+            logger.info("\n🔎 [UNIFIED] 키워드 추출 시작")
             
-            # RequirementsNodes의 extract_core_keywords 메서드 호출
-            temp_state = {"request": type('Request', (), {
-                'hs_code': state.hs_code,
-                'product_name': state.product_name,
-                'product_description': state.product_description
-            })()}
+            # RequirementsNodes의 extract_core_keywords 메서드 호출 (메타데이터는 사본 전달)
+            base_metadata = state.detailed_metadata or {}
+            temp_state = {"request": _NodeRequest.from_state(state), "detailed_metadata": dict(base_metadata)}
             
             result_state = await self.nodes.extract_core_keywords(temp_state)
             
             # 결과를 UnifiedWorkflowState에 복사
             state.core_keywords = result_state.get("core_keywords", [])
             state.keyword_strategies = result_state.get("keyword_strategies", [])
-            state.detailed_metadata = result_state.get("detailed_metadata", {})
+            self._merge_metadata(state, base_metadata, result_state)
             
-            print(f"✅ 키워드 추출 완료: {state.core_keywords}")
+            logger.info("✅ 키워드 추출 완료: %s", state.core_keywords)
             
         except Exception as e:
-            print(f"❌ 키워드 추출 실패: {e}")
+            logger.error("❌ 키워드 추출 실패: %s", e)
             error_handler.handle_error(
                 WorkflowError(
                     f"키워드 추출 실패: {str(e)}",
@@ -141,30 +170,27 @@ class UnifiedRequirementsWorkflow:
     async def _search_documents_node(self, state: UnifiedWorkflowState) -> UnifiedWorkflowState:
         """문서 검색 노드"""
         try:
-            print(f"\n🔍 [UNIFIED] 문서 검색 시작")
+            logger.info("\n🔍 [UNIFIED] 문서 검색 시작")
             
-            # RequirementsNodes의 search_agency_documents 메서드 호출
+            # RequirementsNodes의 search_agency_documents 메서드 호출 (메타데이터는 사본 전달)
+            base_metadata = state.detailed_metadata or {}
             temp_state = {
-                "request": type('Request', (), {
-                    'hs_code': state.hs_code,
-                    'product_name': state.product_name,
-                    'product_description': state.product_description
-                })(),
+                "request": _NodeRequest.from_state(state),
                 "core_keywords": state.core_keywords,
                 "keyword_strategies": state.keyword_strategies,
-                "detailed_metadata": state.detailed_metadata or {}
+                "detailed_metadata": dict(base_metadata)
             }
             
             result_state = await self.nodes.search_agency_documents(temp_state)
             
             # 결과 복사
             state.search_results = result_state.get("search_results", {})
-            state.detailed_metadata = result_state.get("detailed_metadata", {})
+            self._merge_metadata(state, base_metadata, result_state)
             
-            print(f"✅ 문서 검색 완료: {len(state.search_results)}개 기관 결과")
+            logger.info("✅ 문서 검색 완료: %s개 기관 결과", len(state.search_results))
             
         except Exception as e:
-            print(f"❌ 문서 검색 실패: {e}")
+            logger.error("❌ 문서 검색 실패: %s", e)
             error_handler.handle_error(
                 WorkflowError(
                     f"문서 검색 실패: {str(e)}",
@@ -180,31 +206,28 @@ class UnifiedRequirementsWorkflow:
     async def _hybrid_api_call_node(self, state: UnifiedWorkflowState) -> UnifiedWorkflowState:
         """하이브리드 API 호출 노드"""
         try:
-            print(f"\n📡 [UNIFIED] 하이브리드 API 호출 시작")
+            logger.info("\n📡 [UNIFIED] 하이브리드 API 호출 시작")
             
-            # RequirementsNodes의 call_hybrid_api 메서드 호출
+            # RequirementsNodes의 call_hybrid_api 메서드 호출 (메타데이터는 사본 전달)
+            base_metadata = state.detailed_metadata or {}
             temp_state = {
-                "request": type('Request', (), {
-                    'hs_code': state.hs_code,
-                    'product_name': state.product_name,
-                    'product_description': state.product_description
-                })(),
+                "request": _NodeRequest.from_state(state),
                 "core_keywords": state.core_keywords,
                 "keyword_strategies": state.keyword_strategies,
                 "search_results": state.search_results,
-                "detailed_metadata": state.detailed_metadata or {}
+                "detailed_metadata": dict(base_metadata)
             }
             
             result_state = await self.nodes.call_hybrid_api(temp_state)
             
             # 결과 복사
             state.hybrid_result = result_state.get("hybrid_result", {})
-            state.detailed_metadata = result_state.get("detailed_metadata", {})
+            self._merge_metadata(state, base_metadata, result_state)
             
-            print(f"✅ 하이브리드 API 호출 완료")
+            logger.info("✅ 하이브리드 API 호출 완료")
             
         except Exception as e:
-            print(f"❌ 하이브리드 API 호출 실패: {e}")
+            logger.error("❌ 하이브리드 API 호출 실패: %s", e)
             error_handler.handle_error(
                 WorkflowError(
                     f"하이브리드 API 호출 실패: {str(e)}",
@@ -220,29 +243,26 @@ class UnifiedRequirementsWorkflow:
     async def _scrape_documents_node(self, state: UnifiedWorkflowState) -> UnifiedWorkflowState:
         """문서 스크래핑 노드"""
         try:
-            print(f"\n🔍 [UNIFIED] 문서 스크래핑 시작")
+            logger.info("\n🔍 [UNIFIED] 문서 스크래핑 시작")
             
-            # RequirementsNodes의 scrape_documents 메서드 호출
+            # RequirementsNodes의 scrape_documents 메서드 호출 (메타데이터는 사본 전달)
+            base_metadata = state.detailed_metadata or {}
             temp_state = {
-                "request": type('Request', (), {
-                    'hs_code': state.hs_code,
-                    'product_name': state.product_name,
-                    'product_description': state.product_description
-                })(),
+                "request": _NodeRequest.from_state(state),
                 "search_results": state.search_results,
-                "detailed_metadata": state.detailed_metadata or {}
+                "detailed_metadata": dict(base_metadata)
             }
             
             result_state = await self.nodes.scrape_documents(temp_state)
             
             # 결과 복사
             state.scraped_data = result_state.get("scraped_data", {})
-            state.detailed_metadata = result_state.get("detailed_metadata", {})
+            self._merge_metadata(state, base_metadata, result_state)
             
-            print(f"✅ 문서 스크래핑 완료: {len(state.scraped_data)}개 기관 처리")
+            logger.info("✅ 문서 스크래핑 완료: %s개 기관 처리", len(state.scraped_data))
             
         except Exception as e:
-            print(f"❌ 문서 스크래핑 실패: {e}")
+            logger.error("❌ 문서 스크래핑 실패: %s", e)
             error_handler.handle_error(
                 WorkflowError(
                     f"문서 스크래핑 실패: {str(e)}",
@@ -258,31 +278,28 @@ class UnifiedRequirementsWorkflow:
     async def _consolidate_results_node(self, state: UnifiedWorkflowState) -> UnifiedWorkflowState:
         """결과 통합 노드"""
         try:
-            print(f"\n🔍 [UNIFIED] 결과 통합 시작")
+            logger.info("\n🔍 [UNIFIED] 결과 통합 시작")
             
-            # RequirementsNodes의 consolidate_results 메서드 호출
+            # RequirementsNodes의 consolidate_results 메서드 호출 (메타데이터는 사본 전달)
+            base_metadata = state.detailed_metadata or {}
             temp_state = {
-                "request": type('Request', (), {
-                    'hs_code': state.hs_code,
-                    'product_name': state.product_name,
-                    'product_description': state.product_description
-                })(),
+                "request": _NodeRequest.from_state(state),
                 "search_results": state.search_results,
                 "hybrid_result": state.hybrid_result,
                 "scraped_data": state.scraped_data,
-                "detailed_metadata": state.detailed_metadata or {}
+                "detailed_metadata": dict(base_metadata)
             }
             
             result_state = await self.nodes.consolidate_results(temp_state)
             
             # 결과 복사
             state.consolidated_results = result_state.get("consolidated_results", {})
-            state.detailed_metadata = result_state.get("detailed_metadata", {})
+            self._merge_metadata(state, base_metadata, result_state)
             
-            print(f"✅ 결과 통합 완료")
+            logger.info("✅ 결과 통합 완료")
             
         except Exception as e:
-            print(f"❌ 결과 통합 실패: {e}")
+            logger.error("❌ 결과 통합 실패: %s", e)
             error_handler.handle_error(
                 WorkflowError(
                     f"결과 통합 실패: {str(e)}",
@@ -303,7 +320,7 @@ class UnifiedRequirementsWorkflow:
     async def _finalize_results_node(self, state: UnifiedWorkflowState) -> UnifiedWorkflowState:
         """최종 결과 정리 노드"""
         try:
-            print(f"\n🎯 [UNIFIED] 최종 결과 정리 시작")
+            logger.info("\n🎯 [UNIFIED] 최종 결과 정리 시작")
             
             # 최종 결과 구성
             state.final_result = {
@@ -348,10 +365,10 @@ class UnifiedRequirementsWorkflow:
             }
             
             state.status = "completed"
-            print(f"✅ 최종 결과 정리 완료")
+            logger.info("✅ 최종 결과 정리 완료")
             
         except Exception as e:
-            print(f"❌ 최종 결과 정리 실패: {e}")
+            logger.error("❌ 최종 결과 정리 실패: %s", e)
             error_handler.handle_error(
                 WorkflowError(
                     f"최종 결과 정리 실패: {str(e)}",
@@ -405,12 +422,12 @@ class UnifiedRequirementsWorkflow:
                 hs_code_mapping_confidence=hs_mapping_confidence
             )
             
-            print(f"  📊 신뢰도 분석: {confidence_result['score']:.2f} ({confidence_result['level']})")
+            logger.info("  📊 신뢰도 분석: %.2f (%s)", confidence_result['score'], confidence_result['level'])
             
             return confidence_result
             
         except Exception as e:
-            print(f"⚠️ 신뢰도 계산 실패: {e}")
+            logger.warning("⚠️ 신뢰도 계산 실패: %s", e)
             return {
                 "score": 0.5,
                 "level": "중",
@@ -431,7 +448,7 @@ class UnifiedRequirementsWorkflow:
     ) -> Dict[str, Any]:
         """요구사항 분석 실행 (통합 워크플로우 + 병렬 처리)"""
         
-        print(f"🚀 통합 워크플로우 시작 - HS코드: {hs_code}, 상품: {product_name}")
+        logger.info("🚀 통합 워크플로우 시작 - HS코드: %s, 상품: %s", hs_code, product_name)
         start_time = datetime.now()
         
         try:
@@ -442,7 +459,7 @@ class UnifiedRequirementsWorkflow:
                 )
                 cached_result = await enhanced_cache.get(cache_key)
                 if cached_result:
-                    print(f"✅ 캐시에서 결과 반환")
+                    logger.info("✅ 캐시에서 결과 반환")
                     return cached_result
             
             # 초기 상태 설정
@@ -478,7 +495,7 @@ class UnifiedRequirementsWorkflow:
                     metadata={'disk_save': True}
                 )
             
-            print(f"✅ 통합 워크플로우 완료 - 소요시간: {processing_time}ms")
+            logger.info("✅ 통합 워크플로우 완료 - 소요시간: %sms", processing_time)
             
             return result_state.final_result or {
                 "error": "워크플로우 실행 실패",
@@ -487,7 +504,7 @@ class UnifiedRequirementsWorkflow:
             }
             
         except Exception as e:
-            print(f"❌ 통합 워크플로우 실패: {e}")
+            logger.error("❌ 통합 워크플로우 실패: %s", e)
             error_handler.handle_error(
                 WorkflowError(
                     f"통합 워크플로우 실패: {str(e)}",
@@ -510,60 +527,48 @@ class UnifiedRequirementsWorkflow:
         return api_status['available_api_keys'] > 0
     
     async def _execute_parallel_workflow(self, state: UnifiedWorkflowState) -> UnifiedWorkflowState:
-        """병렬 워크플로우 실행"""
-        print(f"🔄 병렬 워크플로우 실행 시작")
+        """병렬 워크플로우 실행 (의존 관계 기반 - 독립 노드만 동시 실행)"""
+        logger.info("🔄 병렬 워크플로우 실행 시작")
+        
+        node_funcs = {
+            "extract_keywords": self._extract_keywords_node,
+            "search_documents": self._search_documents_node,
+            "hybrid_api_call": self._hybrid_api_call_node,
+            "scrape_documents": self._scrape_documents_node,
+            "consolidate_results": self._consolidate_results_node,
+            "finalize_results": self._finalize_results_node,
+        }
+        node_tasks: Dict[str, asyncio.Task] = {}
+        
+        async def _run_node(name: str) -> None:
+            # 선행 노드 완료 대기 후 실행 (각 노드는 서로 다른 state 필드에 결과 기록, 메타데이터는 변경분만 병합)
+            await asyncio.gather(*(node_tasks[dep] for dep in self._NODE_DEPENDENCIES[name]))
+            await node_funcs[name](state)
         
         try:
-            # 병렬 처리 가능한 작업들 정의
-            tasks = [
-                ProcessingTask(
-                    id="extract_keywords",
-                    func=self._extract_keywords_node,
-                    args=(state,),
-                    priority=1
-                ),
-                ProcessingTask(
-                    id="search_documents",
-                    func=self._search_documents_node,
-                    args=(state,),
-                    priority=2
-                ),
-                ProcessingTask(
-                    id="hybrid_api_call",
-                    func=self._hybrid_api_call_node,
-                    args=(state,),
-                    priority=3
-                )
-            ]
+            # 의존 관계 순서(선행 노드가 먼저 등록됨)대로 태스크 생성
+            for name in self._NODE_DEPENDENCIES:
+                node_tasks[name] = asyncio.create_task(_run_node(name))
             
-            # 병렬 실행
-            results = await parallel_processor.process_parallel(
-                tasks, 
-                mode=ProcessingMode.PARALLEL,
+            await asyncio.wait_for(
+                asyncio.gather(*node_tasks.values()),
                 timeout=600.0  # 백엔드 API 타임아웃 10분
             )
             
-            # 결과 통합
-            for result in results:
-                if result.success:
-                    # 상태 업데이트는 각 노드에서 수행됨
-                    pass
-                else:
-                    print(f"⚠️ 병렬 작업 실패: {result.task_id}, 에러: {result.error}")
-            
-            # 순차 처리해야 하는 나머지 노드들 실행
-            state = await self._scrape_documents_node(state)
-            state = await self._consolidate_results_node(state)
-            state = await self._finalize_results_node(state)
-            
-            print(f"✅ 병렬 워크플로우 실행 완료")
+            logger.info("✅ 병렬 워크플로우 실행 완료")
             return state
             
         except Exception as e:
-            print(f"❌ 병렬 워크플로우 실행 실패: {e}")
+            logger.error("❌ 병렬 워크플로우 실행 실패: %s", e)
+            for task in node_tasks.values():
+                task.cancel()
             # 폴백으로 순차 실행
             return await self.workflow.ainvoke(state)
     
+    async def aclose(self) -> None:
+        """공유 도구가 보유한 HTTP 커넥션 풀 정리"""
+        await self.tools.aclose()
+    
     def get_workflow_status(self) -> Dict[str, Any]:
         """워크플로우 상태 반환"""
         return {